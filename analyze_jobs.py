@@ -0,0 +1,37 @@
+"""Unified Resume Platform - Bulk job description analysis"""
+
+import argparse
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from unified_resume_platform.backend.integrations.catalog_integration import CatalogIntegration
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Pre-analyze job descriptions into the job_requirements table'
+    )
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of analyzer processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='Rows fetched and written per batch')
+    parser.add_argument('--status', choices=['active', 'closed', 'draft'], default=None,
+                        help='Only analyze job descriptions with this status')
+    parser.add_argument('--all', action='store_true',
+                        help='Re-analyze every job, not only new or edited ones')
+    args = parser.parse_args()
+
+    catalog = CatalogIntegration(workers=args.workers, batch_size=args.batch_size)
+    result = catalog.analyze_catalog(status=args.status, reanalyze_all=args.all)
+
+    print(result['message'])
+    for error in result['errors']:
+        print(f"✗ {error}")
+    return 0 if result['success'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
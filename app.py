@@ -1,16 +1,25 @@
 
 """Unified Resume Platform - Main Flask Application"""
 
+import functools
+import hashlib
 import os
 import sys
-from flask import Flask, render_template, request, jsonify
+import uuid
+from flask import Blueprint, Flask, current_app, render_template, request, jsonify, session
+from werkzeug.local import LocalProxy
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 try:
     from unified_resume_platform.backend.integrations.hr_integration import HRIntegration
-    from unified_resume_platform.backend.integrations.jobseeker_integration import JobSeekerIntegration
+    from unified_resume_platform.backend.integrations.jobseeker_integration import (
+        JobSeekerIntegration, JOB_DATABASE_UNAVAILABLE, PROFILE_NOT_OWNED
+    )
+    from unified_resume_platform.backend.models.admission import AdmissionController, DEFAULT_LIMITS, raise_limits
+    from unified_resume_platform.backend.models.response_compression import ResponseCompressor
+    from unified_resume_platform.backend.models.static_assets import StaticAssets
 except ImportError as e:
     print(f"Error importing backend modules: {e}")
     print(f"Current directory: {current_dir}")
@@ -20,45 +29,251 @@ except ImportError as e:
 template_folder = os.path.join(current_dir, 'unified_resume_platform', 'frontend', 'templates')
 static_folder = os.path.join(current_dir, 'unified_resume_platform', 'frontend', 'static')
 
-app = Flask(__name__, template_folder=template_folder, static_folder=static_folder)
-app.config['SECRET_KEY'] = 'unified-resume-platform-2024'
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+bp = Blueprint('platform', __name__)
 
-hr_integration = HRIntegration()
-jobseeker_integration = JobSeekerIntegration()
+# The integrations of the app serving the current request, created by create_app
+hr_integration = LocalProxy(lambda: current_app.extensions['hr_integration'])
+jobseeker_integration = LocalProxy(lambda: current_app.extensions['jobseeker_integration'])
 
-@app.route('/')
+# Endpoints whose CPU-bound stages run in the CPU pool when ASYNC_OFFLOAD is on
+OFFLOADED_ENDPOINTS = ('hr_match', 'generate', 'export')
+
+
+def create_app(warm_up=True, config=None):
+    """Build the application and its integrations
+
+    With warm_up, models and the data they load lazily (NLTK corpora,
+    compiled patterns, document templates) are loaded now instead of on
+    the first requests. A preforking server calls this once in its parent,
+    so every worker shares that memory copy-on-write (see wsgi.py).
+    config overrides the defaults below, e.g. ADMISSION_LIMITS.
+
+    Batch generation and exports run in the job seeker integration's
+    process pool of CPU_POOL_WORKERS (default: this process's share of the
+    cores, see cpu_pool.default_workers). With ASYNC_OFFLOAD, matching,
+    generation and export requests await their CPU-bound stages in that
+    same pool instead of running them under the GIL, and unless
+    ADMISSION_LIMITS is given those endpoints admit as many requests at
+    once as the pool has processes.
+
+    Text responses of COMPRESS_MIN_SIZE bytes or more are compressed, and
+    static URLs carry a fingerprint of the file's contents so they can be
+    cached for STATIC_MAX_AGE seconds without revalidation.
+    """
+    app = Flask(__name__, template_folder=template_folder, static_folder=static_folder)
+    app.config['SECRET_KEY'] = 'unified-resume-platform-2024'
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+    app.config['ADMISSION_LIMITS'] = DEFAULT_LIMITS
+    app.config['ASYNC_OFFLOAD'] = False
+    app.config['CPU_POOL_WORKERS'] = None
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['STATIC_MAX_AGE'] = 365 * 24 * 3600
+    app.config.update(config or {})
+
+    app.extensions['hr_integration'] = HRIntegration()
+    app.extensions['jobseeker_integration'] = JobSeekerIntegration(app.config['CPU_POOL_WORKERS'])
+    if app.config['ASYNC_OFFLOAD']:
+        cpu_pool = app.extensions['jobseeker_integration'].cpu_pool
+        app.extensions['cpu_pool'] = cpu_pool
+        if 'ADMISSION_LIMITS' not in (config or {}):
+            app.config['ADMISSION_LIMITS'] = raise_limits(
+                app.config['ADMISSION_LIMITS'], OFFLOADED_ENDPOINTS, cpu_pool.workers
+            )
+    app.extensions['admission'] = AdmissionController(app.config['ADMISSION_LIMITS'])
+    app.extensions['static_assets'] = StaticAssets(app.static_folder)
+    app.extensions['compressor'] = ResponseCompressor(app.config['COMPRESS_MIN_SIZE'])
+    if warm_up:
+        app.extensions['hr_integration'].warm_up()
+        app.extensions['jobseeker_integration'].warm_up()
+
+    app.register_blueprint(bp)
+    return app
+
+
+def _session_id():
+    """This browser's session ID, issued on first use, keying its state in the session store"""
+    if 'sid' not in session:
+        session['sid'] = uuid.uuid4().hex
+        # Outlives the browser session, since the profiles it saved are only reachable through it
+        session.permanent = True
+    return session['sid']
+
+
+def _profile_id():
+    """The profile a request names with ?profile_id=, or else this browser's own, issued on first use"""
+    profile_id = request.args.get('profile_id')
+    if profile_id:
+        return profile_id
+    if 'profile_id' not in session:
+        session['profile_id'] = uuid.uuid4().hex
+    return session['profile_id']
+
+
+def _profile_status(result):
+    """403 for requests for a profile saved by another session, else 200"""
+    return 403 if PROFILE_NOT_OWNED in result['errors'] else 200
+
+
+def _batch_status(result, default):
+    """503 for batch requests whose stored jobs could not be loaded, else default"""
+    return 503 if JOB_DATABASE_UNAVAILABLE in result['errors'] else default
+
+
+def _cpu_pool():
+    """The app's CPU pool, or None when CPU-bound stages run in the request's thread"""
+    return current_app.extensions.get('cpu_pool')
+
+
+def _admitted(name):
+    """Run the view under the named admission limit, answering 503 when it sheds the request"""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            # Async views are run to completion on an event loop of their own by ensure_sync
+            limit = current_app.extensions['admission'][name]
+            admitted_at = limit.acquire()
+            if admitted_at is None:
+                response = jsonify({
+                    'success': False,
+                    'message': 'Server is busy, please retry shortly',
+                    'data': None,
+                    'errors': [f'Too many concurrent {name} requests']
+                })
+                response.status_code = 503
+                response.headers['Retry-After'] = str(limit.retry_after())
+                return response
+            
+            try:
+                response = current_app.make_response(current_app.ensure_sync(view)(*args, **kwargs))
+            except BaseException:
+                limit.release(admitted_at)
+                raise
+            if response.is_streamed and not response.direct_passthrough:
+                # Generated while it is sent (ZIP exports): the slot is held until then
+                response.call_on_close(lambda: limit.release(admitted_at))
+            else:
+                limit.release(admitted_at)
+            return response
+        return wrapper
+    return decorator
+
+
+@bp.app_url_defaults
+def _fingerprint_static_url(endpoint, values):
+    """Add the file's fingerprint to url_for('static', ...) URLs, which makes them safe to cache for good"""
+    if endpoint == 'static' and 'filename' in values and 'v' not in values:
+        fingerprint = current_app.extensions['static_assets'].fingerprint(values['filename'])
+        if fingerprint:
+            values['v'] = fingerprint
+
+
+@bp.after_app_request
+def _http_caching(response):
+    """Cache headers and validators for static files and GET APIs, then compression for every response"""
+    if request.endpoint == 'static':
+        _cache_static(response)
+    elif request.method in ('GET', 'HEAD') and request.path.startswith('/api/'):
+        response = _conditional_response(response)
+    _compress(response)
+    return response
+
+
+def _cache_static(response):
+    """Let browsers keep a static file requested by its current fingerprint without ever revalidating"""
+    fingerprint = request.args.get('v')
+    if response.status_code == 200 and fingerprint and (
+            fingerprint == current_app.extensions['static_assets'].fingerprint(request.view_args['filename'])):
+        response.headers['Cache-Control'] = f"public, max-age={current_app.config['STATIC_MAX_AGE']}, immutable"
+
+
+def _conditional_response(response):
+    """Tag an API response with an ETag and answer 304 when the client's copy still matches"""
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or 'ETag' in response.headers or response.cache_control.no_store):
+        return response
+    if 'Cache-Control' not in response.headers:
+        # Cached per user, and revalidated on every use
+        response.headers['Cache-Control'] = 'private, no-cache'
+    # Weak, so the same validator covers the identity and compressed encodings
+    response.set_etag(hashlib.sha1(response.get_data()).hexdigest(), weak=True)
+    return response.make_conditional(request)
+
+
+def _compress(response):
+    """Compress a text body in the best encoding the client accepts, once it is large enough to pay off"""
+    compressor = current_app.extensions['compressor']
+    # Static files are sent straight from disk; other passthrough bodies are downloads
+    static = request.endpoint == 'static' and response.direct_passthrough
+    if (response.status_code != 200 or 'Content-Encoding' in response.headers
+            or (not static and (response.is_streamed or response.direct_passthrough))):
+        return
+    size = response.content_length if static else len(response.get_data())
+    if not compressor.compressible(response.mimetype, size or 0):
+        return
+
+    response.vary.add('Accept-Encoding')
+    encoding = compressor.negotiate(request.accept_encodings.quality)
+    if not encoding:
+        return
+
+    if static:
+        assets = current_app.extensions['static_assets']
+        filename = request.view_args['filename']
+        data = compressor.compress_cached(
+            (filename, assets.fingerprint(filename)), lambda: assets.read(filename), encoding
+        )
+        response.close()
+        response.direct_passthrough = False
+    else:
+        data = compressor.compress(response.get_data(), encoding)
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+@bp.route('/')
 def index():
     return render_template('index.html')
 
-@app.route('/hr')
+
+@bp.route('/hr')
 def hr_dashboard():
     return render_template('hr_dashboard.html')
 
-@app.route('/jobseeker')
+
+@bp.route('/jobseeker')
 def jobseeker_dashboard():
     try:
         # Load existing profile if available
-        profile_result = jobseeker_integration.get_profile()
+        profile_result = jobseeker_integration.get_profile(_profile_id(), _session_id())
         profile = profile_result['data'] if profile_result['success'] else None
         return render_template('jobseeker_dashboard.html', profile=profile)
     except Exception as e:
         print(f"Error loading profile for dashboard: {e}")
         return render_template('jobseeker_dashboard.html', profile=None)
 
-@app.route('/api/hr/match', methods=['POST'])
-def hr_match():
+
+@bp.route('/api/hr/match', methods=['POST'])
+@_admitted('hr_match')
+async def hr_match():
     try:
         data = request.get_json()
-        result = hr_integration.analyze_match(
-            data.get('resume', ''),
-            data.get('job_description', '')
-        )
+        resume_text = data.get('resume', '')
+        job_description = data.get('job_description', '')
+        time_budget_ms = data.get('time_budget_ms')
+        cpu_pool = _cpu_pool()
+        if cpu_pool:
+            result = await hr_integration.analyze_match_async(resume_text, job_description, cpu_pool, time_budget_ms)
+        else:
+            result = hr_integration.analyze_match(resume_text, job_description, time_budget_ms)
         return jsonify(result)
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/hr/samples')
+
+@bp.route('/api/hr/samples')
 def hr_samples():
     try:
         result = hr_integration.get_sample_data()
@@ -66,7 +281,8 @@ def hr_samples():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/hr/sample/<sample_type>/<name>')
+
+@bp.route('/api/hr/sample/<sample_type>/<name>')
 def hr_sample_content(sample_type, name):
     try:
         result = hr_integration.get_sample_content(sample_type, name)
@@ -74,7 +290,20 @@ def hr_sample_content(sample_type, name):
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/test-db')
+
+@bp.route('/api/hr/jobs/<int:job_id>', methods=['PUT'])
+def hr_update_job(job_id):
+    try:
+        data = request.get_json()
+        result = hr_integration.update_job_description(job_id, data.get('job_description', ''))
+        if result['success']:
+            jobseeker_integration.refresh_job(job_id, result['data']['analysis'])
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@bp.route('/api/test-db')
 def test_database():
     """Test database connection and data for debugging"""
     try:
@@ -123,27 +352,31 @@ def test_database():
             'message': f'Database error: {str(e)}'
         })
 
-@app.route('/api/jobseeker/profile', methods=['GET'])
+
+@bp.route('/api/jobseeker/profile', methods=['GET'])
 def jobseeker_get_profile():
     try:
-        result = jobseeker_integration.get_profile()
-        return jsonify(result)
+        result = jobseeker_integration.get_profile(_profile_id(), _session_id())
+        return jsonify(result), _profile_status(result)
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/jobseeker/profile', methods=['POST', 'PUT'])
+
+@bp.route('/api/jobseeker/profile', methods=['POST', 'PUT'])
 def jobseeker_save_profile():
     try:
         data = request.get_json()
+        profile_id = _profile_id()
         if request.method == 'POST':
-            result = jobseeker_integration.create_profile(data)
+            result = jobseeker_integration.create_profile(data, profile_id, _session_id())
         else:
-            result = jobseeker_integration.update_profile(data)
-        return jsonify(result)
+            result = jobseeker_integration.update_profile(data, profile_id, _session_id())
+        return jsonify(result), _profile_status(result)
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/jobseeker/validate', methods=['POST'])
+
+@bp.route('/api/jobseeker/validate', methods=['POST'])
 def jobseeker_validate():
     try:
         data = request.get_json()
@@ -152,72 +385,232 @@ def jobseeker_validate():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/jobseeker/analyze', methods=['POST'])
+
+@bp.route('/api/jobseeker/analyze', methods=['POST'])
 def jobseeker_analyze():
     try:
         data = request.get_json()
-        result = jobseeker_integration.analyze_job(data.get('job_description', ''))
+        result = jobseeker_integration.analyze_job(data.get('job_description', ''), _session_id())
         return jsonify(result)
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/jobseeker/generate', methods=['POST'])
-def jobseeker_generate():
+
+@bp.route('/api/jobseeker/generate', methods=['POST'])
+@_admitted('generate')
+async def jobseeker_generate():
     try:
         data = request.get_json()
-        result = jobseeker_integration.generate_resume(
+        args = (data.get('profile'), data.get('analysis'), _session_id())
+        cpu_pool = _cpu_pool()
+        if cpu_pool:
+            result = await jobseeker_integration.generate_resume_async(*args, cpu_pool=cpu_pool)
+        else:
+            result = jobseeker_integration.generate_resume(*args)
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@bp.route('/api/jobseeker/generate/batch', methods=['POST'])
+@_admitted('generate_batch')
+def jobseeker_generate_batch():
+    try:
+        data = request.get_json() or {}
+        result = jobseeker_integration.generate_resumes_batch(
             data.get('profile'),
-            data.get('analysis')
+            data.get('job_descriptions'),
+            data.get('job_ids'),
+            _session_id()
+        )
+        return jsonify(result), _batch_status(result, 200)
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@bp.route('/api/jobseeker/recommend', methods=['POST'])
+def jobseeker_recommend():
+    try:
+        data = request.get_json() or {}
+        result = jobseeker_integration.recommend_jobs(
+            data.get('profile'),
+            data.get('top_k', 10),
+            _session_id(),
+            data.get('time_budget_ms')
         )
         return jsonify(result)
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.route('/api/jobseeker/export', methods=['POST'])
-def jobseeker_export():
+
+@bp.route('/api/jobseeker/export', methods=['POST'])
+@_admitted('export')
+async def jobseeker_export():
     """Export resume in specified format and trigger download"""
     try:
         data = request.get_json()
-        result = jobseeker_integration.export_resume(
+        args = (
             data.get('content'),
             data.get('format'),
             data.get('profile'),
-            data.get('job_description')
+            data.get('job_description'),
+            data.get('resume_data'),
+            data.get('resume_id')
         )
+        cpu_pool = _cpu_pool()
         
-        if result['success'] and 'file_data' in result['data']:
-            # Return file for download with proper headers
-            from flask import make_response
-            
-            file_data = result['data']['file_data']
-            filename = result['data']['filename']
-            content_type = result['data']['content_type']
-            
-            # Create response with binary data
-            response = make_response(file_data)
-            response.headers['Content-Type'] = content_type
-            response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
-            response.headers['Content-Length'] = len(file_data)
-            
-            # Add cache control headers
-            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-            response.headers['Pragma'] = 'no-cache'
-            response.headers['Expires'] = '0'
-            
-            return response
+        async def export():
+            if cpu_pool:
+                return await jobseeker_integration.export_resume_async(*args, cpu_pool=cpu_pool)
+            return jobseeker_integration.export_resume(*args)
         
-        return jsonify(result)
+        result = await export()
+        if result['success']:
+            try:
+                return _download_response(result['data'])
+            except FileNotFoundError:
+                # Evicted from the artifact cache since it was looked up: exporting again re-renders it
+                result = await export()
+                if result['success']:
+                    return _download_response(result['data'])
+        
+        # A non-2xx status keeps the dashboard from saving the error as a download
+        return jsonify(result), 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@bp.route('/api/jobseeker/export/jobs', methods=['POST'])
+def jobseeker_submit_export():
+    """Queue a generated resume for background rendering"""
+    try:
+        data = request.get_json() or {}
+        result = jobseeker_integration.submit_export(data.get('resume_id'), data.get('format'))
+        return jsonify(result), 202 if result['success'] else 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@bp.route('/api/jobseeker/export/jobs/<job_id>')
+def jobseeker_export_status(job_id):
+    try:
+        result = jobseeker_integration.get_export_status(job_id)
+        return jsonify(result), 200 if result['data'] else 404
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@bp.route('/api/jobseeker/export/jobs/<job_id>/download')
+def jobseeker_export_download(job_id):
+    try:
+        result = jobseeker_integration.get_export_file(job_id)
+        if result['success']:
+            try:
+                return _download_response(result['data'])
+            except FileNotFoundError:
+                return jsonify({
+                    'success': False,
+                    'message': 'Export was evicted from the cache; submit it again',
+                    'data': None,
+                    'errors': ['Export file no longer available']
+                }), 409
+        return jsonify(result), 404 if result['data'] is None else 409
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@bp.route('/api/jobseeker/export/batch', methods=['POST'])
+@_admitted('export_batch')
+def jobseeker_export_batch():
+    """Tailor a profile to many jobs and stream the exports back as a ZIP archive"""
+    from flask import Response
+    
+    try:
+        data = request.get_json() or {}
+        result = jobseeker_integration.export_resumes_zip(
+            data.get('profile'),
+            data.get('job_descriptions'),
+            data.get('job_ids'),
+            data.get('formats'),
+            _session_id()
+        )
+        if not result['success']:
+            return jsonify(result), _batch_status(result, 400)
+        
+        export = result['data']
+        response = Response(export['chunks'], mimetype=export['content_type'])
+        response.headers['Content-Disposition'] = f'attachment; filename="{export["filename"]}"'
+        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+        return response
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
-@app.errorhandler(404)
+
+@bp.route('/api/metrics')
+def metrics():
+    """Admission queues and stage cost estimates of the worker process that serves this request"""
+    return jsonify({
+        'success': True,
+        'message': 'Metrics collected',
+        'data': {
+            'pid': os.getpid(),
+            'admission': current_app.extensions['admission'].metrics(),
+            'stage_costs': {
+                'hr_match': hr_integration.match_costs.metrics(),
+                'recommend': jobseeker_integration.ranking_costs.metrics()
+            }
+        },
+        'errors': []
+    })
+
+
+def _download_response(export):
+    """Build an attachment response for an exported resume
+
+    Raises FileNotFoundError when a cached artifact has been evicted.
+    """
+    from flask import make_response, send_file
+    
+    file_data = export['file_data']
+    filename = export['filename']
+    content_type = export['content_type']
+    
+    if export.get('file_path'):
+        # Cached artifact: opened here, so an eviction from now on cannot take it from
+        # under the response, and streamed by the server (sendfile where available)
+        response = send_file(
+            open(export['file_path'], 'rb'),
+            mimetype=content_type,
+            as_attachment=True,
+            download_name=filename,
+            conditional=False,
+            etag=False
+        )
+    else:
+        # Create response with binary data
+        response = make_response(file_data)
+        response.headers['Content-Type'] = content_type
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response.headers['Content-Length'] = len(file_data)
+    
+    # Add cache control headers
+    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+    response.headers['Pragma'] = 'no-cache'
+    response.headers['Expires'] = '0'
+    
+    return response
+
+
+@bp.app_errorhandler(404)
 def not_found(_error):
     return render_template('index.html'), 404
 
-@app.errorhandler(500)
+
+@bp.app_errorhandler(500)
 def internal_error(_error):
     return jsonify({'success': False, 'message': 'Internal server error'}), 500
 
+
 def check_database_connection():
     """Check database connection and display status on startup"""
     try:
@@ -277,6 +670,7 @@ def check_database_connection():
     finally:
         print("="*60 + "\n")
 
+
 if __name__ == '__main__':
     print("\n" + "="*50)
     print("Unified Resume Platform")
@@ -292,4 +686,5 @@ if __name__ == '__main__':
         print("Status: Running without database (limited functionality)")
     print("="*50 + "\n")
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server; production runs wsgi.py under gunicorn (see gunicorn.conf.py)
+    create_app().run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,92 @@
+"""Benchmark PDF and DOCX rendering with cold and warmed document bases
+
+Usage: python benchmarks/bench_document_export.py [--repeat N]
+
+"cold" rebuilds the reportlab stylesheet and re-parses the DOCX base template
+for every export, as exports did before the bases were kept per process;
+"warm" reuses them. Reports the median latency per export and the peak memory
+traced while rendering one export, plus what the warmed bases keep resident.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from unified_resume_platform.backend.models import resume_renderer
+from unified_resume_platform.backend.models.resume_generator import ResumeGenerator
+from unified_resume_platform.backend.models.resume_renderer import ResumeRenderer, warm_documents
+
+from bench_resume_generator import make_analysis, make_profile
+
+
+def reset_bases():
+    resume_renderer._pdf_stylesheet = None
+    resume_renderer._docx_base = None
+
+
+def timed(render, blocks, repeat):
+    """Median (cold, warm) seconds per export, alternating the two so drift hits both alike"""
+    samples = {True: [], False: []}
+    for _ in range(repeat):
+        for cold in (True, False):
+            if cold:
+                reset_bases()
+            started = time.perf_counter()
+            render(blocks)
+            samples[cold].append(time.perf_counter() - started)
+    return statistics.median(samples[True]), statistics.median(samples[False])
+
+
+def peak_memory(render, blocks, cold):
+    if cold:
+        reset_bases()
+    tracemalloc.start()
+    render(blocks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def resident_memory():
+    reset_bases()
+    tracemalloc.start()
+    warm_documents()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Exports per case (median is reported)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    resume_data = ResumeGenerator().generate_resume(make_profile(rng, 6), make_analysis(rng, 20))
+    renderer = ResumeRenderer()
+    blocks = renderer.build_blocks(resume_data)
+
+    print(f"{'format':>8} {'bases':>6} {'ms':>10} {'peak KiB':>10}")
+    for format_type, render in (("pdf", renderer.render_pdf), ("docx", renderer.render_docx)):
+        try:
+            render(blocks)
+        except ImportError as e:
+            print(f"{format_type:>8} skipped: {e}")
+            continue
+        cold_seconds, warm_seconds = timed(render, blocks, args.repeat)
+        for label, cold, seconds in (("cold", True, cold_seconds), ("warm", False, warm_seconds)):
+            warm_documents()
+            peak = peak_memory(render, blocks, cold)
+            print(f"{format_type:>8} {label:>6} {seconds * 1000:>10.2f} {peak / 1024:>10.0f}")
+
+    print(f"\nWarmed bases resident: {resident_memory() / 1024:.0f} KiB per process")
+
+
+if __name__ == "__main__":
+    main()
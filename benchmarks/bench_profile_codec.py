@@ -0,0 +1,107 @@
+"""Benchmark profile codecs on large profiles
+
+Usage: python benchmarks/bench_profile_codec.py [--repeat N]
+
+For every installed codec, reports encode/decode time of the codec alone,
+ProfileManager save time (snapshot write with fsync, plus the index update),
+load time uncached (read and decode the file) and cached (decode the
+cached snapshot bytes), and the snapshot size on disk. The first row per
+size is the indented stdlib JSON that profiles used to be stored as.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from unified_resume_platform.backend.models.profile_codec import available_codecs, get_codec
+from unified_resume_platform.backend.models.profile_manager import ProfileManager
+
+from bench_resume_generator import make_profile
+
+
+def median_ms(action, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def bench_codec(name, profile, repeat):
+    codec = get_codec(name)
+    raw = codec.encode(profile)
+    encode_ms = median_ms(lambda: codec.encode(profile), repeat)
+    decode_ms = median_ms(lambda: codec.decode(raw), repeat)
+
+    data_dir = tempfile.mkdtemp()
+    try:
+        manager = ProfileManager(data_dir, codec=codec)
+        save_ms = median_ms(lambda: manager.create_profile(dict(profile), "bench"), repeat)
+
+        def load():
+            manager._cache.clear()
+            manager.load_profile("bench")
+
+        load_ms = median_ms(load, repeat)
+        manager.load_profile("bench")
+        cached_ms = median_ms(lambda: manager.load_profile("bench"), repeat)
+        size = os.path.getsize(manager.profile_path("bench"))
+    finally:
+        shutil.rmtree(data_dir)
+    return encode_ms, decode_ms, save_ms, load_ms, cached_ms, size
+
+
+def bench_legacy(profile, repeat):
+    """The old format: indented stdlib JSON, written in place and parsed as text"""
+    encode_ms = median_ms(lambda: json.dumps(profile, indent=2, ensure_ascii=False), repeat)
+    text = json.dumps(profile, indent=2, ensure_ascii=False)
+    decode_ms = median_ms(lambda: json.loads(text), repeat)
+
+    data_dir = tempfile.mkdtemp()
+    path = os.path.join(data_dir, "profile.json")
+    try:
+        def save():
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(profile, f, indent=2, ensure_ascii=False)
+
+        def load():
+            with open(path, 'r', encoding='utf-8') as f:
+                json.load(f)
+
+        save_ms = median_ms(save, repeat)
+        load_ms = median_ms(load, repeat)
+        size = os.path.getsize(path)
+    finally:
+        shutil.rmtree(data_dir)
+    # Nothing was cached: every load read the file
+    return encode_ms, decode_ms, save_ms, load_ms, load_ms, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per case (median is reported)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'items':>6} {'codec':>12} {'encode ms':>10} {'decode ms':>10} {'save ms':>9} {'load ms':>9} "
+          f"{'cached ms':>10} {'KiB':>8}")
+    for items in (10, 100, 1000):
+        profile = make_profile(rng, items)
+        rows = [("indent-json", bench_legacy(profile, args.repeat))]
+        rows += [(name, bench_codec(name, profile, args.repeat)) for name in available_codecs()]
+        for name, (encode_ms, decode_ms, save_ms, load_ms, cached_ms, size) in rows:
+            print(f"{items:>6} {name:>12} {encode_ms:>10.3f} {decode_ms:>10.3f} {save_ms:>9.3f} {load_ms:>9.3f} "
+                  f"{cached_ms:>10.3f} {size / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
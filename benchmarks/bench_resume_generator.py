@@ -0,0 +1,95 @@
+"""Benchmark ResumeGenerator.generate_resume on large profiles
+
+Usage: python benchmarks/bench_resume_generator.py [--repeat N]
+
+Reports generation time as profiles grow (experiences + projects) and as the
+number of job keywords grows. Time per profile item should stay flat in both
+directions: keywords are compiled once per call and each text is scanned once.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from unified_resume_platform.backend.models.resume_generator import ResumeGenerator
+
+WORDS = (
+    "python java javascript aws docker kubernetes react sql api agile scrum team built led "
+    "designed scalable services data pipeline machine learning cloud microservices reduced "
+    "latency improved migrated automated monitoring terraform jenkins git testing"
+).split()
+
+
+def sentence(rng, length):
+    return " ".join(rng.choice(WORDS) for _ in range(length)).capitalize() + "."
+
+
+def make_profile(rng, items):
+    """Profile with `items` work experiences and `items` projects"""
+    return {
+        "personal_info": {"name": "Bench User", "email": "bench@example.com"},
+        "summary": sentence(rng, 40),
+        "work_experience": [
+            {
+                "company": f"Company {i}",
+                "position": "Engineer",
+                "start_date": f"{rng.randint(2000, 2025)}-01",
+                "description": sentence(rng, 40),
+                "achievements": [sentence(rng, 15) for _ in range(4)]
+            }
+            for i in range(items)
+        ],
+        "education": [{"institution": "University", "degree": "BSc"}],
+        "skills": {"technical": [rng.choice(WORDS) + str(i) for i in range(items)], "soft": ["communication"]},
+        "projects": [
+            {"name": f"Project {i}", "description": sentence(rng, 30), "technologies": rng.sample(WORDS, 6)}
+            for i in range(items)
+        ]
+    }
+
+
+def make_analysis(rng, keywords):
+    vocabulary = WORDS + [f"{rng.choice(WORDS)}-{i}" for i in range(keywords)]
+    chosen = rng.sample(vocabulary, min(keywords, len(vocabulary)))
+    split = len(chosen) * 2 // 3
+    return {"required_skills": chosen[:split], "preferred_skills": chosen[split:]}
+
+
+def timed(generator, profile, analysis, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        generator.generate_resume(profile, analysis)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best is reported)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    generator = ResumeGenerator()
+
+    print("Profile size (20 job keywords)")
+    print(f"{'items':>8} {'ms':>10} {'us/item':>10}")
+    analysis = make_analysis(rng, 20)
+    for items in (50, 100, 200, 400, 800, 1600):
+        elapsed = timed(generator, make_profile(rng, items), analysis, args.repeat)
+        print(f"{items:>8} {elapsed * 1000:>10.2f} {elapsed * 1e6 / (3 * items):>10.2f}")
+
+    print("\nJob keywords (400 items)")
+    print(f"{'keywords':>8} {'ms':>10}")
+    profile = make_profile(rng, 400)
+    for keywords in (5, 20, 80, 320):
+        elapsed = timed(generator, profile, make_analysis(rng, keywords), args.repeat)
+        print(f"{keywords:>8} {elapsed * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
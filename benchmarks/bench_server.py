@@ -0,0 +1,170 @@
+"""Benchmark requests per second as gunicorn workers scale
+
+Usage: python benchmarks/bench_server.py [--workers 1,2,4] [--threads N] [--clients N] [--seconds S]
+                                         [--endpoint analyze|match] [--async-offload]
+
+Starts the production server (gunicorn.conf.py, wsgi:app) once per worker
+count and drives job analysis (or HR match) requests at it from client
+processes over keep-alive connections. Reports throughput and latency, and
+the workers' total resident (RSS) and proportional (PSS) memory: with the
+app preloaded in the master, PSS stays well below RSS because model memory
+is shared.
+
+With --async-offload the server runs a single gunicorn worker with
+ASYNC_OFFLOAD=1, and the worker counts are sizes of its CPU pool instead:
+match requests should then scale with the pool up to the number of cores.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+JOB_DESCRIPTION = (
+    "Senior Python Developer\n\n"
+    "Required: 5+ years of Python, SQL and REST API design. Experience with AWS, Docker and Kubernetes.\n\n"
+    "Preferred: machine learning, CI/CD, Agile. Bachelor degree in computer science.\n\n"
+    "Responsibilities:\n- Build services\n- Review code\n- Mentor engineers\n"
+)
+
+
+RESUME = (
+    "Jane Doe - Python Developer\n\n"
+    "Six years building REST APIs in Python and SQL on AWS with Docker. "
+    "Led CI/CD adoption and mentored engineers in an Agile team. BSc Computer Science.\n"
+)
+
+ENDPOINTS = {
+    "analyze": ("/api/jobseeker/analyze", {"job_description": JOB_DESCRIPTION}),
+    "match": ("/api/hr/match", {"resume": RESUME, "job_description": JOB_DESCRIPTION})
+}
+
+
+def drive(args):
+    """One client: send requests until the deadline, returning their latencies"""
+    port, deadline, endpoint = args
+    path, payload = ENDPOINTS[endpoint]
+    body = json.dumps(payload)
+    headers = {"Content-Type": "application/json"}
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    latencies = []
+    while time.time() < deadline:
+        started = time.perf_counter()
+        connection.request("POST", path, body, headers)
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+    return latencies
+
+
+def wait_until_up(port, server, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("gunicorn exited during startup")
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("gunicorn did not start")
+
+
+def worker_memory(master_pid):
+    """(RSS, PSS) in bytes summed over the master's descendants (workers and their CPU pools)"""
+    parents = {}
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                parents[int(pid)] = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+
+    def descends(pid):
+        while pid in parents:
+            pid = parents[pid]
+            if pid == master_pid:
+                return True
+        return False
+
+    rss = pss = 0
+    for pid in filter(descends, parents):
+        try:
+            with open(f"/proc/{pid}/smaps_rollup") as f:
+                for line in f:
+                    name, value = line.split(":", 1)
+                    if name in ("Rss", "Pss"):
+                        kib = int(value.split()[0]) * 1024
+                        rss += kib if name == "Rss" else 0
+                        pss += kib if name == "Pss" else 0
+        except (OSError, ValueError, IndexError):
+            continue
+    return rss, pss
+
+
+def bench(workers, threads, clients, seconds, port, endpoint="analyze", async_offload=False):
+    env = dict(os.environ)
+    if async_offload:
+        env.update(ASYNC_OFFLOAD="1", CPU_POOL_WORKERS=str(workers))
+        workers = 1
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "-w", str(workers),
+               "--threads", str(threads), "-b", f"127.0.0.1:{port}", "--log-level", "warning", "wsgi:app"]
+    server = subprocess.Popen(command, cwd=ROOT, env=env)
+    try:
+        wait_until_up(port, server)
+        with Pool(clients) as pool:
+            # Warm every worker's connections and caches (and CPU pool) before measuring
+            pool.map(drive, [(port, time.time() + 1, endpoint)] * clients)
+            started = time.time()
+            results = pool.map(drive, [(port, started + seconds, endpoint)] * clients)
+            elapsed = time.time() - started
+        rss, pss = worker_memory(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(30)
+
+    latencies = sorted(latency for result in results for latency in result)
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0
+    return len(latencies) / elapsed, statistics.median(latencies), p99, rss, pss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)),
+                        help="Comma-separated worker counts to try")
+    parser.add_argument("--threads", type=int, default=1, help="Threads per worker")
+    parser.add_argument("--clients", type=int, default=max(4, 2 * cpus), help="Concurrent client connections")
+    parser.add_argument("--seconds", type=float, default=10, help="Measured duration per worker count")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), default="analyze", help="Requests to send")
+    parser.add_argument("--async-offload", action="store_true",
+                        help="One gunicorn worker offloading to a CPU pool; --workers sizes the pool")
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'threads':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'RSS MiB':>8} {'PSS MiB':>8}")
+    for workers in (int(count) for count in args.workers.split(",")):
+        rps, p50, p99, rss, pss = bench(workers, args.threads, args.clients, args.seconds, args.port,
+                                        args.endpoint, args.async_offload)
+        print(f"{workers:>7} {args.threads:>7} {rps:>9.1f} {p50 * 1000:>8.2f} {p99 * 1000:>8.2f} "
+              f"{rss / 2 ** 20:>8.1f} {pss / 2 ** 20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
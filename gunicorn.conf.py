@@ -0,0 +1,57 @@
+"""Gunicorn settings for the Unified Resume Platform
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Workers and threads per worker come from WEB_CONCURRENCY and
+GUNICORN_THREADS (or -w / --threads on the command line). The app is
+loaded once in the master before forking; see the hooks below for how
+its memory stays shared.
+
+Reloading: SIGHUP replaces the workers gracefully (in-flight requests
+finish) with the code already loaded in the master. To deploy new code
+without dropping connections, send SIGUSR2 to start a new master
+alongside the old one, then SIGQUIT the old one once the new workers
+are up.
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Build the app (models, NLTK data, document templates) once, before forking
+preload_app = True
+
+# Batch exports stream for a while; give them time, and time to finish on reload
+timeout = 120
+graceful_timeout = 60
+keepalive = 5
+
+# Recycle workers now and then; forking from the preloaded master is cheap
+max_requests = 2000
+max_requests_jitter = 200
+
+# Collections in the master while the app loads would leave freed holes in
+# pages that are about to be shared; collection is back on once it is frozen
+gc.disable()
+
+
+def when_ready(server):
+    # Move everything loaded so far out of the collector's reach: a worker's
+    # collections then never write to (and so never copy) the shared pages
+    gc.freeze()
+    gc.enable()
+    server.log.info('Preloaded app frozen (%d objects shared with workers)', gc.get_freeze_count())
+
+
+def post_fork(server, worker):
+    gc.enable()
+
+
+def on_reload(server):
+    # SIGHUP re-reads this file, disabling collection in the master again
+    gc.enable()
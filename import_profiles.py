@@ -0,0 +1,50 @@
+"""Unified Resume Platform - Bulk profile import"""
+
+import argparse
+import json
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from unified_resume_platform.backend.integrations.profile_import_integration import ProfileImportIntegration
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Validate and store profiles from a JSON Lines file, one '
+                    '{"profile_id": ..., "profile": {...}} object per line'
+    )
+    parser.add_argument('path', help='JSONL file to import')
+    parser.add_argument('--data-dir', default=None,
+                        help='Profile store to import into (default: the platform data directory)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of import processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=2000,
+                        help='Lines read from the file per batch')
+    parser.add_argument('--replace', action='store_true',
+                        help='Overwrite profiles that already exist instead of reporting them')
+    parser.add_argument('--report', default=None,
+                        help='Write the per-line error report here as JSONL instead of printing it')
+    args = parser.parse_args()
+
+    importer = ProfileImportIntegration(data_dir=args.data_dir, workers=args.workers, batch_size=args.batch_size)
+    result = importer.import_jsonl(args.path, replace=args.replace)
+
+    print(result['message'])
+    report = result['data']['report'] if result['data'] else []
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            for entry in report:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    else:
+        for entry in report:
+            print(f"✗ line {entry['line']} ({entry['profile_id'] or '?'}): {'; '.join(entry['errors'])}")
+    for error in result['errors']:
+        print(f"✗ {error}")
+    return 0 if result['success'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -70,5 +70,22 @@ CREATE TABLE IF NOT EXISTS resume_matches (
     UNIQUE KEY unique_match (resume_id, job_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Table: job_requirements
+-- Stores structured requirements pre-extracted from job descriptions
+CREATE TABLE IF NOT EXISTS job_requirements (
+    job_id INT PRIMARY KEY,
+    keywords JSON,
+    required_skills JSON,
+    preferred_skills JSON,
+    experience_level VARCHAR(100),
+    experience_years INT,
+    education_requirements VARCHAR(255),
+    key_responsibilities JSON,
+    text_hash CHAR(64) NOT NULL,
+    analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (job_id) REFERENCES job_descriptions(job_id) ON DELETE CASCADE,
+    INDEX idx_experience_years (experience_years),
+    INDEX idx_analyzed_at (analyzed_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 
@@ -0,0 +1,117 @@
+import math
+import threading
+import time
+
+import pytest
+
+from app import create_app
+from unified_resume_platform.backend.models import admission
+from unified_resume_platform.backend.models.admission import DEFAULT_LIMITS, AdmissionLimit, raise_limits
+
+
+def test_requests_under_the_limit_are_admitted_at_once():
+    limit = AdmissionLimit("generate", max_concurrent=2, max_queue=0, queue_timeout=1.0)
+    first, second = limit.acquire(), limit.acquire()
+    assert first is not None and second is not None
+    assert limit.active == 2
+
+    limit.release(first)
+    assert limit.acquire() is not None
+    assert limit.metrics()["admitted"] == 3
+
+
+def test_request_is_shed_when_the_queue_is_full():
+    limit = AdmissionLimit("generate", max_concurrent=1, max_queue=0, queue_timeout=5.0)
+    assert limit.acquire() is not None
+
+    started = time.perf_counter()
+    assert limit.acquire() is None
+    assert time.perf_counter() - started < 1.0
+    assert limit.shed_queue_full == 1
+
+
+def test_request_is_shed_when_its_wait_times_out():
+    limit = AdmissionLimit("generate", max_concurrent=1, max_queue=1, queue_timeout=0.05)
+    assert limit.acquire() is not None
+
+    assert limit.acquire() is None
+    assert limit.shed_timeout == 1
+    assert limit.queued == 0
+
+
+def test_queued_request_gets_the_released_slot():
+    limit = AdmissionLimit("generate", max_concurrent=1, max_queue=1, queue_timeout=5.0)
+    admitted_at = limit.acquire()
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(limit.acquire()))
+    waiter.start()
+    while limit.queued == 0:
+        time.sleep(0.001)
+
+    limit.release(admitted_at)
+    waiter.join(5)
+    assert results and results[0] is not None
+    assert limit.active == 1 and limit.queued == 0
+
+
+def test_retry_after_is_the_expected_queue_drain_time(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(admission.time, "perf_counter", lambda: clock[0])
+    limit = AdmissionLimit("generate", max_concurrent=2, max_queue=4, queue_timeout=1.0)
+    # No completed request yet: one second each is assumed
+    assert limit.retry_after() == 1
+
+    admitted_at = limit.acquire()
+    clock[0] += 3.0
+    limit.release(admitted_at)
+    limit.acquire()
+    limit.acquire()
+    # Three seconds a request, two running plus the retry, over two slots
+    assert limit.retry_after() == math.ceil(3.0 * 3 / 2)
+
+
+def test_raise_limits_only_raises_the_named_endpoints():
+    raised = raise_limits(DEFAULT_LIMITS, ["generate"], 6)
+    assert raised["generate"]["max_concurrent"] == 6
+    assert raised["hr_match"] == DEFAULT_LIMITS["hr_match"]
+    assert DEFAULT_LIMITS["generate"]["max_concurrent"] == 2
+
+
+@pytest.fixture
+def app():
+    limits = {name: dict(settings, max_concurrent=1, max_queue=0) for name, settings in DEFAULT_LIMITS.items()}
+    return create_app(warm_up=False, config={'ADMISSION_LIMITS': limits})
+
+
+def test_shed_request_gets_503_with_retry_after(app):
+    limit = app.extensions['admission']['generate']
+    admitted_at = limit.acquire()
+    try:
+        response = app.test_client().post('/api/jobseeker/generate', json={})
+        retry_after = limit.retry_after()
+    finally:
+        limit.release(admitted_at)
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == str(retry_after)
+    assert response.get_json()['errors'] == ['Too many concurrent generate requests']
+
+
+def test_slot_is_released_after_the_response(app):
+    response = app.test_client().post('/api/jobseeker/generate', json={})
+    assert response.status_code == 200
+    assert app.extensions['admission']['generate'].active == 0
+
+
+def test_streamed_response_holds_its_slot_until_closed(app):
+    limit = app.extensions['admission']['export_batch']
+    profile = {"personal_info": {"name": "Ada"}, "summary": "Python developer", "skills": {"technical": ["Python"]}}
+    response = app.test_client().post('/api/jobseeker/export/batch', buffered=False, json={
+        'profile': profile, 'job_descriptions': ['Requirements: Python'], 'formats': ['txt']
+    })
+    assert response.status_code == 200
+    assert limit.active == 1
+
+    b''.join(response.response)
+    response.close()
+    assert limit.active == 0
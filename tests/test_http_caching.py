@@ -0,0 +1,104 @@
+import gzip
+import json
+
+import pytest
+
+from app import create_app
+from unified_resume_platform.backend.models.response_compression import ResponseCompressor, brotli
+
+
+def quality(accepted):
+    return lambda encoding: accepted.get(encoding, 0.0)
+
+
+def test_negotiation_picks_the_best_accepted_encoding():
+    compressor = ResponseCompressor()
+    assert compressor.negotiate(quality({"gzip": 1.0})) == "gzip"
+    assert compressor.negotiate(quality({})) is None
+    assert compressor.negotiate(quality({"gzip": 0.0})) is None
+    if brotli:
+        assert compressor.negotiate(quality({"gzip": 1.0, "br": 1.0})) == "br"
+        assert compressor.negotiate(quality({"gzip": 1.0, "br": 0.5})) == "gzip"
+
+
+def test_only_text_types_over_min_size_are_compressible():
+    compressor = ResponseCompressor(min_size=100)
+    assert compressor.compressible("application/json", 100)
+    assert not compressor.compressible("application/json", 99)
+    assert not compressor.compressible("application/pdf", 10000)
+
+
+def test_cached_compression_reads_the_body_once_per_encoding():
+    compressor = ResponseCompressor()
+    reads = []
+    body = b"body " * 100
+
+    def read():
+        reads.append(1)
+        return body
+
+    first = compressor.compress_cached(("app.js", "v1"), read, "gzip")
+    assert compressor.compress_cached(("app.js", "v1"), read, "gzip") == first
+    assert gzip.decompress(first) == body
+    assert len(reads) == 1
+
+
+def make_client(**config):
+    return create_app(warm_up=False, config=config).test_client()
+
+
+def test_api_responses_are_compressed_once_large_enough():
+    client = make_client(COMPRESS_MIN_SIZE=32)
+    response = client.get('/api/jobseeker/profile', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert json.loads(gzip.decompress(response.get_data()))['success']
+
+    response = client.get('/api/jobseeker/profile')
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_responses_under_min_size_are_sent_as_is():
+    client = make_client(COMPRESS_MIN_SIZE=1 << 20)
+    response = client.get('/api/jobseeker/profile', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' not in response.headers.get('Vary', '')
+
+
+@pytest.mark.parametrize("accept_encoding", [None, 'gzip'])
+def test_unchanged_api_response_is_answered_with_304(accept_encoding):
+    client = make_client(COMPRESS_MIN_SIZE=32)
+    headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+    response = client.get('/api/jobseeker/profile', headers=headers)
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+
+    response = client.get('/api/jobseeker/profile', headers=dict(headers, **{'If-None-Match': etag}))
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+    response = client.get('/api/jobseeker/profile', headers=dict(headers, **{'If-None-Match': 'W/"stale"'}))
+    assert response.status_code == 200
+
+
+def test_fingerprinted_static_files_are_immutable_and_compressed_once():
+    app = create_app(warm_up=False, config={'COMPRESS_MIN_SIZE': 32})
+    client = app.test_client()
+    assets = app.extensions['static_assets']
+    fingerprint = assets.fingerprint('js/app.js')
+    reads = []
+    read = assets.read
+    assets.read = lambda filename: reads.append(filename) or read(filename)
+
+    for _ in range(2):
+        response = client.get(f'/static/js/app.js?v={fingerprint}', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.get_data()) == read('js/app.js')
+        assert 'immutable' in response.headers['Cache-Control']
+        response.close()
+    assert reads == ['js/app.js']
+
+    response = client.get('/static/js/app.js?v=outdated')
+    assert 'immutable' not in response.headers.get('Cache-Control', '')
+    response.close()
@@ -0,0 +1,59 @@
+import pytest
+
+from unified_resume_platform.backend.models.job_recommender import JobRecommender
+
+
+def make_jobs():
+    return [
+        {"job_id": 1, "job_title": "Backend Engineer", "company_name": "Acme", "location": "Remote",
+         "required_skills": ["Python", "SQL"], "preferred_skills": ["Docker"],
+         "experience_level": "3+ years", "education_requirements": "Bachelor"},
+        {"job_id": 2, "job_title": "Data Analyst", "company_name": "Globex", "location": "Berlin",
+         "required_skills": ["SQL", "Excel"], "preferred_skills": [],
+         "experience_level": "", "education_requirements": ""},
+        {"job_id": 3, "job_title": "ML Engineer", "company_name": "Initech", "location": "Paris",
+         "required_skills": [], "preferred_skills": ["Python", "PyTorch", "python"],
+         "experience_level": "Senior, 8+ years", "education_requirements": "Master's degree"},
+        {"job_id": 4, "job_title": "Designer", "company_name": "Hooli", "location": "London",
+         "required_skills": ["Figma"], "preferred_skills": ["Sketch"],
+         "experience_level": "Entry level", "education_requirements": "Bachelor or Master"}
+    ]
+
+
+def make_profiles():
+    return [
+        {"summary": "Python developer working with SQL and Docker",
+         "work_experience": [{"description": "Built Python services"}, {"description": "Ran SQL reports"}],
+         "education": [{"degree": "Bachelor"}],
+         "skills": {"technical": ["Python", "SQL", "Docker"], "soft": ["Communication"]}},
+        {"summary": "Designer",
+         "work_experience": [],
+         "education": [{"degree": "Master"}, {"degree": ""}],
+         "skills": {"technical": ["Figma"]}},
+        {"summary": "Analyst who knows excel",
+         "skills": {"languages": ["English"]}}
+    ]
+
+
+def test_vectorized_scores_match_the_per_job_score():
+    recommender = JobRecommender()
+    jobs = make_jobs()
+    recommender.build_index(jobs)
+
+    for profile in make_profiles():
+        expected = [recommender.job_analyzer.calculate_relevance_score(profile, job) for job in jobs]
+        assert recommender.score_jobs(profile).tolist() == pytest.approx(expected)
+
+
+def test_update_job_ignores_jobs_missing_from_the_index():
+    recommender = JobRecommender()
+    recommender.build_index(make_jobs())
+    version = recommender.version
+
+    assert not recommender.update_job({"job_id": 5, "required_skills": ["Python"]})
+    assert [job["job_id"] for job in recommender.jobs] == [1, 2, 3, 4]
+    assert recommender.version == version
+
+    assert recommender.update_job({"job_id": 2, "required_skills": ["Python"]})
+    assert recommender.jobs[1]["required_skills"] == ["Python"]
+    assert recommender.jobs[1]["job_title"] == "Data Analyst"
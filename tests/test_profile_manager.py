@@ -0,0 +1,72 @@
+import os
+
+from unified_resume_platform.backend.models.profile_manager import ProfileManager
+
+
+def make_profile(summary="Backend engineer"):
+    return {
+        "personal_info": {"name": "Ada Lovelace", "email": "ada@example.com"},
+        "summary": summary,
+        "work_experience": [{"company": "Acme", "position": "Engineer", "start_date": "2020-01"}],
+        "education": [{"institution": "Uni", "degree": "BSc"}],
+        "skills": {"technical": ["python", "sql"]}
+    }
+
+
+def log_lines(manager, profile_id):
+    log_file = os.path.splitext(manager.profile_path(profile_id))[0] + ".log"
+    if not os.path.exists(log_file):
+        return 0
+    with open(log_file, "rb") as f:
+        return len(f.readlines())
+
+
+def test_updates_are_logged_and_replayed_on_load(tmp_path):
+    manager = ProfileManager(str(tmp_path))
+    assert manager.create_profile(make_profile(), "ada")
+    assert manager.update_profile(make_profile("Data engineer"), "ada")
+    assert log_lines(manager, "ada") == 1
+
+    reloaded = ProfileManager(str(tmp_path)).load_profile("ada")
+    assert reloaded["summary"] == "Data engineer"
+    assert reloaded["created_at"] == manager.load_profile("ada")["created_at"]
+
+
+def test_log_is_compacted_into_a_new_snapshot(tmp_path):
+    manager = ProfileManager(str(tmp_path), compact_after=2)
+    assert manager.create_profile(make_profile(), "ada")
+    for summary in ("First", "Second"):
+        assert manager.update_profile(make_profile(summary), "ada")
+    assert log_lines(manager, "ada") == 2
+
+    assert manager.update_profile(make_profile("Third"), "ada")
+    assert log_lines(manager, "ada") == 0
+    assert ProfileManager(str(tmp_path)).load_profile("ada")["summary"] == "Third"
+
+
+def test_profile_edited_in_place_is_saved(tmp_path):
+    manager = ProfileManager(str(tmp_path))
+    assert manager.create_profile(make_profile(), "ada")
+
+    profile = manager.load_profile("ada")
+    profile["summary"] = "Edited in place"
+    profile["skills"]["technical"].append("rust")
+    assert manager.load_profile("ada")["summary"] == "Backend engineer"
+
+    assert manager.update_profile(profile, "ada")
+    reloaded = ProfileManager(str(tmp_path)).load_profile("ada")
+    assert reloaded["summary"] == "Edited in place"
+    assert reloaded["skills"]["technical"] == ["python", "sql", "rust"]
+
+
+def test_owned_profile_is_only_saved_by_its_owner(tmp_path):
+    manager = ProfileManager(str(tmp_path))
+    assert manager.create_profile(make_profile(), "ada", owner="session-a")
+
+    assert not manager.create_profile(make_profile("Taken"), "ada", owner="session-b")
+    assert not manager.update_profile(make_profile("Taken"), "ada", owner="session-b")
+    assert manager.update_profile(dict(make_profile("Mine"), owner="session-b"), "ada", owner="session-a")
+
+    reloaded = ProfileManager(str(tmp_path)).load_profile("ada")
+    assert reloaded["summary"] == "Mine"
+    assert reloaded["owner"] == "session-a"
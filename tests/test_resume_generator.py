@@ -0,0 +1,70 @@
+import pytest
+
+from unified_resume_platform.backend.models.resume_generator import ResumeGenerator
+
+
+def make_resume_data(experiences=6, achievements=4, projects=4):
+    return {
+        "personal_info": {"name": "Ada Lovelace", "email": "ada@example.com"},
+        "summary": "Backend engineer.",
+        "skills": {"technical": ["Python", "SQL"]},
+        "education": [{"institution": "Uni", "degree": "BSc"}],
+        "work_experience": [
+            {"company": f"Company {i}", "position": "Engineer", "start_date": "2015", "end_date": "2016",
+             "description": f"Python services {i}",
+             "achievements": [f"Shipped SQL report {k}" for k in range(achievements)]}
+            for i in range(experiences)
+        ],
+        "projects": [
+            {"name": f"Project {i}", "description": "Python tool", "technologies": ["Python"]}
+            for i in range(projects)
+        ]
+    }
+
+
+def rendered_lines(generator, resume_data):
+    return len(generator.format_resume(resume_data).split("\n"))
+
+
+def test_resume_within_max_lines_is_left_alone():
+    generator = ResumeGenerator()
+    resume_data = make_resume_data(experiences=1, achievements=1, projects=1)
+    assert rendered_lines(generator, resume_data) <= generator.max_lines
+    assert generator._optimize_length(resume_data, ["python"]) is resume_data
+
+
+@pytest.mark.parametrize("max_lines", [60, 40, 25])
+def test_optimized_resume_fits_max_lines(max_lines):
+    generator = ResumeGenerator()
+    generator.max_lines = max_lines
+    resume_data = make_resume_data()
+    assert rendered_lines(generator, resume_data) > max_lines
+
+    optimized = generator._optimize_length(resume_data, ["python", "sql"])
+    assert rendered_lines(generator, optimized) <= max_lines
+    # Earlier experiences were ranked more relevant and are the ones kept
+    kept = [exp["company"] for exp in optimized["work_experience"]]
+    assert kept == [exp["company"] for exp in resume_data["work_experience"][:len(kept)]]
+
+
+def test_fixed_sections_over_max_lines_fall_back_to_truncation():
+    generator = ResumeGenerator()
+    generator.max_lines = 5
+    optimized = generator._optimize_length(make_resume_data(), ["python"])
+
+    assert len(optimized["work_experience"]) == 3
+    assert all(len(exp["achievements"]) == 2 for exp in optimized["work_experience"])
+    assert len(optimized["projects"]) == 2
+    assert optimized["summary"] == "Backend engineer."
+
+
+def test_achievements_are_valued_once():
+    generator = ResumeGenerator()
+    experience = make_resume_data(experiences=1, achievements=2)["work_experience"][0]
+    matcher = generator._keyword_matcher(["sql"])
+    _, items = generator._measure_section("work_experience", [experience])
+
+    values = generator._item_values("work_experience", [experience], items, matcher)[0]
+    without = generator._item_values("work_experience", [{**experience, "achievements": []}], [[1]], matcher)[0]
+    assert values[0] == pytest.approx(without[0])
+    assert values == pytest.approx([values[0], values[0] + 0.75, values[0] + 1.5])
@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+from unified_resume_platform.backend.models import session_store
+from unified_resume_platform.backend.models.session_store import SessionStore
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(session_store.time, "time", clock.time)
+    return clock
+
+
+def test_values_expire_ttl_after_they_were_last_set(clock):
+    store = SessionStore(ttl=10)
+    store.set("s1", "profile", {"summary": "a"})
+
+    clock.now += 9
+    assert store.get("s1", "profile") == {"summary": "a"}
+    store.set("s1", "profile", {"summary": "b"})
+    clock.now += 9
+    assert store.get("s1", "profile") == {"summary": "b"}
+    clock.now += 1
+    assert store.get("s1", "profile") is None
+
+
+def test_least_recently_used_entries_are_evicted():
+    store = SessionStore(max_entries=2)
+    store.set("s1", "profile", 1)
+    store.set("s2", "profile", 2)
+    assert store.get("s1", "profile") == 1
+    store.set("s3", "profile", 3)
+
+    assert store.get("s2", "profile") is None
+    assert store.get("s1", "profile") == 1
+    assert store.get("s3", "profile") == 3
+
+
+def test_values_without_a_session_are_ignored():
+    store = SessionStore()
+    store.set(None, "profile", 1)
+    assert store.get(None, "profile") is None
+
+
+def test_shared_values_are_seen_by_other_stores(tmp_path):
+    path = str(tmp_path / "sessions.sqlite3")
+    first, second = SessionStore(shared_path=path), SessionStore(shared_path=path)
+
+    first.set("s1", "analysis", {"keywords": ["python"]})
+    assert second.get("s1", "analysis") == {"keywords": ["python"]}
+
+    # A newer version set elsewhere replaces what the memory tier holds
+    second.set("s1", "analysis", {"keywords": ["sql"]})
+    assert first.get("s1", "analysis") == {"keywords": ["sql"]}
+
+    first.clear("s1")
+    assert second.get("s1", "analysis") is None
+
+
+def test_shared_value_is_decoded_once_per_version(tmp_path, monkeypatch):
+    path = str(tmp_path / "sessions.sqlite3")
+    writer, reader = SessionStore(shared_path=path), SessionStore(shared_path=path)
+    writer.set("s1", "profile", {"summary": "a"})
+
+    decoded = []
+    decode = reader.codec.decode
+    monkeypatch.setattr(reader.codec, "decode", lambda raw: decoded.append(raw) or decode(raw))
+    for _ in range(3):
+        assert reader.get("s1", "profile") == {"summary": "a"}
+    assert len(decoded) == 1
+
+
+def test_shared_rows_expire_and_are_purged(tmp_path, clock):
+    path = str(tmp_path / "sessions.sqlite3")
+    store = SessionStore(ttl=10, shared_path=path, purge_interval=60)
+    store.set("s1", "profile", 1)
+
+    clock.now += 10
+    assert SessionStore(shared_path=path).get("s1", "profile") is None
+
+    clock.now += 60
+    store.set("s2", "profile", 2)
+    with store._connect() as db:
+        assert db.execute("SELECT session_id FROM session_state").fetchall() == [("s2",)]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_process_opens_its_own_connection(tmp_path):
+    store = SessionStore(shared_path=str(tmp_path / "sessions.sqlite3"))
+    store.set("s1", "profile", "parent")
+    with store._connect() as first, store._connect() as again:
+        assert first is again
+    parent_connection = store._local.connection[1]
+
+    pid = os.fork()
+    if pid == 0:
+        ok = False
+        try:
+            ok = store.get("s1", "profile") == "parent"
+            store.set("s1", "profile", "child")
+            connection_pid, connection = store._local.connection
+            ok = ok and connection_pid == os.getpid() and connection is not parent_connection
+        finally:
+            os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    assert store._local.connection[1] is parent_connection
+    assert store.get("s1", "profile") == "child"
@@ -83,4 +83,219 @@ class DatabaseManager:
             print(f"Error saving resume match: {e}")
             if self.connection:
                 self.connection.rollback()
-            return False
\ No newline at end of file
+            return False
+
+    def iter_job_descriptions(self, batch_size=500, status=None, only_unanalyzed=True):
+        """Stream job descriptions in batches using an unbuffered (server-side) cursor
+
+        The cursor holds the result set open on the server, so this connection
+        cannot be used for other statements until the generator is exhausted.
+        Errors are raised rather than ending the stream early, so a failed
+        read is never mistaken for the end of the catalog.
+        """
+        cursor = None
+        try:
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor(dictionary=True, buffered=False)
+            query = """SELECT jd.job_id, jd.job_description_text
+                       FROM job_descriptions jd
+                       LEFT JOIN job_requirements jr ON jr.job_id = jd.job_id"""
+            conditions = []
+            params = []
+            if status:
+                conditions.append("jd.status = %s")
+                params.append(status)
+            if only_unanalyzed:
+                conditions.append("(jr.text_hash IS NULL OR jr.text_hash <> SHA2(jd.job_description_text, 256))")
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY jd.job_id"
+            cursor.execute(query, tuple(params))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        except Exception as e:
+            print(f"Error streaming job descriptions: {e}")
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+
+    def save_job_requirements(self, requirements_rows):
+        """Upsert a batch of analyzed job requirements in one round trip"""
+        try:
+            if not requirements_rows:
+                return True
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor()
+            query = """INSERT INTO job_requirements (job_id, keywords, required_skills, preferred_skills,
+                      experience_level, experience_years, education_requirements, key_responsibilities, text_hash)
+                      VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                      ON DUPLICATE KEY UPDATE keywords = VALUES(keywords),
+                      required_skills = VALUES(required_skills), preferred_skills = VALUES(preferred_skills),
+                      experience_level = VALUES(experience_level), experience_years = VALUES(experience_years),
+                      education_requirements = VALUES(education_requirements),
+                      key_responsibilities = VALUES(key_responsibilities), text_hash = VALUES(text_hash)"""
+            cursor.executemany(query, [(
+                row['job_id'],
+                json.dumps(row.get('keywords', [])),
+                json.dumps(row.get('required_skills', [])),
+                json.dumps(row.get('preferred_skills', [])),
+                row.get('experience_level', ''),
+                row.get('experience_years'),
+                row.get('education_requirements', ''),
+                json.dumps(row.get('key_responsibilities', [])),
+                row['text_hash']
+            ) for row in requirements_rows])
+            self.connection.commit()
+            cursor.close()
+            return True
+        except Exception as e:
+            print(f"Error saving job requirements: {e}")
+            if self.connection:
+                self.connection.rollback()
+            return False
+
+    def get_job_requirements(self, status='active'):
+        """Fetch pre-analyzed requirements joined with their job postings"""
+        try:
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor(dictionary=True)
+            query = """SELECT jd.job_id, jd.job_title, jd.company_name, jd.location,
+                      jr.required_skills, jr.preferred_skills, jr.experience_level,
+                      jr.experience_years, jr.education_requirements
+                      FROM job_requirements jr
+                      JOIN job_descriptions jd ON jd.job_id = jr.job_id"""
+            params = ()
+            if status:
+                query += " WHERE jd.status = %s"
+                params = (status,)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            cursor.close()
+            for row in rows:
+                for field in ('required_skills', 'preferred_skills'):
+                    row[field] = json.loads(row[field]) if row[field] else []
+            return rows
+        except Exception as e:
+            print(f"Error fetching job requirements: {e}")
+            return []
+
+    def get_job_postings(self, job_ids):
+        """Fetch job descriptions by id, with their stored analysis when it is still current
+
+        Returns None when the database cannot be read, so an outage is not mistaken for unknown ids.
+        """
+        try:
+            if not job_ids:
+                return []
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor(dictionary=True)
+            placeholders = ", ".join(["%s"] * len(job_ids))
+            query = f"""SELECT jd.job_id, jd.job_title, jd.company_name, jd.job_description_text,
+                       jr.keywords, jr.required_skills, jr.preferred_skills, jr.experience_level,
+                       jr.education_requirements, jr.key_responsibilities,
+                       jr.text_hash = SHA2(jd.job_description_text, 256) AS analysis_current
+                       FROM job_descriptions jd
+                       LEFT JOIN job_requirements jr ON jr.job_id = jd.job_id
+                       WHERE jd.job_id IN ({placeholders})"""
+            cursor.execute(query, tuple(job_ids))
+            rows = cursor.fetchall()
+            cursor.close()
+            for row in rows:
+                row['analysis_current'] = bool(row['analysis_current'])
+                for field in ('keywords', 'required_skills', 'preferred_skills', 'key_responsibilities'):
+                    row[field] = json.loads(row[field]) if row[field] else []
+            return rows
+        except Exception as e:
+            print(f"Error fetching job postings: {e}")
+            return None
+
+    def update_job_description_text(self, job_id, job_description_text):
+        """Replace the text of an existing job description"""
+        try:
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "UPDATE job_descriptions SET job_description_text = %s WHERE job_id = %s",
+                (job_description_text, job_id)
+            )
+            self.connection.commit()
+            updated = cursor.rowcount > 0
+            cursor.close()
+            return updated
+        except Exception as e:
+            print(f"Error updating job description: {e}")
+            if self.connection:
+                self.connection.rollback()
+            return False
+
+    def get_resume_matches_with_skills(self, job_id, skills):
+        """Fetch stored matches for a job whose resume skills overlap the given skills; None on error"""
+        try:
+            if not skills:
+                return []
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor(dictionary=True)
+            query = """SELECT resume_id, match_score, skill_match_percentage, resume_skills
+                      FROM resume_matches
+                      WHERE job_id = %s AND JSON_OVERLAPS(resume_skills, CAST(%s AS JSON))"""
+            cursor.execute(query, (job_id, json.dumps(sorted(skills))))
+            rows = cursor.fetchall()
+            cursor.close()
+            for row in rows:
+                row['resume_skills'] = json.loads(row['resume_skills']) if row['resume_skills'] else []
+            return rows
+        except Exception as e:
+            print(f"Error fetching resume matches: {e}")
+            return None
+
+    def update_resume_match_skills(self, job_id, job_skills, rescored_matches, affected_skills):
+        """Apply a job skill change to stored matches in one transaction
+
+        Rescored rows get new scores and skill lists. Every other row for the job
+        shares no skill with ``affected_skills``, so its score is unchanged and its
+        missing skills are simply the new job skills it lacks.
+        """
+        try:
+            if not self.connection:
+                self.connect()
+            cursor = self.connection.cursor()
+            if rescored_matches:
+                cursor.executemany(
+                    """UPDATE resume_matches SET match_score = %s, skill_match_percentage = %s,
+                       matching_skills = %s, missing_skills = %s, job_skills = %s
+                       WHERE resume_id = %s AND job_id = %s""",
+                    [(
+                        row['match_score'], row['skill_match_percentage'],
+                        json.dumps(row['matching_skills']), json.dumps(row['missing_skills']),
+                        json.dumps(job_skills), row['resume_id'], job_id
+                    ) for row in rescored_matches]
+                )
+            job_skills_json = json.dumps(job_skills)
+            cursor.execute(
+                """UPDATE resume_matches SET job_skills = CAST(%s AS JSON),
+                   missing_skills = (
+                       SELECT COALESCE(JSON_ARRAYAGG(js.skill), JSON_ARRAY())
+                       FROM JSON_TABLE(CAST(%s AS JSON), '$[*]' COLUMNS (skill VARCHAR(255) PATH '$')) js
+                       WHERE NOT JSON_CONTAINS(resume_matches.resume_skills, JSON_QUOTE(js.skill))
+                   )
+                   WHERE job_id = %s AND NOT JSON_OVERLAPS(resume_skills, CAST(%s AS JSON))""",
+                (job_skills_json, job_skills_json, job_id, json.dumps(sorted(affected_skills)))
+            )
+            self.connection.commit()
+            cursor.close()
+            return True
+        except Exception as e:
+            print(f"Error updating resume matches: {e}")
+            if self.connection:
+                self.connection.rollback()
+            return False
@@ -0,0 +1,117 @@
+import sys
+import os
+import hashlib
+import time
+from multiprocessing import Pool
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    from ..models.job_analyzer import JobAnalyzer
+    from ..database.db_manager import DatabaseManager
+except ImportError as e:
+    print(f"Error importing catalog modules: {e}")
+    print(f"Current working directory: {os.getcwd()}")
+    print(f"Python path: {sys.path}")
+    raise
+
+# Per-process analyzer, created once by the pool initializer
+_worker_analyzer = None
+
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = JobAnalyzer()
+
+
+def analyze_job_row(row):
+    """Analyze a single job_descriptions row into a job_requirements row"""
+    analyzer = _worker_analyzer or JobAnalyzer()
+    text = row.get('job_description_text') or ''
+    requirements = analyzer.identify_requirements(text)
+    return {
+        'job_id': row['job_id'],
+        'keywords': analyzer.extract_keywords(text),
+        'required_skills': requirements['required_skills'],
+        'preferred_skills': requirements['preferred_skills'],
+        'experience_level': requirements['experience_level'],
+        'experience_years': analyzer.extract_experience_years(requirements['experience_level']),
+        'education_requirements': requirements['education_requirements'],
+        'key_responsibilities': requirements['key_responsibilities'],
+        'text_hash': hashlib.sha256(text.encode('utf-8')).hexdigest()
+    }
+
+
+class CatalogIntegration:
+    """Pre-analyzes the job_descriptions catalog into structured job_requirements rows"""
+
+    def __init__(self, workers=None, batch_size=500):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+
+    def analyze_catalog(self, status=None, reanalyze_all=False):
+        """Stream job descriptions through a process pool and store their requirements
+
+        Rows are read with a server-side cursor on one connection and written in
+        batches on another, so memory stays bounded by a couple of batches.
+        Analysis of batch N overlaps with the database write of batch N-1.
+        """
+        reader = DatabaseManager()
+        writer = DatabaseManager()
+        analyzed = 0
+        failed = 0
+        started = time.perf_counter()
+
+        try:
+            if not reader.connect() or not writer.connect():
+                return {
+                    'success': False,
+                    'message': 'Database connection failed',
+                    'data': None,
+                    'errors': ['Could not connect to database']
+                }
+
+            chunksize = max(1, self.batch_size // (self.workers * 4))
+            with Pool(self.workers, initializer=_init_worker) as pool:
+                pending = None
+                batches = reader.iter_job_descriptions(
+                    batch_size=self.batch_size,
+                    status=status,
+                    only_unanalyzed=not reanalyze_all
+                )
+                for rows in batches:
+                    next_pending = pool.map_async(analyze_job_row, rows, chunksize)
+                    if pending is not None:
+                        analyzed, failed = self._store_batch(writer, pending.get(), analyzed, failed)
+                    pending = next_pending
+                if pending is not None:
+                    analyzed, failed = self._store_batch(writer, pending.get(), analyzed, failed)
+
+            elapsed = time.perf_counter() - started
+            return {
+                'success': failed == 0,
+                'message': f'Analyzed {analyzed} job descriptions in {elapsed:.2f}s',
+                'data': {
+                    'analyzed': analyzed,
+                    'failed': failed,
+                    'workers': self.workers,
+                    'elapsed_seconds': round(elapsed, 3)
+                },
+                'errors': [f'{failed} job requirements failed to save'] if failed else []
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': 'Error analyzing job catalog',
+                'data': None,
+                'errors': [str(e)]
+            }
+        finally:
+            reader.disconnect()
+            writer.disconnect()
+
+    def _store_batch(self, writer, rows, analyzed, failed):
+        """Write one analyzed batch and update the running counters"""
+        if writer.save_job_requirements(rows):
+            return analyzed + len(rows), failed
+        return analyzed, failed + len(rows)
@@ -0,0 +1,110 @@
+import os
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from .hr_integration import _init_match_worker
+from .jobseeker_integration import POOL_CONTEXT, _init_batch_worker, _init_export_worker, _init_generate_worker
+
+
+def _init_cpu_worker(cache_dir, max_bytes):
+    """Load every pooled stage's models once per pool process"""
+    _init_match_worker()
+    _init_generate_worker()
+    _init_batch_worker()
+    _init_export_worker(cache_dir, max_bytes)
+
+
+def default_workers():
+    """Pool processes per server process: the cores shared out among the server's worker processes
+
+    Every server process gets a pool of its own, and gunicorn.conf.py starts
+    WEB_CONCURRENCY of them, one per core unless it is set.
+    """
+    cores = os.cpu_count() or 1
+    server_workers = int(os.environ.get('WEB_CONCURRENCY') or 0) or cores
+    return max(1, cores // server_workers)
+
+
+class CpuPool:
+    """The one process pool of a server process, for all of its CPU-bound work
+
+    Match scoring, resume generation and document rendering hold the GIL,
+    so under threads they run one at a time however many cores there are.
+    Run here, by async requests, batch generation, ZIP exports and
+    background exports alike, they run in the pool's processes (the
+    server's share of the cores by default, see default_workers) in
+    parallel, while the requesting thread waits without holding the GIL
+    and the server's other threads carry on. The pool starts on
+    first use in the process that uses it, so a preforking server's master
+    never starts one and each forked worker gets its own. Its processes
+    come from a fork server rather than forking the threaded server, and
+    a pool broken by a process that died is replaced on the next request.
+    """
+
+    def __init__(self, cache_dir, max_bytes, workers=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.workers = workers or default_workers()
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    async def run(self, fn, *args):
+        """Run fn(*args) in a pool process, suspending the calling coroutine until it returns"""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def submit(self, fn, *args):
+        """Start fn(*args) in a pool process, returning its Future"""
+        executor = self.executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._discard(executor)
+            raise
+        future.add_done_callback(partial(self._check_broken, executor))
+        return future
+
+    def map_unordered(self, fn, items):
+        """Yield fn(item) for every item as each finishes; items not yet started are dropped if abandoned"""
+        futures = [self.submit(fn, item) for item in items]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _check_broken(self, executor, future):
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            # A pool process died (killed, out of memory); the executor refuses all work from now on
+            self._discard(executor)
+
+    def executor(self):
+        """This process's executor, started on first use"""
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    self.workers,
+                    mp_context=POOL_CONTEXT,
+                    initializer=_init_cpu_worker,
+                    initargs=(self.cache_dir, self.max_bytes)
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _discard(self, executor):
+        """Drop a broken executor, unless another request already replaced it"""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown()
+            self._executor = None
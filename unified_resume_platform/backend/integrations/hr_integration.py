@@ -1,10 +1,16 @@
 import sys
 import os
+import asyncio
+import hashlib
+import time
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 try:
     from ..models.matching_engine import ResumeMatcher
+    from ..models.resume_cache import ResumeCache
+    from ..models.stage_costs import StageCosts, parse_time_budget
+    from ..models.incremental_analyzer import IncrementalJobAnalyzer
     from ..database.db_manager import DatabaseManager
 except ImportError as e:
     print(f"Error importing HR modules: {e}")
@@ -12,10 +18,51 @@ except ImportError as e:
     print(f"Python path: {sys.path}")
     raise
 
+# Per-process matcher for offloaded scoring, created once by the pool initializer
+_worker_matcher = None
+
+
+def _init_match_worker():
+    global _worker_matcher
+    _worker_matcher = ResumeMatcher()
+
+
+# Priors for match stage costs as (fixed seconds, seconds per unit) until requests are observed.
+# preprocess and tfidf are per input character; save and offload per request.
+MATCH_STAGE_PRIORS = {
+    'preprocess': (0.0002, 1e-6),
+    'tfidf': (0.002, 3e-7),
+    'save': (0.02, 0.0),
+    'offload': (0.001, 0.0)
+}
+
+
+def score_match(resume_text, job_description, matcher=None):
+    """Full match analysis of a resume against a job description; the CPU-bound part of analyze_match
+
+    Returns (analysis, seconds spent per stage).
+    """
+    timings = {}
+    analysis = (matcher or _worker_matcher or ResumeMatcher()).get_match_analysis(
+        resume_text, job_description, timings
+    )
+    return analysis, timings
+
+
 class HRIntegration:
     def __init__(self):
         self.matcher = ResumeMatcher()
         self.db_manager = DatabaseManager()
+        self.job_analyzer = IncrementalJobAnalyzer(skill_extractor=self.matcher.extract_skills)
+        # Full analyses by resume and job text (ResumeCache is a plain keyed LRU)
+        self.match_cache = ResumeCache(max_entries=256)
+        self.match_costs = StageCosts(MATCH_STAGE_PRIORS)
+    
+    def warm_up(self):
+        """Load what matching otherwise loads on first use: NLTK tokenizer and lemmatizer data, compiled patterns"""
+        job_description = "Required: 3+ years of Python and SQL.\n\nPreferred: AWS, Docker. Bachelor degree."
+        self.matcher.get_match_analysis("Python developer working with SQL, Docker and AWS", job_description)
+        self.job_analyzer.job_analyzer.identify_requirements(job_description)
     
     def get_resumes_from_db(self):
         """Fetch all resumes from database"""
@@ -77,68 +124,291 @@ class HRIntegration:
             print(f"Error fetching job description: {e}")
             return None
 
-    def analyze_match(self, resume_text, job_description):
+    def analyze_match(self, resume_text, job_description, time_budget_ms=None):
+        """Score a resume against a job description
+
+        With time_budget_ms, a match whose full scoring (preprocessing and
+        TF-IDF) is estimated to overrun the budget gets the full analysis
+        of an earlier identical request if one is cached, or else a
+        skills-only analysis flagged as degraded. The database save is
+        skipped when the budget has no room left for it.
+        """
+        try:
+            if not resume_text or not job_description:
+                return self._missing_match_input()
+
+            budget = parse_time_budget(time_budget_ms)
+            started = time.perf_counter()
+            key, analysis, mode = self._plan_match(resume_text, job_description, budget)
+            if mode == 'full':
+                analysis, timings = score_match(resume_text, job_description, self.matcher)
+                self._observe_scoring(resume_text, job_description, timings)
+                self.match_cache.put(key, analysis)
+                if self._time_to_save(started, budget):
+                    with self.match_costs.timed('save'):
+                        self._save_match(resume_text, job_description, analysis)
+            elif mode == 'skills_only':
+                analysis = self.matcher.get_skills_analysis(resume_text, job_description)
+
+            return self._match_result(analysis, mode, started, budget)
+        except Exception as e:
+            return {
+                'success': False,
+                'message': 'Error analyzing match',
+                'data': None,
+                'errors': [str(e)]
+            }
+
+    async def analyze_match_async(self, resume_text, job_description, cpu_pool, time_budget_ms=None):
+        """analyze_match with scoring in the shared CPU pool and the database writes on a thread"""
         try:
             if not resume_text or not job_description:
+                return self._missing_match_input()
+
+            budget = parse_time_budget(time_budget_ms)
+            started = time.perf_counter()
+            key, analysis, mode = self._plan_match(resume_text, job_description, budget, offloaded=True)
+            if mode == 'full':
+                analysis, timings = await cpu_pool.run(score_match, resume_text, job_description)
+                self._observe_scoring(resume_text, job_description, timings)
+                self.match_costs['offload'].observe(time.perf_counter() - started - sum(timings.values()))
+                self.match_cache.put(key, analysis)
+                if self._time_to_save(started, budget):
+                    with self.match_costs.timed('save'):
+                        await asyncio.to_thread(self._save_match, resume_text, job_description, analysis)
+            elif mode == 'skills_only':
+                analysis = self.matcher.get_skills_analysis(resume_text, job_description)
+
+            return self._match_result(analysis, mode, started, budget)
+        except Exception as e:
+            return {
+                'success': False,
+                'message': 'Error analyzing match',
+                'data': None,
+                'errors': [str(e)]
+            }
+
+    def _plan_match(self, resume_text, job_description, budget, offloaded=False):
+        """(cache key, cached analysis, mode) where mode is 'cached', 'full' or 'skills_only'
+
+        Full scoring is always chosen without a budget, so every such
+        request stores its match. Otherwise, when full scoring is estimated
+        to exceed the budget, a cached analysis is served if there is one,
+        and skills-only scoring if not.
+        """
+        key = hashlib.sha256(f"{resume_text}\0{job_description}".encode('utf-8')).hexdigest()
+        if budget is None:
+            return key, None, 'full'
+
+        chars = len(resume_text) + len(job_description)
+        estimate = self.match_costs.estimate(preprocess=chars, tfidf=chars, offload=int(offloaded))
+        if estimate <= budget:
+            return key, None, 'full'
+        analysis = self.match_cache.get(key)
+        if analysis is not None:
+            return key, analysis, 'cached'
+        return key, None, 'skills_only'
+
+    def _observe_scoring(self, resume_text, job_description, timings):
+        chars = len(resume_text) + len(job_description)
+        for stage, seconds in timings.items():
+            self.match_costs[stage].observe(seconds, chars)
+
+    def _time_to_save(self, started, budget):
+        """Whether the database save still fits the time budget (always, without one)"""
+        if budget is None:
+            return True
+        return time.perf_counter() - started + self.match_costs.estimate(save=1) <= budget
+
+    def _match_result(self, analysis, mode, started, budget):
+        elapsed = time.perf_counter() - started
+        degraded = mode == 'skills_only'
+        self.match_costs.record(mode, degraded, elapsed, budget)
+        return {
+            'success': True,
+            'message': 'Skills-only match analysis completed within the time budget' if degraded
+                       else 'Match analysis completed successfully',
+            'data': dict(analysis, degraded=degraded, scoring_mode=mode, elapsed_ms=round(elapsed * 1000, 2)),
+            'errors': []
+        }
+
+    def _missing_match_input(self):
+        return {
+            'success': False,
+            'message': 'Resume and job description are required',
+            'data': None,
+            'errors': ['Missing required input']
+        }
+
+    def _save_match(self, resume_text, job_description, analysis):
+        """Record a match analysis in the database (optional - won't fail if DB is unavailable)"""
+        try:
+            if self.db_manager.connect():
+                resume_id = self.db_manager.save_resume(resume_text)
+                job_id = self.db_manager.save_job_description('Analyzed Job', 'Company', job_description)
+
+                if resume_id and job_id:
+                    match_details = {
+                        'matching_skills': analysis.get('matching_skills', []),
+                        'missing_skills': analysis.get('missing_skills', []),
+                        'resume_skills': analysis.get('resume_skills', []),
+                        'jd_skills': analysis.get('jd_skills', [])
+                    }
+                    self.db_manager.save_resume_match(
+                        resume_id,
+                        job_id,
+                        analysis.get('match_score', 0),
+                        analysis.get('skill_match_percentage', 0),
+                        match_details
+                    )
+
+                    for skill in analysis.get('resume_skills', []):
+                        skill_id = self.db_manager.save_skill(skill, 'technical')
+                        if skill_id:
+                            self.db_manager.link_resume_skill(resume_id, skill_id)
+
+                    for skill in analysis.get('jd_skills', []):
+                        skill_id = self.db_manager.save_skill(skill, 'technical')
+                        if skill_id:
+                            is_required = skill in analysis.get('missing_skills', [])
+                            self.db_manager.link_job_skill(job_id, skill_id, is_required)
+
+                self.db_manager.disconnect()
+        except Exception as db_error:
+            print(f"⚠ Database save failed (continuing without DB): {db_error}")
+
+    def update_job_description(self, job_id, job_description):
+        """Save an edited job description and incrementally refresh its analysis and matches
+
+        Stored matches are rescored on their skill term only: the content
+        similarity term (TF-IDF over the full texts) keeps the value it had
+        when the match was first computed, until the pair is matched again.
+        """
+        try:
+            if not job_description or not job_description.strip():
+                return {
+                    'success': False,
+                    'message': 'Job description is required',
+                    'data': None,
+                    'errors': ['Empty job description']
+                }
+
+            existing = self.get_job_description_by_id(job_id)
+            if not existing:
                 return {
                     'success': False,
-                    'message': 'Resume and job description are required',
+                    'message': 'Job description not found',
                     'data': None,
-                    'errors': ['Missing required input']
+                    'errors': [f'Job description with ID {job_id} not found']
                 }
 
-            analysis = self.matcher.get_match_analysis(resume_text, job_description)
+            started = time.perf_counter()
+            change = self.job_analyzer.reanalyze(existing['job_description_text'], job_description)
+            analysis = change['analysis']
 
-            # Try to save to database (optional - won't fail if DB is unavailable)
+            old_skills = set(change['previous_analysis']['jd_skills'])
+            new_skills = set(analysis['jd_skills'])
+            delta = set(change['added_skills']) | set(change['removed_skills'])
+            if not delta:
+                affected_skills = set()
+            elif len(old_skills) == len(new_skills):
+                # Same denominator: only resumes holding a changed skill see a new ratio
+                affected_skills = delta
+            else:
+                # New denominator: every resume with any job skill sees a new ratio
+                affected_skills = old_skills | new_skills
+
+            rescored = []
+            if not self.db_manager.connect():
+                return {
+                    'success': False,
+                    'message': 'Database connection failed',
+                    'data': None,
+                    'errors': ['Could not connect to database']
+                }
             try:
-                if self.db_manager.connect():
-                    resume_id = self.db_manager.save_resume(resume_text)
-                    job_id = self.db_manager.save_job_description('Analyzed Job', 'Company', job_description)
-
-                    if resume_id and job_id:
-                        match_details = {
-                            'matching_skills': analysis.get('matching_skills', []),
-                            'missing_skills': analysis.get('missing_skills', []),
-                            'resume_skills': analysis.get('resume_skills', []),
-                            'jd_skills': analysis.get('jd_skills', [])
-                        }
-                        self.db_manager.save_resume_match(
-                            resume_id,
-                            job_id,
-                            analysis.get('match_score', 0),
-                            analysis.get('skill_match_percentage', 0),
-                            match_details
-                        )
-
-                        for skill in analysis.get('resume_skills', []):
-                            skill_id = self.db_manager.save_skill(skill, 'technical')
-                            if skill_id:
-                                self.db_manager.link_resume_skill(resume_id, skill_id)
-
-                        for skill in analysis.get('jd_skills', []):
-                            skill_id = self.db_manager.save_skill(skill, 'technical')
-                            if skill_id:
-                                is_required = skill in analysis.get('missing_skills', [])
-                                self.db_manager.link_job_skill(job_id, skill_id, is_required)
-
-                    self.db_manager.disconnect()
-            except Exception as db_error:
-                print(f"⚠ Database save failed (continuing without DB): {db_error}")
+                # An unchanged text updates no rows, which the update reports as a failure
+                if (job_description != existing['job_description_text']
+                        and not self.db_manager.update_job_description_text(job_id, job_description)):
+                    return self._job_update_failed('Could not save the job description text')
+                if not self.db_manager.save_job_requirements([{
+                    'job_id': job_id,
+                    'keywords': analysis['keywords'],
+                    'required_skills': analysis['required_skills'],
+                    'preferred_skills': analysis['preferred_skills'],
+                    'experience_level': analysis['experience_level'],
+                    'experience_years': self.job_analyzer.job_analyzer.extract_experience_years(
+                        analysis['experience_level']
+                    ),
+                    'education_requirements': analysis['education_requirements'],
+                    'key_responsibilities': analysis['key_responsibilities'],
+                    'text_hash': hashlib.sha256(job_description.encode('utf-8')).hexdigest()
+                }]):
+                    return self._job_update_failed('Could not save the job requirements')
+                if affected_skills:
+                    matches = self.db_manager.get_resume_matches_with_skills(job_id, affected_skills)
+                    if matches is None:
+                        return self._job_update_failed('Could not load the stored matches')
+                    rescored = [self._rescore_match(match, new_skills) for match in matches]
+                    if not self.db_manager.update_resume_match_skills(
+                            job_id, sorted(new_skills), rescored, affected_skills):
+                        return self._job_update_failed('Could not rescore the stored matches')
+            finally:
+                self.db_manager.disconnect()
 
             return {
                 'success': True,
-                'message': 'Match analysis completed successfully',
-                'data': analysis,
+                'message': 'Job description updated successfully',
+                'data': {
+                    'job_id': job_id,
+                    'analysis': {key: value for key, value in analysis.items() if key != 'jd_skills'},
+                    'total_sections': change['total_sections'],
+                    'changed_sections': change['changed_sections'],
+                    'parsed_sections': change['parsed_sections'],
+                    'added_skills': change['added_skills'],
+                    'removed_skills': change['removed_skills'],
+                    'rescored_matches': len(rescored),
+                    'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+                },
                 'errors': []
             }
         except Exception as e:
             return {
                 'success': False,
-                'message': 'Error analyzing match',
+                'message': 'Error updating job description',
                 'data': None,
                 'errors': [str(e)]
             }
 
+    def _job_update_failed(self, error):
+        return {
+            'success': False,
+            'message': 'Error updating job description',
+            'data': None,
+            'errors': [error]
+        }
+
+    def _rescore_match(self, match, jd_skills):
+        """Recompute the skill component of a stored match against new job skills
+
+        The content similarity part of match_score is carried over as stored.
+        """
+        resume_skills = set(match['resume_skills'])
+        matching_skills = resume_skills & jd_skills
+        new_percentage = len(matching_skills) / len(jd_skills) * 100 if jd_skills else 0
+        old_percentage = float(match['skill_match_percentage'] or 0)
+
+        # match_score = 0.4 * content similarity + 0.6 * skill ratio; only the skill term moves
+        match_score = float(match['match_score']) + 0.6 * (new_percentage - old_percentage)
+
+        return {
+            'resume_id': match['resume_id'],
+            'match_score': round(max(match_score, 0.0), 2),
+            'skill_match_percentage': round(new_percentage, 2),
+            'matching_skills': sorted(matching_skills),
+            'missing_skills': sorted(jd_skills - resume_skills)
+        }
+
     def get_sample_data(self):
         """Get list of resumes and job descriptions from database instead of sample data"""
         try:
@@ -1,12 +1,27 @@
 import sys
 import os
+import asyncio
+import json
+import multiprocessing
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from datetime import datetime
+from functools import partial
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 try:
     from ..models.job_analyzer import JobAnalyzer
-    from ..models.profile_manager import ProfileManager
+    from ..models.profile_manager import ProfileManager, DEFAULT_PROFILE_ID
     from ..models.resume_generator import ResumeGenerator
+    from ..models.resume_cache import ResumeCache
+    from ..models.resume_renderer import ResumeRenderer, TEMPLATE_VERSION, new_docx, pdf_stylesheet, warm_documents
+    from ..models.artifact_cache import ArtifactCache
+    from ..models.job_recommender import JobRecommender
+    from ..models.session_store import SessionStore
+    from ..models.stage_costs import StageCosts, parse_time_budget
     from ..database.db_manager import DatabaseManager
 except ImportError as e:
     print(f"Error importing Job Seeker modules: {e}")
@@ -14,19 +29,385 @@ except ImportError as e:
     print(f"Python path: {sys.path}")
     raise
 
-class JobSeekerIntegration:
+# Error of profile requests for a profile saved by another session
+PROFILE_NOT_OWNED = 'Profile belongs to another session'
+
+# Error of batch requests naming stored jobs while the job database cannot be read
+JOB_DATABASE_UNAVAILABLE = 'Job database unavailable'
+
+EXPORT_CONTENT_TYPES = {
+    'txt': 'text/plain',
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+}
+
+# Priors for ranking stage costs as (fixed seconds, seconds per unit): index_load per
+# reload from the database, rank per indexed job
+RANKING_STAGE_PRIORS = {
+    'index_load': (0.05, 0.0),
+    'rank': (0.0005, 1e-6)
+}
+
+# Leading bytes of a genuine document; text fallbacks (missing libraries) are never cached
+DOCUMENT_SIGNATURES = {
+    'pdf': b'%PDF',
+    'docx': b'PK\x03\x04'
+}
+
+# Worker pools are started from a fork server rather than by forking this
+# process: a request thread may hold a lock when another forks, and the
+# child would inherit it held for good
+POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Per-process batch models (analyzer, generator), set by the pool initializer
+_batch_models = None
+
+# Per-process batch states (analyzer, generator, profile, prepared profile) of the latest batches, by batch id
+_batch_states = OrderedDict()
+BATCH_STATES_KEPT = 4
+
+
+def _init_batch_worker():
+    global _batch_models
+    _batch_models = (JobAnalyzer(), ResumeGenerator())
+
+
+def _prepare_batch_state(profile, models=None):
+    job_analyzer, resume_generator = models or (JobAnalyzer(), ResumeGenerator())
+    return job_analyzer, resume_generator, profile, resume_generator.prepare_profile(profile)
+
+
+def _worker_batch_state(batch_id, profile):
+    """A pool process's state for a batch, prepared with the first of the batch's jobs it receives"""
+    state = _batch_states.get(batch_id)
+    if state is None:
+        state = _batch_states[batch_id] = _prepare_batch_state(profile, _batch_models)
+        while len(_batch_states) > BATCH_STATES_KEPT:
+            _batch_states.popitem(last=False)
+    return state
+
+
+# Per-process generator for offloaded resume generation, set by the pool initializer
+_worker_generator = None
+
+
+def _init_generate_worker():
+    global _worker_generator
+    _worker_generator = ResumeGenerator()
+
+
+def build_resume(profile, analysis, resume_generator=None):
+    """Generate and format a resume tailored to a job analysis; the CPU-bound part of generate_resume"""
+    resume_generator = resume_generator or _worker_generator or ResumeGenerator()
+    resume_data = resume_generator.generate_resume(profile, analysis)
+    return {
+        'resume_data': resume_data,
+        'formatted_resume': resume_generator.format_resume(resume_data)
+    }
+
+
+def tailor_resume_for_job(job, state):
+    """Analyze one job (unless it arrives pre-analyzed) and tailor the batch profile to it"""
+    job_analyzer, resume_generator, profile, prepared_profile = state
+    started = time.perf_counter()
+    result = {
+        'job_id': job.get('job_id'),
+        'job_title': job.get('job_title', ''),
+        'company_name': job.get('company_name', '')
+    }
+    try:
+        analysis = job.get('analysis')
+        if analysis is None:
+            text = job.get('job_description') or ''
+            if not text.strip():
+                raise ValueError('Empty job description')
+            analysis = {
+                'keywords': job_analyzer.extract_keywords(text),
+                'relevance_score': 0.0,
+                **job_analyzer.identify_requirements(text)
+            }
+        analyzed = time.perf_counter()
+
+        resume_data = resume_generator.generate_resume(profile, analysis, prepared_profile)
+        formatted_resume = resume_generator.format_resume(resume_data)
+        finished = time.perf_counter()
+
+        result.update({
+            'success': True,
+            'analysis': analysis,
+            'resume_data': resume_data,
+            'formatted_resume': formatted_resume,
+            'timing_ms': {
+                'analysis': round((analyzed - started) * 1000, 2),
+                'generation': round((finished - analyzed) * 1000, 2),
+                'total': round((finished - started) * 1000, 2)
+            },
+            'error': None
+        })
+    except Exception as e:
+        result.update({
+            'success': False,
+            'timing_ms': {'total': round((time.perf_counter() - started) * 1000, 2)},
+            'error': str(e)
+        })
+    return result
+
+
+def generate_pdf(content, blocks=None, renderer=None):
+    """Generate PDF content, from blocks when given (renderer required) or by parsing content"""
+    if blocks is not None:
+        try:
+            return renderer.render_pdf(blocks)
+        except ImportError:
+            # Fallback to text if reportlab not available
+            return "".join(renderer.stream_text(blocks)).encode('utf-8')
+        except Exception as e:
+            print(f"PDF generation error: {e}")
+            return "".join(renderer.stream_text(blocks)).encode('utf-8')
+
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        from io import BytesIO
+
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        styles = pdf_stylesheet()
+        story = []
+
+        # Split content into paragraphs
+        paragraphs = content.split('\n\n')
+        for para in paragraphs:
+            if para.strip():
+                # Check if it's a header (all caps or starts with specific patterns)
+                if para.isupper() or para.startswith('=') or para.startswith('-'):
+                    story.append(Paragraph(para.strip(), styles['Heading2']))
+                else:
+                    story.append(Paragraph(para.strip(), styles['Normal']))
+                story.append(Spacer(1, 12))
+
+        doc.build(story)
+        buffer.seek(0)
+        return buffer.getvalue()
+    except ImportError:
+        # Fallback to text if reportlab not available
+        return content.encode('utf-8')
+    except Exception as e:
+        print(f"PDF generation error: {e}")
+        return content.encode('utf-8')
+
+def generate_docx(content, blocks=None, renderer=None):
+    """Generate DOCX content, from blocks when given (renderer required) or by parsing content"""
+    if blocks is not None:
+        try:
+            return renderer.render_docx(blocks)
+        except ImportError:
+            # Fallback to text if python-docx not available
+            return "".join(renderer.stream_text(blocks)).encode('utf-8')
+        except Exception as e:
+            print(f"DOCX generation error: {e}")
+            return "".join(renderer.stream_text(blocks)).encode('utf-8')
+
+    try:
+        from io import BytesIO
+
+        doc = new_docx()
+
+        # Split content into paragraphs
+        paragraphs = content.split('\n\n')
+        for para in paragraphs:
+            para = para.strip()
+            if not para:
+                continue
+
+            # Check if it's a header
+            if para.isupper() or para.startswith('=') or para.startswith('-'):
+                doc.add_heading(para.replace('=', '').replace('-', '').strip(), level=2)
+            else:
+                doc.add_paragraph(para)
+
+        buffer = BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
+        return buffer.getvalue()
+    except ImportError:
+        # Fallback to text if python-docx not available
+        return content.encode('utf-8')
+    except Exception as e:
+        print(f"DOCX generation error: {e}")
+        return content.encode('utf-8')
+
+
+def generate_document(format_type, content, blocks=None, renderer=None):
+    """Render a PDF or DOCX export; falls back to plain text bytes when the library is missing"""
+    if format_type == 'pdf':
+        return generate_pdf(content, blocks, renderer)
+    return generate_docx(content, blocks, renderer)
+
+
+def export_source(content, blocks=None):
+    """What an export is rendered from, as hashed into its artifact cache key"""
+    if blocks is not None:
+        return 'blocks:' + json.dumps(blocks, ensure_ascii=False)
+    return 'text:' + content
+
+
+def store_document(artifact_cache, key, format_type, file_data):
+    """Cache a rendered document, returning (file_data, file_path) with exactly one of them set
+
+    Text fallbacks are returned as bytes and never cached.
+    """
+    if not file_data.startswith(DOCUMENT_SIGNATURES[format_type]):
+        return file_data, None
+    try:
+        return None, artifact_cache.put(key, format_type, file_data)
+    except OSError as e:
+        print(f"Export cache write error: {e}")
+        return file_data, None
+
+
+def export_document(artifact_cache, renderer, format_type, content, blocks=None):
+    """Return (file_data, file_path) for a PDF or DOCX export, served from the artifact cache when possible
+
+    Exactly one of the two is set: a path for documents that are cached
+    on disk, bytes for text fallbacks that must not be cached.
+    """
+    key = artifact_cache.key(export_source(content, blocks), format_type, TEMPLATE_VERSION)
+
+    file_path = artifact_cache.get(key, format_type)
+    if file_path:
+        return None, file_path
+
+    file_data = generate_document(format_type, content, blocks, renderer)
+    return store_document(artifact_cache, key, format_type, file_data)
+
+
+# Per-process export state (renderer, artifact cache), set by the pool initializer
+_export_state = None
+
+
+def _init_export_worker(cache_dir, max_bytes):
+    global _export_state
+    warm_documents()
+    _export_state = (ResumeRenderer(), ArtifactCache(cache_dir, max_bytes))
+
+
+def render_export_job(format_type, key, content, blocks):
+    """Render one export in a worker and write it straight into the artifact cache"""
+    renderer, artifact_cache = _export_state
+    file_data = generate_document(format_type, content, blocks, renderer)
+    file_data, file_path = store_document(artifact_cache, key, format_type, file_data)
+    return {'file_data': file_data, 'file_path': file_path}
+
+
+def export_batch_job(job, formats, state, export_state=None):
+    """Tailor the batch profile to one job and render it in each format
+
+    Documents are written into the artifact cache and returned as paths, so
+    only small results travel back from the worker.
+    """
+    result = tailor_resume_for_job(job, state)
+    files = []
+    if result['success']:
+        renderer, artifact_cache = export_state or _export_state
+        content = result['formatted_resume']
+        blocks = renderer.build_blocks(result['resume_data'])
+        for format_type in formats:
+            if format_type == 'txt':
+                files.append((format_type, content.encode('utf-8'), None))
+            else:
+                files.append((format_type,) + export_document(artifact_cache, renderer, format_type, content, blocks))
+    return {
+        'index': job.get('index'),
+        'job_id': result['job_id'],
+        'job_title': result['job_title'],
+        'company_name': result['company_name'],
+        'success': result['success'],
+        'error': result['error'],
+        'files': files
+    }
+
+
+def tailor_batch_job(batch_id, profile, job):
+    """tailor_resume_for_job in a batch pool process"""
+    return tailor_resume_for_job(job, _worker_batch_state(batch_id, profile))
+
+
+def export_batch_pool_job(batch_id, profile, formats, job):
+    """export_batch_job in a batch pool process"""
+    return export_batch_job(job, formats, _worker_batch_state(batch_id, profile))
+
+
+class _ZipSink:
+    """Write-only stream for zipfile; what the archive writes is drained chunk by chunk
+
+    It has no tell() or seek(), so zipfile writes sizes in data descriptors
+    after each member instead of seeking back, and nothing is held beyond
+    the chunks written since the last drain.
+    """
+
     def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class JobSeekerIntegration:
+    def __init__(self, cpu_pool_workers=None):
         # Set correct data directory path for job seeker models
         data_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
         
         self.job_analyzer = JobAnalyzer()
         self.profile_manager = ProfileManager(data_dir)
         self.resume_generator = ResumeGenerator()
+        self.resume_cache = ResumeCache(max_entries=128)
+        shared_path = os.path.join(data_dir, 'sessions.sqlite3')
+        # Generated resumes by resume ID (handle), so any worker process can export them
+        self.resume_handles = SessionStore(max_entries=128, ttl=3600, shared_path=shared_path)
+        # Block layouts of exported resumes by resume ID, built once per process
+        self.resume_blocks = ResumeCache(max_entries=128)
+        self.artifact_cache = ArtifactCache(os.path.join(data_dir, 'export_cache'))
+        self.export_job_ttl = 600  # Seconds a submitted export stays downloadable
+        # Background export jobs by job ID, shared so any worker can report on and serve them
+        self.export_jobs = SessionStore(max_entries=1024, ttl=self.export_job_ttl, shared_path=shared_path)
+        # Imported here: cpu_pool imports this module's worker initializers
+        from .cpu_pool import CpuPool
+        # This server process's one pool, for batches, exports and (with ASYNC_OFFLOAD) request stages
+        self.cpu_pool = CpuPool(self.artifact_cache.cache_dir, self.artifact_cache.max_bytes, cpu_pool_workers)
         self.db_manager = DatabaseManager()
-        self.current_analysis = None
-        self.current_profile = None
+        self.job_recommender = JobRecommender(self.job_analyzer)
+        self.job_index_ttl = 300  # Seconds before the job index is reloaded
+        # Each profile's latest ranking by (profile, top_k), with the index version it was ranked on
+        self.ranking_cache = ResumeCache(max_entries=256)
+        self.ranking_costs = StageCosts(RANKING_STAGE_PRIORS)
+        self.batch_max_jobs = 50
+        # Smaller batches run in-process: at 1-2 ms a job they finish sooner than they would
+        # queued behind other requests' work in the shared pool
+        self.batch_parallel_threshold = 8
+        self.zip_chunk_size = 64 * 1024  # Bytes read per step when copying an export into a ZIP stream
+        # Each user's current profile and job analysis, shared by every worker process
+        self.sessions = SessionStore(ttl=3600, shared_path=shared_path)
+
+    def warm_up(self):
+        """Load what analysis and export otherwise load on first use: compiled patterns, document bases"""
+        job_description = "Required: 3+ years of Python and SQL.\n\nPreferred: AWS, Docker. Bachelor degree."
+        self.job_analyzer.extract_keywords(job_description)
+        self.job_analyzer.identify_requirements(job_description)
+        warm_documents()
 
-    def analyze_job(self, job_description):
+    def analyze_job(self, job_description, session_id=None):
         try:
             if not job_description.strip():
                 return {
@@ -45,7 +426,7 @@ class JobSeekerIntegration:
                 **requirements
             }
 
-            self.current_analysis = analysis
+            self.sessions.set(session_id, 'analysis', analysis)
 
             # Database saving is optional for job analysis
             # Removed to keep the system simple and focused
@@ -64,13 +445,24 @@ class JobSeekerIntegration:
                 'errors': [str(e)]
             }
     
-    def get_profile(self):
-        """Get current profile data"""
+    def get_profile(self, profile_id=None, session_id=None):
+        """Get current profile data
+
+        With a session_id, only a profile saved by that session is returned;
+        the same goes for create_profile and update_profile.
+        """
         try:
-            profile = self.profile_manager.load_profile()
+            profile_id = profile_id or DEFAULT_PROFILE_ID
+            if not self.profile_manager.is_valid_profile_id(profile_id):
+                return self._invalid_profile_id()
             
+            profile = self.profile_manager.load_profile(profile_id)
+            
+            if profile and not self._owns_profile(profile, session_id):
+                return self._profile_not_owned()
             if profile:
-                self.current_profile = profile
+                profile.pop('owner', None)
+                self.sessions.set(session_id, 'profile', profile)
                 return {
                     'success': True,
                     'message': 'Profile loaded successfully',
@@ -92,9 +484,13 @@ class JobSeekerIntegration:
                 'errors': [str(e)]
             }
     
-    def create_profile(self, profile_data):
+    def create_profile(self, profile_data, profile_id=None, session_id=None):
         """Create a new profile"""
         try:
+            profile_id = profile_id or DEFAULT_PROFILE_ID
+            if not self.profile_manager.is_valid_profile_id(profile_id):
+                return self._invalid_profile_id()
+            
             # Validate profile data
             errors = self.profile_manager.validate_profile(profile_data)
             if errors:
@@ -105,9 +501,15 @@ class JobSeekerIntegration:
                     'errors': errors
                 }
             
-            success = self.profile_manager.create_profile(profile_data)
+            existing = self.profile_manager.load_profile(profile_id)
+            if existing and not self._owns_profile(existing, session_id):
+                return self._profile_not_owned()
+            
+            # Validated above; the manager need not check it again
+            success = self.profile_manager.create_profile(profile_data, profile_id, validate=False, owner=session_id)
             if success:
-                self.current_profile = profile_data
+                profile_data.pop('owner', None)
+                self.sessions.set(session_id, 'profile', profile_data)
                 return {
                     'success': True,
                     'message': 'Profile created successfully',
@@ -129,9 +531,13 @@ class JobSeekerIntegration:
                 'errors': [str(e)]
             }
     
-    def update_profile(self, profile_data):
+    def update_profile(self, profile_data, profile_id=None, session_id=None):
         """Update existing profile"""
         try:
+            profile_id = profile_id or DEFAULT_PROFILE_ID
+            if not self.profile_manager.is_valid_profile_id(profile_id):
+                return self._invalid_profile_id()
+            
             # Validate profile data
             errors = self.profile_manager.validate_profile(profile_data)
             if errors:
@@ -142,9 +548,15 @@ class JobSeekerIntegration:
                     'errors': errors
                 }
             
-            success = self.profile_manager.update_profile(profile_data)
+            existing = self.profile_manager.load_profile(profile_id)
+            if existing and not self._owns_profile(existing, session_id):
+                return self._profile_not_owned()
+            
+            # Validated above; the manager need not check it again
+            success = self.profile_manager.update_profile(profile_data, profile_id, validate=False, owner=session_id)
             if success:
-                self.current_profile = profile_data
+                profile_data.pop('owner', None)
+                self.sessions.set(session_id, 'profile', profile_data)
                 return {
                     'success': True,
                     'message': 'Profile updated successfully',
@@ -184,14 +596,105 @@ class JobSeekerIntegration:
                 'errors': [str(e)]
             }
     
-    def generate_resume(self, profile=None, analysis=None):
-        """Generate tailored resume"""
+    def generate_resume(self, profile=None, analysis=None, session_id=None):
+        """Generate tailored resume, defaulting to the session's current profile and job analysis"""
         try:
             if not profile:
-                profile = self.current_profile
+                profile = self.sessions.get(session_id, 'profile')
             if not analysis:
-                analysis = self.current_analysis
+                analysis = self.sessions.get(session_id, 'analysis')
+            
+            missing = self._missing_generation_input(profile, analysis)
+            if missing:
+                return missing
             
+            cache_key = self.resume_cache.key(profile, analysis)
+            generated = self.resume_cache.get(cache_key)
+            cached = generated is not None
+            if not cached:
+                generated = build_resume(profile, analysis, self.resume_generator)
+                self.resume_cache.put(cache_key, generated)
+            self.resume_handles.set(cache_key, 'resume', generated)
+            
+            return self._generated_resume(cache_key, generated, cached)
+        except Exception as e:
+            return self._generation_error(e)
+
+    async def generate_resume_async(self, profile=None, analysis=None, session_id=None, cpu_pool=None):
+        """generate_resume with session reads on a thread and generation in the shared CPU pool"""
+        try:
+            if not profile:
+                profile = await asyncio.to_thread(self.sessions.get, session_id, 'profile')
+            if not analysis:
+                analysis = await asyncio.to_thread(self.sessions.get, session_id, 'analysis')
+            
+            missing = self._missing_generation_input(profile, analysis)
+            if missing:
+                return missing
+            
+            cache_key = self.resume_cache.key(profile, analysis)
+            generated = self.resume_cache.get(cache_key)
+            cached = generated is not None
+            if not cached:
+                generated = await cpu_pool.run(build_resume, profile, analysis)
+                self.resume_cache.put(cache_key, generated)
+            await asyncio.to_thread(self.resume_handles.set, cache_key, 'resume', generated)
+            
+            return self._generated_resume(cache_key, generated, cached)
+        except Exception as e:
+            return self._generation_error(e)
+
+    def _missing_generation_input(self, profile, analysis):
+        """Error response when there is no profile or job analysis to generate from, else None"""
+        if not profile:
+            return {
+                'success': False,
+                'message': 'Profile is required for resume generation',
+                'data': None,
+                'errors': ['No profile available']
+            }
+        
+        if not analysis:
+            return {
+                'success': False,
+                'message': 'Job analysis is required for resume generation',
+                'data': None,
+                'errors': ['No job analysis available']
+            }
+        return None
+
+    def _generated_resume(self, cache_key, generated, cached):
+        return {
+            'success': True,
+            'message': 'Resume generated successfully',
+            'data': {
+                'resume_id': cache_key,
+                'resume_data': generated['resume_data'],
+                'formatted_resume': generated['formatted_resume'],
+                'cached': cached
+            },
+            'errors': []
+        }
+
+    def _generation_error(self, error):
+        return {
+            'success': False,
+            'message': 'Error generating resume',
+            'data': None,
+            'errors': [str(error)]
+        }
+    
+    def generate_resumes_batch(self, profile=None, job_descriptions=None, job_ids=None, session_id=None):
+        """Tailor one profile to many job descriptions and/or stored job postings
+
+        Profile-side work (lowercased texts, recency bonuses) is done once per
+        worker; each job then only pays for its own analysis and generation.
+        Jobs whose stored analysis matches their current text skip analysis.
+        """
+        try:
+            if not profile:
+                profile = self.sessions.get(session_id, 'profile')
+
             if not profile:
                 return {
                     'success': False,
@@ -199,160 +702,632 @@ class JobSeekerIntegration:
                     'data': None,
                     'errors': ['No profile available']
                 }
-            
-            if not analysis:
+
+            jobs, errors, failure = self._collect_batch_jobs(job_descriptions, job_ids)
+            if failure:
+                return failure
+
+            started = time.perf_counter()
+            workers = min(self.cpu_pool.workers, len(jobs))
+            if workers > 1 and len(jobs) >= self.batch_parallel_threshold:
+                # Each worker prepares the profile once per batch, not once per job
+                task = partial(tailor_batch_job, uuid.uuid4().hex, profile)
+                results = [future.result() for future in [self.cpu_pool.submit(task, job) for job in jobs]]
+            else:
+                workers = 1
+                state = _prepare_batch_state(profile)
+                results = [tailor_resume_for_job(job, state) for job in jobs]
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            failed = sum(1 for result in results if not result['success'])
+            errors.extend(
+                f"Job {result['job_id'] or index + 1}: {result['error']}"
+                for index, result in enumerate(results) if not result['success']
+            )
+
+            return {
+                'success': not errors,
+                'message': f'Generated {len(results) - failed} of {len(results)} tailored resumes',
+                'data': {
+                    'results': results,
+                    'generated': len(results) - failed,
+                    'failed': failed,
+                    'workers': workers,
+                    'elapsed_ms': round(elapsed_ms, 2)
+                },
+                'errors': errors
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': 'Error generating resumes',
+                'data': None,
+                'errors': [str(e)]
+            }
+
+    def export_resumes_zip(self, profile=None, job_descriptions=None, job_ids=None, formats=None,
+                           session_id=None):
+        """Tailor one profile to many jobs and stream the exports as a ZIP archive
+
+        Everything is validated up front; data['chunks'] then yields the
+        archive while resumes are still being generated and rendered. Each
+        document is copied in from the artifact cache in small reads, so
+        memory stays flat however many files are included. Jobs that fail
+        are listed in an errors.txt member at the end of the archive.
+        """
+        try:
+            if not profile:
+                profile = self.sessions.get(session_id, 'profile')
+
+            if not profile:
                 return {
                     'success': False,
-                    'message': 'Job analysis is required for resume generation',
+                    'message': 'Profile is required for resume generation',
                     'data': None,
-                    'errors': ['No job analysis available']
+                    'errors': ['No profile available']
                 }
-            
-            resume_data = self.resume_generator.generate_resume(profile, analysis)
-            formatted_resume = self.resume_generator.format_resume(resume_data)
-            
+
+            formats = list(dict.fromkeys(formats or ['pdf']))
+            if any(format_type not in EXPORT_CONTENT_TYPES for format_type in formats):
+                return self._unsupported_format()
+
+            jobs, errors, failure = self._collect_batch_jobs(job_descriptions, job_ids)
+            if failure:
+                return failure
+            for index, job in enumerate(jobs, 1):
+                job['index'] = index
+
             return {
                 'success': True,
-                'message': 'Resume generated successfully',
+                'message': f'Streaming {len(jobs) * len(formats)} resumes',
                 'data': {
-                    'resume_data': resume_data,
-                    'formatted_resume': formatted_resume
+                    'filename': self._export_filename(profile, 'zip'),
+                    'content_type': 'application/zip',
+                    'files': len(jobs) * len(formats),
+                    'chunks': self._stream_zip(profile, jobs, formats, list(errors))
                 },
-                'errors': []
+                'errors': errors
             }
         except Exception as e:
             return {
                 'success': False,
-                'message': 'Error generating resume',
+                'message': 'Error exporting resumes',
                 'data': None,
                 'errors': [str(e)]
             }
-    
-    def export_resume(self, content, format_type, profile=None, job_description=None):
-        """Export resume in specified format for web download"""
+
+    def _collect_batch_jobs(self, job_descriptions, job_ids):
+        """Gather posted descriptions and stored postings, returning (jobs, errors, failure response)"""
+        jobs = []
+        for job in job_descriptions or []:
+            if isinstance(job, str):
+                job = {'job_description': job}
+            jobs.append({'job_id': None, 'job_title': job.get('job_title', ''),
+                         'company_name': job.get('company_name', ''),
+                         'job_description': job.get('job_description', '')})
+
+        errors = []
+        if job_ids:
+            postings = self._load_job_postings(job_ids)
+            if postings is None:
+                return jobs, errors, {
+                    'success': False,
+                    'message': 'Stored jobs cannot be loaded right now - please try again later',
+                    'data': None,
+                    'errors': [JOB_DATABASE_UNAVAILABLE]
+                }
+            found, missing = postings
+            jobs.extend(found)
+            errors.extend(f'Job {job_id} not found' for job_id in missing)
+
+        if not jobs:
+            return jobs, errors, {
+                'success': False,
+                'message': 'At least one job description or job ID is required',
+                'data': None,
+                'errors': errors or ['No jobs provided']
+            }
+
+        if len(jobs) > self.batch_max_jobs:
+            return jobs, errors, {
+                'success': False,
+                'message': f'At most {self.batch_max_jobs} jobs can be tailored per request',
+                'data': None,
+                'errors': ['Too many jobs']
+            }
+
+        return jobs, errors, None
+
+    def _stream_zip(self, profile, jobs, formats, errors):
+        """Yield a ZIP archive of every job's exports, member by member as they are rendered"""
+        sink = _ZipSink()
+        # Every member is deflated, if only at level 1: a stored member followed by a data
+        # descriptor (unavoidable on a stream) has no end marker some unzippers can find
+        with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            for result in self._iter_batch_exports(profile, jobs, formats):
+                if not result['success']:
+                    errors.append(f"Job {result['job_id'] or result['index']}: {result['error']}")
+                    continue
+
+                for format_type, file_data, file_path in result['files']:
+                    name = self._archive_name(result, format_type)
+                    try:
+                        source = open(file_path, 'rb') if file_path else None
+                    except OSError:
+                        errors.append(f'{name}: evicted from the export cache before it was sent')
+                        continue
+
+                    with archive.open(name, 'w') as target:
+                        if source is None:
+                            target.write(file_data)
+                        else:
+                            with source:
+                                for chunk in iter(lambda: source.read(self.zip_chunk_size), b''):
+                                    target.write(chunk)
+                                    data = sink.drain()
+                                    if data:
+                                        yield data
+                    data = sink.drain()
+                    if data:
+                        yield data
+
+            if errors:
+                archive.writestr('errors.txt', '\n'.join(errors) + '\n')
+        data = sink.drain()
+        if data:
+            yield data
+
+    def _iter_batch_exports(self, profile, jobs, formats):
+        """Yield export_batch_job results in completion order"""
+        workers = min(self.cpu_pool.workers, len(jobs))
+        if workers > 1 and len(jobs) >= self.batch_parallel_threshold:
+            task = partial(export_batch_pool_job, uuid.uuid4().hex, profile, formats)
+            yield from self.cpu_pool.map_unordered(task, jobs)
+        else:
+            state = _prepare_batch_state(profile)
+            export_state = (self.resume_generator.renderer, self.artifact_cache)
+            for job in jobs:
+                yield export_batch_job(job, formats, state, export_state)
+
+    def _archive_name(self, result, format_type):
+        """Archive member name for one job's export, numbered in request order"""
+        label = ' '.join(part for part in (result['company_name'], result['job_title']) if part)
+        return f"{result['index']:02d}_{self._filename_slug(label, 'resume')}.{format_type}"
+
+    def _load_job_postings(self, job_ids):
+        """Load stored postings as batch jobs, returning (jobs, missing ids), or None when the database is down"""
+        job_ids = [int(job_id) for job_id in job_ids]
+        if not self.db_manager.connect():
+            return None
+        rows = self.db_manager.get_job_postings(job_ids)
+        self.db_manager.disconnect()
+        if rows is None:
+            return None
+
+        by_id = {row['job_id']: row for row in rows}
+        jobs = []
+        for job_id in job_ids:
+            row = by_id.get(job_id)
+            if row is None:
+                continue
+            job = {
+                'job_id': job_id,
+                'job_title': row['job_title'],
+                'company_name': row['company_name'],
+                'job_description': row['job_description_text']
+            }
+            if row['analysis_current']:
+                job['analysis'] = {
+                    'keywords': row['keywords'],
+                    'relevance_score': 0.0,
+                    'required_skills': row['required_skills'],
+                    'preferred_skills': row['preferred_skills'],
+                    'experience_level': row['experience_level'],
+                    'education_requirements': row['education_requirements'],
+                    'key_responsibilities': row['key_responsibilities'],
+                    'company_info': ''
+                }
+            jobs.append(job)
+        return jobs, [job_id for job_id in job_ids if job_id not in by_id]
+
+    def recommend_jobs(self, profile=None, top_k=10, session_id=None, time_budget_ms=None):
+        """Rank active, pre-analyzed jobs for a profile
+
+        A profile ranked again on an unchanged index gets its cached
+        ranking. With time_budget_ms, a stale index is not reloaded when
+        reloading and ranking are estimated to overrun the budget, and a
+        ranking cached from an earlier index is returned when ranking
+        itself would; either answer is flagged as degraded.
+        """
         try:
-            import tempfile
-            import os
-            from datetime import datetime
-            
-            if not content:
+            budget = parse_time_budget(time_budget_ms)
+            if not profile:
+                profile = self.sessions.get(session_id, 'profile')
+
+            if not profile:
                 return {
                     'success': False,
-                    'message': 'No resume content available for export',
+                    'message': 'Profile is required for job recommendations',
                     'data': None,
-                    'errors': ['No resume content']
+                    'errors': ['No profile available']
                 }
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_name = "resume"
-            if profile and "personal_info" in profile:
-                name = profile["personal_info"].get("name", "").strip()
-                if name:
-                    default_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-                    default_name = default_name.replace(' ', '_').lower()
-            
-            filename = f"{default_name}_{timestamp}.{format_type}"
-            
-            # Generate file content based on format
-            if format_type == 'txt':
-                file_data = content.encode('utf-8')
-                content_type = 'text/plain'
-            elif format_type == 'pdf':
-                file_data = self._generate_pdf(content)
-                content_type = 'application/pdf'
-            elif format_type == 'docx':
-                file_data = self._generate_docx(content)
-                content_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-            else:
+
+            started = time.perf_counter()
+            mode = 'full'
+            recommender = self.job_recommender
+            if self._job_index_stale():
+                if recommender.jobs and budget is not None and self.ranking_costs.estimate(
+                        index_load=1, rank=len(recommender.jobs)) > budget:
+                    mode = 'stale_index'
+                else:
+                    with self.ranking_costs.timed('index_load'):
+                        self._load_job_index()
+
+            if not recommender.jobs:
                 return {
                     'success': False,
-                    'message': 'Unsupported export format',
+                    'message': 'No analyzed jobs available - run analyze_jobs.py first',
                     'data': None,
-                    'errors': ['Format must be txt, pdf, or docx']
+                    'errors': ['Job index is empty']
                 }
-            
+
+            top_k = int(top_k)
+            jobs_scored = len(recommender.jobs)
+            cache_key = self.ranking_cache.key(profile, {'top_k': top_k})
+            cached = self.ranking_cache.get(cache_key)
+            elapsed_ms = 0.0
+            if cached is not None and cached['index_version'] == recommender.version:
+                recommendations = cached['recommendations']
+                mode = 'cached' if mode == 'full' else mode
+            elif cached is not None and budget is not None and (
+                    time.perf_counter() - started + self.ranking_costs.estimate(rank=jobs_scored) > budget):
+                recommendations = cached['recommendations']
+                mode = 'stale_cache'
+            else:
+                version = recommender.version
+                ranking_started = time.perf_counter()
+                with self.ranking_costs.timed('rank', jobs_scored):
+                    recommendations = recommender.recommend(profile, top_k)
+                elapsed_ms = (time.perf_counter() - ranking_started) * 1000
+                self.ranking_cache.put(cache_key, {'index_version': version, 'recommendations': recommendations})
+
+            degraded = mode in ('stale_index', 'stale_cache')
+            self.ranking_costs.record(mode, degraded, time.perf_counter() - started, budget)
+
             return {
                 'success': True,
-                'message': 'Resume exported successfully',
+                'message': 'Job recommendations generated successfully',
                 'data': {
-                    'filename': filename,
-                    'file_data': file_data,
-                    'content_type': content_type,
-                    'format': format_type
+                    'recommendations': recommendations,
+                    'jobs_scored': jobs_scored,
+                    'scoring_ms': round(elapsed_ms, 2),
+                    'degraded': degraded,
+                    'ranking_mode': mode
                 },
                 'errors': []
             }
         except Exception as e:
             return {
                 'success': False,
-                'message': 'Error exporting resume',
+                'message': 'Error generating job recommendations',
                 'data': None,
                 'errors': [str(e)]
             }
-    
-    def _generate_pdf(self, content):
-        """Generate PDF content"""
+
+    def refresh_job(self, job_id, requirements):
+        """Apply an edited job's new requirements to a loaded job index, if the index holds the job"""
+        if self.job_recommender.jobs:
+            self.job_recommender.update_job({'job_id': job_id, **requirements})
+
+    def _job_index_stale(self):
+        """Whether the job requirements index is missing or older than job_index_ttl"""
+        return not self.job_recommender.jobs or time.time() - self.job_recommender.built_at >= self.job_index_ttl
+
+    def _load_job_index(self):
+        """Load the job requirements index from the database"""
+        if self.db_manager.connect():
+            jobs = self.db_manager.get_job_requirements(status='active')
+            self.db_manager.disconnect()
+            self.job_recommender.build_index(jobs)
+
+    def export_resume(self, content, format_type, profile=None, job_description=None, resume_data=None,
+                      resume_id=None):
+        """Export resume in specified format for web download
+
+        A resume_id returned by generate_resume renders the cached resume
+        server-side. Posted resume_data is rendered straight from its block
+        layout; plain content is only re-parsed for older clients.
+        """
         try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet
-            from io import BytesIO
+            prepared = self._prepare_export(content, format_type, profile, resume_data, resume_id)
+            if not prepared['success']:
+                return prepared
+            export = prepared['data']
             
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-            
-            # Split content into paragraphs
-            paragraphs = content.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    # Check if it's a header (all caps or starts with specific patterns)
-                    if para.isupper() or para.startswith('=') or para.startswith('-'):
-                        story.append(Paragraph(para.strip(), styles['Heading2']))
-                    else:
-                        story.append(Paragraph(para.strip(), styles['Normal']))
-                    story.append(Spacer(1, 12))
+            # Generate file content based on format
+            if format_type == 'txt':
+                file_data, file_path = self._export_text(export['content'], export['blocks']), None
+            else:
+                file_data, file_path = self._export_document(format_type, export['content'], export['blocks'])
             
-            doc.build(story)
-            buffer.seek(0)
-            return buffer.getvalue()
-        except ImportError:
-            # Fallback to text if reportlab not available
-            return content.encode('utf-8')
+            return self._exported_resume(export, file_data, file_path)
         except Exception as e:
-            print(f"PDF generation error: {e}")
-            return content.encode('utf-8')
-    
-    def _generate_docx(self, content):
-        """Generate DOCX content"""
+            return self._export_error(e)
+
+    async def export_resume_async(self, content, format_type, profile=None, job_description=None,
+                                  resume_data=None, resume_id=None, cpu_pool=None):
+        """export_resume with store and cache reads on threads and rendering in the shared CPU pool"""
         try:
-            from docx import Document
-            from io import BytesIO
+            # The resume handle is read from SQLite and its blocks may be built: neither belongs on the loop
+            prepared = await asyncio.to_thread(self._prepare_export, content, format_type, profile,
+                                               resume_data, resume_id)
+            if not prepared['success']:
+                return prepared
+            export = prepared['data']
             
-            doc = Document()
-            
-            # Split content into paragraphs
-            paragraphs = content.split('\n\n')
-            for para in paragraphs:
-                para = para.strip()
-                if not para:
-                    continue
-                
-                # Check if it's a header
-                if para.isupper() or para.startswith('=') or para.startswith('-'):
-                    doc.add_heading(para.replace('=', '').replace('-', '').strip(), level=2)
-                else:
-                    doc.add_paragraph(para)
+            if format_type == 'txt':
+                file_data, file_path = self._export_text(export['content'], export['blocks']), None
+            else:
+                key = self.artifact_cache.key(export_source(export['content'], export['blocks']),
+                                              format_type, TEMPLATE_VERSION)
+                file_data = None
+                file_path = await asyncio.to_thread(self.artifact_cache.get, key, format_type)
+                if not file_path:
+                    rendered = await cpu_pool.run(render_export_job, format_type, key,
+                                                  export['content'], export['blocks'])
+                    file_data, file_path = rendered['file_data'], rendered['file_path']
             
-            buffer = BytesIO()
-            doc.save(buffer)
-            buffer.seek(0)
-            return buffer.getvalue()
-        except ImportError:
-            # Fallback to text if python-docx not available
-            return content.encode('utf-8')
+            return self._exported_resume(export, file_data, file_path)
         except Exception as e:
-            print(f"DOCX generation error: {e}")
-            return content.encode('utf-8')
\ No newline at end of file
+            return self._export_error(e)
+
+    def _prepare_export(self, content, format_type, profile, resume_data, resume_id):
+        """Resolve what an export renders (text content and block layout) and its download name"""
+        blocks = None
+        if resume_id:
+            generated = self.resume_handles.get(resume_id, 'resume')
+            if generated is None:
+                return self._unknown_resume()
+            resume_data = generated['resume_data']
+            content = generated['formatted_resume']
+            blocks = self._cached_blocks(resume_id, generated)
+        elif resume_data:
+            blocks = self.resume_generator.renderer.build_blocks(resume_data)
+        
+        if not content and not resume_data:
+            return {
+                'success': False,
+                'message': 'No resume content available for export',
+                'data': None,
+                'errors': ['No resume content']
+            }
+        
+        if format_type not in EXPORT_CONTENT_TYPES:
+            return self._unsupported_format()
+        
+        return {
+            'success': True,
+            'message': 'Export prepared',
+            'data': {
+                'content': content,
+                'blocks': blocks,
+                'filename': self._export_filename(profile or resume_data, format_type),
+                'content_type': EXPORT_CONTENT_TYPES[format_type],
+                'format': format_type
+            },
+            'errors': []
+        }
+
+    def _export_text(self, content, blocks):
+        if blocks is not None and not content:
+            content = "".join(self.resume_generator.renderer.stream_text(blocks))
+        return content.encode('utf-8')
+
+    def _exported_resume(self, export, file_data, file_path):
+        return {
+            'success': True,
+            'message': 'Resume exported successfully',
+            'data': {
+                'filename': export['filename'],
+                'file_data': file_data,
+                'file_path': file_path,
+                'content_type': export['content_type'],
+                'format': export['format']
+            },
+            'errors': []
+        }
+
+    def _export_error(self, error):
+        return {
+            'success': False,
+            'message': 'Error exporting resume',
+            'data': None,
+            'errors': [str(error)]
+        }
+
+    def submit_export(self, resume_id, format_type):
+        """Queue a generated resume for rendering in the background and return its export job
+
+        PDF and DOCX documents are rendered by a worker process straight into
+        the artifact cache, so request threads never wait on rendering and
+        the document bytes never pass through this process. Cached documents
+        and plain text are ready immediately. Jobs are kept in the shared
+        store and updated when rendering finishes, so any server process can
+        report on them and serve the download; a job whose process exits
+        before its rendering finishes stays pending until it expires.
+        """
+        try:
+            if format_type not in EXPORT_CONTENT_TYPES:
+                return self._unsupported_format()
+
+            generated = self.resume_handles.get(resume_id, 'resume') if resume_id else None
+            if generated is None:
+                return self._unknown_resume()
+
+            job_id = uuid.uuid4().hex
+            job = {
+                'format': format_type,
+                'filename': self._export_filename(generated['resume_data'], format_type),
+                'content_type': EXPORT_CONTENT_TYPES[format_type],
+                'status': 'pending',
+                'text': None,
+                'file_path': None,
+                'error': None
+            }
+
+            if format_type == 'txt':
+                job.update(status='done', text=generated['formatted_resume'])
+                self.export_jobs.set(job_id, 'export', job)
+            else:
+                blocks = self._cached_blocks(resume_id, generated)
+                key = self.artifact_cache.key(export_source(generated['formatted_resume'], blocks), format_type, TEMPLATE_VERSION)
+                file_path = self.artifact_cache.get(key, format_type)
+                if file_path:
+                    job.update(status='done', file_path=file_path)
+                # Stored before rendering starts, so the outcome can never be overwritten by it
+                self.export_jobs.set(job_id, 'export', job)
+                if not file_path:
+                    future = self.cpu_pool.submit(
+                        render_export_job, format_type, key, generated['formatted_resume'], blocks
+                    )
+                    future.add_done_callback(partial(self._record_export, job_id, job))
+
+            return {
+                'success': True,
+                'message': 'Export queued',
+                'data': self._export_status(job_id, job),
+                'errors': []
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': 'Error queueing export',
+                'data': None,
+                'errors': [str(e)]
+            }
+
+    def get_export_status(self, job_id):
+        """Report whether a background export is pending, done or failed"""
+        job = self.export_jobs.get(job_id, 'export')
+        if job is None:
+            return self._unknown_export()
+        status = self._export_status(job_id, job)
+        return {
+            'success': status['status'] != 'failed',
+            'message': f"Export {status['status']}",
+            'data': status,
+            'errors': [job['error']] if job['error'] else []
+        }
+
+    def get_export_file(self, job_id):
+        """Return a finished export in the same shape as export_resume"""
+        job = self.export_jobs.get(job_id, 'export')
+        if job is None:
+            return self._unknown_export()
+        status = self._export_status(job_id, job)
+        if status['status'] != 'done':
+            return {
+                'success': False,
+                'message': f"Export is {status['status']}",
+                'data': status,
+                'errors': [job['error']] if job['error'] else ['Export not ready']
+            }
+        return {
+            'success': True,
+            'message': 'Resume exported successfully',
+            'data': {
+                'filename': job['filename'],
+                'file_data': job['text'].encode('utf-8') if job['text'] is not None else None,
+                'file_path': job['file_path'],
+                'content_type': job['content_type'],
+                'format': job['format']
+            },
+            'errors': []
+        }
+
+    def _record_export(self, job_id, job, future):
+        """Record how a worker's rendering ended (runs on the pool's management thread)"""
+        error = 'Export cancelled' if future.cancelled() else future.exception()
+        if error is None:
+            self.export_jobs.set(job_id, 'export', dict(job, status='done', file_path=future.result()['file_path']))
+        else:
+            self.export_jobs.set(job_id, 'export', dict(job, status='failed', error=str(error)))
+
+    def _export_status(self, job_id, job):
+        return {
+            'job_id': job_id,
+            'status': job['status'],
+            'format': job['format'],
+            'filename': job['filename'],
+            'download_url': f"/api/jobseeker/export/jobs/{job_id}/download" if job['status'] == 'done' else None,
+            'error': job['error']
+        }
+
+    def _cached_blocks(self, resume_id, generated):
+        """Block layout of a generated resume, built on its first export in this process"""
+        blocks = self.resume_blocks.get(resume_id)
+        if blocks is None:
+            blocks = self.resume_generator.renderer.build_blocks(generated['resume_data'])
+            self.resume_blocks.put(resume_id, blocks)
+        return blocks
+
+    def _export_filename(self, profile, format_type):
+        """Download filename derived from the candidate's name"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = ""
+        if profile and "personal_info" in profile:
+            name = profile["personal_info"].get("name", "")
+        return f"{self._filename_slug(name, 'resume')}_{timestamp}.{format_type}"
+
+    def _filename_slug(self, text, default):
+        """Lowercased filename-safe form of text, or default when nothing is left"""
+        slug = "".join(c for c in (text or "") if c.isalnum() or c in (' ', '-', '_')).strip()
+        return slug.replace(' ', '_').lower() or default
+
+    def _invalid_profile_id(self):
+        return {
+            'success': False,
+            'message': 'Invalid profile ID',
+            'data': None,
+            'errors': ['Profile IDs are 1-64 letters, digits, hyphens or underscores']
+        }
+
+    def _owns_profile(self, profile, session_id):
+        """Whether the session may see and save this profile (callers without a session are trusted)"""
+        return session_id is None or profile.get('owner') == session_id
+
+    def _profile_not_owned(self):
+        return {
+            'success': False,
+            'message': 'Profile not available',
+            'data': None,
+            'errors': [PROFILE_NOT_OWNED]
+        }
+
+    def _unknown_resume(self):
+        return {
+            'success': False,
+            'message': 'Resume not found or expired - please generate it again',
+            'data': None,
+            'errors': ['Unknown resume_id']
+        }
+
+    def _unknown_export(self):
+        return {
+            'success': False,
+            'message': 'Export job not found or expired',
+            'data': None,
+            'errors': ['Unknown export job']
+        }
+
+    def _unsupported_format(self):
+        return {
+            'success': False,
+            'message': 'Unsupported export format',
+            'data': None,
+            'errors': ['Format must be txt, pdf, or docx']
+        }
+
+    def _export_document(self, format_type, content, blocks=None):
+        """Return (file_data, file_path) for a PDF or DOCX export, served from the artifact cache when possible"""
+        return export_document(self.artifact_cache, self.resume_generator.renderer, format_type, content, blocks)
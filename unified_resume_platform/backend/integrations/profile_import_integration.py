@@ -0,0 +1,172 @@
+import sys
+import os
+import json
+import re
+import time
+from itertools import islice
+from multiprocessing import Pool
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+try:
+    from ..models.profile_manager import ProfileManager
+except ImportError as e:
+    print(f"Error importing profile import modules: {e}")
+    print(f"Current working directory: {os.getcwd()}")
+    print(f"Python path: {sys.path}")
+    raise
+
+# Per-process profile manager, created once by the pool initializer
+_worker_manager = None
+
+# A line's profile ID when it is the object's first key, as written in the documented
+# format; a first key cannot be nested, so the ID is found without parsing the profile
+LEADING_PROFILE_ID = re.compile(r'\s*\{\s*"profile_id"\s*:\s*"([A-Za-z0-9_-]{1,64})"\s*[,}]')
+
+
+def _init_worker(data_dir):
+    global _worker_manager
+    _worker_manager = ProfileManager(data_dir)
+
+
+def import_profile_lines(lines, replace=False, manager=None):
+    """Parse, validate and store a chunk of (line number, JSONL line) pairs
+
+    Each line holds {"profile_id": ..., "profile": {...}}. Returns how many
+    profiles were stored and a report entry for every line that was not.
+    """
+    manager = manager or _worker_manager
+    records = []
+    numbers = []
+    report = []
+    for number, line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            report.append({'line': number, 'profile_id': None, 'errors': [f'Invalid JSON: {e}']})
+            continue
+        if not isinstance(record, dict) or not isinstance(record.get('profile_id'), str) \
+                or 'profile' not in record:
+            report.append({
+                'line': number,
+                'profile_id': None,
+                'errors': ['Expected an object with "profile_id" and "profile"']
+            })
+            continue
+        records.append((record['profile_id'], record['profile']))
+        numbers.append(number)
+
+    imported = 0
+    for number, (profile_id, _), errors in zip(numbers, records, manager.import_profiles(records, replace)):
+        if errors:
+            report.append({'line': number, 'profile_id': profile_id, 'errors': errors})
+        else:
+            imported += 1
+    return imported, report
+
+
+class ProfileImportIntegration:
+    """Bulk-imports profiles from JSON Lines files into the profile store"""
+
+    def __init__(self, data_dir=None, workers=None, batch_size=2000, chunk_size=100):
+        self.data_dir = data_dir or os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size  # Lines per task; each task indexes its profiles in one transaction
+
+    def import_jsonl(self, path, replace=False):
+        """Validate and store every profile in a JSONL file through a process pool
+
+        The file is read in batches, so memory stays bounded by a couple of
+        batches (and the profile IDs seen) however large it is; reading
+        batch N+1 overlaps with workers importing batch N. The result's
+        report lists every line that was not imported, with its line number,
+        profile ID and errors. Unless replace is set, a line reusing an
+        earlier line's profile ID is reported and not imported; with it, such
+        lines import in no particular order.
+        """
+        imported = 0
+        report = []
+        seen = {}
+        started = time.perf_counter()
+
+        try:
+            # Creates the store and its index once, before the workers open it
+            ProfileManager(self.data_dir)
+
+            with open(path, 'r', encoding='utf-8') as f, \
+                    Pool(self.workers, initializer=_init_worker, initargs=(self.data_dir,)) as pool:
+                lines = ((number, line) for number, line in enumerate(f, 1) if line.strip())
+                pending = None
+                while True:
+                    batch = list(islice(lines, self.batch_size))
+                    exhausted = not batch
+                    if not replace:
+                        batch = self._unique_lines(batch, seen, report)
+                    next_pending = None
+                    if batch:
+                        chunks = [batch[i:i + self.chunk_size] for i in range(0, len(batch), self.chunk_size)]
+                        next_pending = pool.starmap_async(import_profile_lines, [(chunk, replace) for chunk in chunks])
+                    if pending is not None:
+                        imported = self._collect_batch(pending.get(), imported, report)
+                    if exhausted:
+                        break
+                    pending = next_pending
+
+            report.sort(key=lambda entry: entry['line'])
+            elapsed = time.perf_counter() - started
+            return {
+                'success': not report,
+                'message': f'Imported {imported} profiles in {elapsed:.2f}s',
+                'data': {
+                    'imported': imported,
+                    'failed': len(report),
+                    'report': report,
+                    'workers': self.workers,
+                    'elapsed_seconds': round(elapsed, 3)
+                },
+                'errors': [f'{len(report)} profiles failed to import'] if report else []
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': 'Error importing profiles',
+                'data': None,
+                'errors': [str(e)]
+            }
+
+    def _unique_lines(self, batch, seen, report):
+        """Drop and report lines whose profile ID an earlier line used, remembering the rest's IDs
+
+        Such lines would land in different workers' chunks, where both find
+        no existing profile and the last one written wins. Only lines that
+        do not start with their ID are parsed here; the workers parse the rest.
+        """
+        unique = []
+        for number, line in batch:
+            match = LEADING_PROFILE_ID.match(line)
+            if match:
+                profile_id = match.group(1)
+            else:
+                try:
+                    profile_id = json.loads(line).get('profile_id')
+                except (ValueError, AttributeError):
+                    profile_id = None  # Left for the workers to report
+            if isinstance(profile_id, str):
+                if profile_id in seen:
+                    report.append({
+                        'line': number,
+                        'profile_id': profile_id,
+                        'errors': [f'Duplicate profile ID: {profile_id} (first on line {seen[profile_id]})']
+                    })
+                    continue
+                seen[profile_id] = number
+            unique.append((number, line))
+        return unique
+
+    def _collect_batch(self, results, imported, report):
+        """Add one batch's chunk results to the running count and report"""
+        for chunk_imported, chunk_report in results:
+            imported += chunk_imported
+            report.extend(chunk_report)
+        return imported
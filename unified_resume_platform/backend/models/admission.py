@@ -0,0 +1,125 @@
+"""
+Admission Control - Caps concurrent CPU-heavy requests and sheds load once their queues are full
+"""
+
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+# Endpoint -> limits per worker process. Threads beyond max_concurrent wait, at
+# most max_queue of them and for at most queue_timeout seconds; the rest are shed.
+DEFAULT_LIMITS = {
+    "hr_match": {"max_concurrent": 2, "max_queue": 8, "queue_timeout": 5.0},
+    "generate": {"max_concurrent": 2, "max_queue": 8, "queue_timeout": 5.0},
+    "generate_batch": {"max_concurrent": 1, "max_queue": 2, "queue_timeout": 10.0},
+    "export": {"max_concurrent": 2, "max_queue": 8, "queue_timeout": 10.0},
+    "export_batch": {"max_concurrent": 1, "max_queue": 2, "queue_timeout": 10.0}
+}
+
+
+def raise_limits(limits: Dict[str, Dict[str, Any]], names: Iterable[str],
+                 max_concurrent: int) -> Dict[str, Dict[str, Any]]:
+    """A copy of limits in which each named endpoint admits at least max_concurrent requests at once"""
+    return {
+        name: dict(settings, max_concurrent=max(settings["max_concurrent"], max_concurrent)) if name in names
+        else settings
+        for name, settings in limits.items()
+    }
+
+
+class AdmissionLimit:
+    """Concurrency limit with a bounded wait queue for one endpoint
+
+    A request runs at once while fewer than max_concurrent are running,
+    otherwise it waits in line. Once max_queue requests are already
+    waiting, or a wait exceeds queue_timeout, it is shed instead, so a
+    burst turns into fast rejections rather than every request (cheap ones
+    included, since they share the server's threads) slowing down.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.admitted = 0
+        self.shed_queue_full = 0
+        self.shed_timeout = 0
+        self.completed = 0
+        self._wait_seconds = 0.0
+        self._service_seconds = 0.0
+
+    def acquire(self) -> Optional[float]:
+        """Take a slot, waiting in line if need be; returns when it was taken, or None when shed"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                if self.queued >= self.max_queue:
+                    self.shed_queue_full += 1
+                    return None
+                self.queued += 1
+                self.peak_queued = max(self.peak_queued, self.queued)
+            started = time.perf_counter()
+            admitted = self._slots.acquire(timeout=self.queue_timeout)
+            with self._lock:
+                self.queued -= 1
+                self._wait_seconds += time.perf_counter() - started
+                if not admitted:
+                    self.shed_timeout += 1
+                    return None
+
+        with self._lock:
+            self.active += 1
+            self.admitted += 1
+        return time.perf_counter()
+
+    def release(self, admitted_at: float) -> None:
+        """Give back the slot taken at admitted_at"""
+        with self._lock:
+            self.active -= 1
+            self.completed += 1
+            self._service_seconds += time.perf_counter() - admitted_at
+        self._slots.release()
+
+    def retry_after(self) -> int:
+        """Whole seconds until the current queue should have drained, at least 1"""
+        with self._lock:
+            average = self._service_seconds / self.completed if self.completed else 1.0
+            backlog = self.queued + self.active + 1
+        return max(1, math.ceil(average * backlog / self.max_concurrent))
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "active": self.active,
+                "queued": self.queued,
+                "peak_queued": self.peak_queued,
+                "admitted": self.admitted,
+                "shed": self.shed_queue_full + self.shed_timeout,
+                "shed_queue_full": self.shed_queue_full,
+                "shed_timeout": self.shed_timeout,
+                "avg_wait_ms": round(self._wait_seconds / self.admitted * 1000, 2) if self.admitted else 0.0,
+                "avg_service_ms": round(self._service_seconds / self.completed * 1000, 2) if self.completed else 0.0
+            }
+
+
+class AdmissionController:
+    """The admission limits of one worker process, by endpoint name"""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.limits = {
+            name: AdmissionLimit(name, **settings) for name, settings in (limits or DEFAULT_LIMITS).items()
+        }
+
+    def __getitem__(self, name: str) -> AdmissionLimit:
+        return self.limits[name]
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {name: limit.metrics() for name, limit in self.limits.items()}
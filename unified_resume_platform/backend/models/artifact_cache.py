@@ -0,0 +1,103 @@
+"""
+Artifact Cache - Keeps rendered export files on disk, addressed by what they were rendered from
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Optional
+
+
+class ArtifactCache:
+    """Size-bounded, content-addressed disk cache of rendered documents
+
+    Files live at ``<cache_dir>/<key[:2]>/<key>.<format>``. A cache hit only
+    refreshes the file's mtime, and eviction removes the least recently used
+    files once the total size exceeds max_bytes, down to 90% of it so the
+    next few writes do not evict again. Several processes may share one
+    directory; each tracks an estimate of the total size that is corrected
+    by the rescan done on eviction.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        """Initialize the cache, measuring what an earlier run left on disk"""
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(size for _, size, _ in self._scan())
+
+    def key(self, source: str, format_type: str, template_version: str) -> str:
+        """Hash what a document is rendered from together with its format and template version"""
+        digest = hashlib.sha256()
+        for part in (format_type, template_version, source):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str, format_type: str) -> Optional[str]:
+        """Return the cached file's path, or None when it has not been rendered yet"""
+        path = self._path(key, format_type)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, format_type: str, data: bytes) -> str:
+        """Store rendered bytes atomically and return the cached file's path"""
+        path = self._path(key, format_type)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Write aside and rename, so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            with self._lock:
+                replaced = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(temp_path, path)
+                self.total_bytes += len(data) - replaced
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if self.total_bytes > self.max_bytes:
+            self._evict(keep=path)
+        return path
+
+    def _path(self, key: str, format_type: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{format_type}")
+
+    def _scan(self):
+        """Yield (path, size, mtime) for every cached file"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _evict(self, keep: str) -> None:
+        """Remove least recently used files until the cache is back under its low-water mark"""
+        low_water = self.max_bytes * 0.9
+        with self._lock:
+            files = sorted(self._scan(), key=lambda entry: entry[2])
+            self.total_bytes = sum(size for _, size, _ in files)
+            for path, size, _ in files:
+                if self.total_bytes <= low_water:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                self.total_bytes -= size
@@ -0,0 +1,113 @@
+"""
+Incremental Job Analyzer - Re-parses only the sections of a job description that changed
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Iterable, Optional, Tuple
+
+from .job_analyzer import JobAnalyzer
+
+
+class IncrementalJobAnalyzer:
+    """Caches per-section analysis so an edited posting only re-parses its changed sections"""
+
+    def __init__(self, job_analyzer: Optional[JobAnalyzer] = None,
+                 skill_extractor: Optional[Callable[[str], Iterable[str]]] = None,
+                 max_sections: int = 5000):
+        """Initialize with an optional per-section skill extractor (e.g. ResumeMatcher.extract_skills)"""
+        self.job_analyzer = job_analyzer or JobAnalyzer()
+        self.skill_extractor = skill_extractor
+        self.max_sections = max_sections
+        self._sections: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def analyze(self, job_description: str) -> Dict[str, Any]:
+        """Analyze a job description, reusing cached results for unchanged sections"""
+        analysis, _ = self._analyze(job_description)
+        return analysis
+
+    def reanalyze(self, previous_description: str, job_description: str) -> Dict[str, Any]:
+        """Analyze an edited job description and report what changed
+
+        The skill delta is what downstream re-scoring keys on: candidates whose
+        skills do not intersect it keep their scores.
+        """
+        previous, _ = self._analyze(previous_description or "")
+        analysis, parsed_sections = self._analyze(job_description)
+
+        previous_keys = set(self._section_keys(previous_description or ""))
+        current_keys = self._section_keys(job_description)
+
+        skill_field = "jd_skills" if self.skill_extractor else None
+        old_skills = self._skill_set(previous, skill_field)
+        new_skills = self._skill_set(analysis, skill_field)
+
+        return {
+            "analysis": analysis,
+            "previous_analysis": previous,
+            "total_sections": len(current_keys),
+            "changed_sections": sum(1 for key in current_keys if key not in previous_keys),
+            "parsed_sections": parsed_sections,
+            "added_skills": sorted(new_skills - old_skills),
+            "removed_skills": sorted(old_skills - new_skills),
+            "requirements_changed": any(
+                previous.get(field) != analysis.get(field)
+                for field in ("experience_level", "education_requirements")
+            ) or self._skill_set(previous, None) != self._skill_set(analysis, None)
+        }
+
+    def _analyze(self, job_description: str) -> Tuple[Dict[str, Any], int]:
+        """Merge cached section results, returning (analysis, sections parsed)"""
+        results = []
+        parsed = 0
+        if not job_description or not job_description.strip():
+            keywords, requirements = [], self.job_analyzer.identify_requirements("")
+        else:
+            sections = self.job_analyzer.split_sections(job_description)
+            for index, section in enumerate(sections):
+                is_last = index == len(sections) - 1
+                result = self._cached_section(section, is_last)
+                if result is None:
+                    result = self._parse_section(section, is_last)
+                    parsed += 1
+                results.append(result)
+            keywords, requirements = self.job_analyzer.merge_sections(results)
+
+        analysis = {"keywords": keywords, **requirements}
+        if self.skill_extractor:
+            jd_skills = set()
+            for result in results:
+                jd_skills.update(result["jd_skills"])
+            analysis["jd_skills"] = sorted(jd_skills)
+        return analysis, parsed
+
+    def _section_key(self, section: str, is_last: bool) -> str:
+        """Hash a section together with whether a separator follows it"""
+        unit = section if is_last else section + "\n\n"
+        return hashlib.sha1(unit.encode("utf-8")).hexdigest()
+
+    def _section_keys(self, job_description: str) -> List[str]:
+        sections = self.job_analyzer.split_sections(job_description)
+        return [self._section_key(section, i == len(sections) - 1) for i, section in enumerate(sections)]
+
+    def _cached_section(self, section: str, is_last: bool) -> Optional[Dict[str, Any]]:
+        key = self._section_key(section, is_last)
+        result = self._sections.get(key)
+        if result is not None:
+            self._sections.move_to_end(key)
+        return result
+
+    def _parse_section(self, section: str, is_last: bool) -> Dict[str, Any]:
+        result = self.job_analyzer.analyze_section(section, is_last)
+        if self.skill_extractor:
+            result["jd_skills"] = list(self.skill_extractor(section))
+
+        self._sections[self._section_key(section, is_last)] = result
+        while len(self._sections) > self.max_sections:
+            self._sections.popitem(last=False)
+        return result
+
+    def _skill_set(self, analysis: Dict[str, Any], field: Optional[str]) -> set:
+        if field:
+            return set(analysis.get(field, []))
+        return set(analysis.get("required_skills", [])) | set(analysis.get("preferred_skills", []))
@@ -3,7 +3,7 @@ Job Analyzer - Extracts keywords and requirements from job descriptions
 """
 
 import re
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Any, Optional, Tuple
 from collections import Counter
 
 
@@ -31,6 +31,15 @@ class JobAnalyzer:
             r'\b(?:computer science|engineering|mathematics|statistics)\b'
         ]
         
+        # Section patterns never extend past a blank line, which keeps analysis paragraph-local
+        self.required_section_pattern = r'(?:required|must have|essential).*?(?:preferred|nice to have|plus|bonus|\n\n)'
+        self.preferred_section_pattern = r'(?:preferred|nice to have|plus|bonus|would be great).*?(?:\n\n|$)'
+        self.plus_experience_pattern = r'(\d+)\+\s*(?:years?|yrs?)'
+        self.responsibility_patterns = [
+            r'(?:•|\*|-|\d+\.)\s*([^\n•\*\-\d]+)',
+            r'(?:responsibilities|duties).*?(?:\n\n|requirements)',
+        ]
+        
         self.stopwords = {
             'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
             'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
@@ -102,10 +111,7 @@ class JobAnalyzer:
         preferred_skills = []
         
         # Look for required skills sections
-        required_sections = re.findall(
-            r'(?:required|must have|essential).*?(?:preferred|nice to have|plus|bonus|\n\n)',
-            text, re.DOTALL
-        )
+        required_sections = re.findall(self.required_section_pattern, text, re.DOTALL)
         
         for section in required_sections:
             for pattern in self.skill_patterns:
@@ -113,10 +119,7 @@ class JobAnalyzer:
                 required_skills.extend(matches)
         
         # Look for preferred skills sections
-        preferred_sections = re.findall(
-            r'(?:preferred|nice to have|plus|bonus|would be great).*?(?:\n\n|$)',
-            text, re.DOTALL
-        )
+        preferred_sections = re.findall(self.preferred_section_pattern, text, re.DOTALL)
         
         for section in preferred_sections:
             for pattern in self.skill_patterns:
@@ -128,16 +131,12 @@ class JobAnalyzer:
         for pattern in self.experience_patterns:
             match = re.search(pattern, text, re.IGNORECASE)
             if match:
-                if len(match.groups()) == 1:
-                    experience_level = f"{match.group(1)} years"
-                elif len(match.groups()) == 2:
-                    experience_level = f"{match.group(1)}-{match.group(2)} years"
+                experience_level = self._format_experience(match)
                 break
         
         # Additional pattern for "3+ years" format
         if not experience_level:
-            plus_pattern = r'(\d+)\+\s*(?:years?|yrs?)'
-            match = re.search(plus_pattern, text, re.IGNORECASE)
+            match = re.search(self.plus_experience_pattern, text, re.IGNORECASE)
             if match:
                 experience_level = f"{match.group(1)}+ years"
         
@@ -151,12 +150,7 @@ class JobAnalyzer:
         
         # Extract key responsibilities (look for bullet points or numbered lists)
         responsibilities = []
-        responsibility_patterns = [
-            r'(?:•|\*|-|\d+\.)\s*([^\n•\*\-\d]+)',
-            r'(?:responsibilities|duties).*?(?:\n\n|requirements)',
-        ]
-        
-        for pattern in responsibility_patterns:
+        for pattern in self.responsibility_patterns:
             matches = re.findall(pattern, job_description, re.IGNORECASE | re.DOTALL)
             for match in matches:
                 if len(match.strip()) > 20:  # Filter out short matches
@@ -166,7 +160,7 @@ class JobAnalyzer:
         company_info = ""
         paragraphs = job_description.split('\n\n')
         if paragraphs:
-            company_info = paragraphs[0][:200] + "..." if len(paragraphs[0]) > 200 else paragraphs[0]
+            company_info = self._summarize_company(paragraphs[0])
         
         return {
             "required_skills": list(set(required_skills)),
@@ -177,23 +171,195 @@ class JobAnalyzer:
             "company_info": company_info
         }
     
-    def calculate_relevance_score(self, profile: Dict[str, Any], job_requirements: Dict[str, Any]) -> float:
+    def split_sections(self, job_description: str) -> List[str]:
+        """Split a job description into the blank-line separated sections analysis works on"""
+        return job_description.split('\n\n') if job_description else []
+    
+    def analyze_section(self, section: str, is_last: bool = True) -> Dict[str, Any]:
+        """Extract everything keyword and requirement analysis needs from one section
+        
+        Results for consecutive sections combine through merge_sections into the
+        same output as extract_keywords and identify_requirements on the full text.
+        """
+        # Patterns terminated by a blank line need the separator that follows the section
+        unit = section if is_last else section + '\n\n'
+        text = unit.lower()
+        
+        technical = [re.findall(pattern, text, re.IGNORECASE) for pattern in self.skill_patterns]
+        
+        words = [
+            word for word in re.sub(r'[^\w\s]', ' ', text).split()
+            if len(word) > 2 and word not in self.stopwords
+        ]
+        phrases = []
+        for i in range(len(words) - 1):
+            phrases.append(f"{words[i]} {words[i+1]}")
+            if i < len(words) - 2:
+                phrases.append(f"{words[i]} {words[i+1]} {words[i+2]}")
+        
+        required_skills = []
+        for required_section in re.findall(self.required_section_pattern, text, re.DOTALL):
+            for pattern in self.skill_patterns:
+                required_skills.extend(re.findall(pattern, required_section, re.IGNORECASE))
+        
+        preferred_skills = []
+        for preferred_section in re.findall(self.preferred_section_pattern, text, re.DOTALL):
+            for pattern in self.skill_patterns:
+                preferred_skills.extend(re.findall(pattern, preferred_section, re.IGNORECASE))
+        
+        experience = []
+        for pattern in self.experience_patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            experience.append(self._format_experience(match) if match else None)
+        plus_match = re.search(self.plus_experience_pattern, text, re.IGNORECASE)
+        
+        education = []
+        for pattern in self.education_patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            education.append(match.group(0) if match else None)
+        
+        responsibilities = []
+        for pattern, source in zip(self.responsibility_patterns, (section, unit)):
+            matches = re.findall(pattern, source, re.IGNORECASE | re.DOTALL)
+            responsibilities.append([match.strip() for match in matches if len(match.strip()) > 20])
+        
+        return {
+            "technical": technical,
+            "words": words,
+            "phrases": phrases,
+            "required_skills": required_skills,
+            "preferred_skills": preferred_skills,
+            "experience": experience,
+            "plus_experience": f"{plus_match.group(1)}+ years" if plus_match else None,
+            "education": education,
+            "responsibilities": responsibilities,
+            "company_info": self._summarize_company(section)
+        }
+    
+    def merge_sections(self, sections: List[Dict[str, Any]]) -> Tuple[List[str], Dict[str, Any]]:
+        """Combine per-section results into (keywords, requirements)"""
+        # Rebuild the keyword stream in the same order extract_keywords produces it
+        keyword_counts = Counter()
+        for pattern_index in range(len(self.skill_patterns)):
+            for section in sections:
+                keyword_counts.update(section["technical"][pattern_index])
+        for section in sections:
+            keyword_counts.update(section["words"])
+        
+        carry = []
+        for section in sections:
+            words = section["words"]
+            # Phrases that start in earlier sections and end in this one
+            window = carry + words[:2]
+            for start in range(len(carry)):
+                for size in (2, 3):
+                    end = start + size
+                    if len(carry) < end <= len(window):
+                        keyword_counts[" ".join(window[start:end])] += 1
+            keyword_counts.update(section["phrases"])
+            carry = (carry + words[-2:])[-2:]
+        
+        keywords = [keyword for keyword, count in keyword_counts.most_common(20)]
+        
+        experience_level = ""
+        for pattern_index in range(len(self.experience_patterns)):
+            experience_level = next(
+                (s["experience"][pattern_index] for s in sections if s["experience"][pattern_index]), ""
+            )
+            if experience_level:
+                break
+        if not experience_level:
+            experience_level = next((s["plus_experience"] for s in sections if s["plus_experience"]), "")
+        
+        education_requirements = ""
+        for pattern_index in range(len(self.education_patterns)):
+            education_requirements = next(
+                (s["education"][pattern_index] for s in sections if s["education"][pattern_index]), ""
+            )
+            if education_requirements:
+                break
+        
+        responsibilities = []
+        for pattern_index in range(len(self.responsibility_patterns)):
+            for section in sections:
+                responsibilities.extend(section["responsibilities"][pattern_index])
+        
+        required_skills = set()
+        preferred_skills = set()
+        for section in sections:
+            required_skills.update(section["required_skills"])
+            preferred_skills.update(section["preferred_skills"])
+        
+        return keywords, {
+            "required_skills": list(required_skills),
+            "preferred_skills": list(preferred_skills),
+            "experience_level": experience_level,
+            "education_requirements": education_requirements,
+            "key_responsibilities": responsibilities[:5],
+            "company_info": sections[0]["company_info"] if sections else ""
+        }
+    
+    def _format_experience(self, match: re.Match) -> str:
+        """Format an experience pattern match as a years string"""
+        if len(match.groups()) == 1:
+            return f"{match.group(1)} years"
+        elif len(match.groups()) == 2:
+            return f"{match.group(1)}-{match.group(2)} years"
+        return ""
+    
+    def _summarize_company(self, paragraph: str) -> str:
+        """Truncate the opening paragraph used as company info"""
+        return paragraph[:200] + "..." if len(paragraph) > 200 else paragraph
+    
+    def extract_experience_years(self, experience_level: str) -> Optional[int]:
+        """Extract the minimum number of years from an experience level string"""
+        if not experience_level:
+            return None
+        
+        years_match = re.search(r'(\d+)', experience_level)
+        return int(years_match.group(1)) if years_match else None
+    
+    def extract_profile_features(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute the profile-side inputs of relevance scoring once per profile"""
+        profile_skills = []
+        skills = profile.get("skills")
+        if isinstance(skills, dict):
+            for skill_type in ["technical", "soft", "languages", "certifications"]:
+                if skill_type in skills and isinstance(skills[skill_type], list):
+                    profile_skills.extend([skill.lower() for skill in skills[skill_type]])
+        
+        # Summary plus work experience descriptions, joined once
+        text_parts = []
+        if "summary" in profile:
+            text_parts.append(profile["summary"].lower())
+        work_experience = profile.get("work_experience")
+        if "work_experience" in profile:
+            for exp in work_experience:
+                if "description" in exp:
+                    text_parts.append(exp["description"].lower())
+        
+        education = profile.get("education")
+        return {
+            "skills": profile_skills,
+            # NUL never occurs in a skill, so a substring hit lies within a single skill
+            "skills_text": "\0".join(profile_skills),
+            "text": " ".join(text_parts),
+            "experience_count": len(work_experience) if isinstance(work_experience, list) else None,
+            "education": [edu.get("degree", "").lower() for edu in education] if isinstance(education, list) else None
+        }
+    
+    def calculate_relevance_score(self, profile: Dict[str, Any], job_requirements: Dict[str, Any],
+                                  profile_features: Optional[Dict[str, Any]] = None) -> float:
         """Calculate how well a profile matches job requirements"""
         if not profile or not job_requirements:
             return 0.0
         
+        features = profile_features or self.extract_profile_features(profile)
         total_score = 0.0
         max_score = 0.0
         
         # Score technical skills match (40% weight)
-        profile_skills = []
-        if "skills" in profile:
-            skills = profile["skills"]
-            if isinstance(skills, dict):
-                for skill_type in ["technical", "soft", "languages", "certifications"]:
-                    if skill_type in skills and isinstance(skills[skill_type], list):
-                        profile_skills.extend([skill.lower() for skill in skills[skill_type]])
-        
+        skills_text = features["skills_text"]
         required_skills = [skill.lower() for skill in job_requirements.get("required_skills", [])]
         preferred_skills = [skill.lower() for skill in job_requirements.get("preferred_skills", [])]
         
@@ -201,11 +367,11 @@ class JobAnalyzer:
         skills_max = 40.0
         
         if required_skills:
-            required_matches = sum(1 for skill in required_skills if any(skill in ps for ps in profile_skills))
+            required_matches = sum(1 for skill in required_skills if features["skills"] and skill in skills_text)
             skills_score += (required_matches / len(required_skills)) * 30.0
         
         if preferred_skills:
-            preferred_matches = sum(1 for skill in preferred_skills if any(skill in ps for ps in profile_skills))
+            preferred_matches = sum(1 for skill in preferred_skills if features["skills"] and skill in skills_text)
             skills_score += (preferred_matches / len(preferred_skills)) * 10.0
         
         total_score += skills_score
@@ -215,17 +381,10 @@ class JobAnalyzer:
         experience_score = 0.0
         experience_max = 30.0
         
-        if "work_experience" in profile and isinstance(profile["work_experience"], list):
-            total_experience = len(profile["work_experience"])
-            
+        total_experience = features["experience_count"]
+        if total_experience is not None:
             # Extract required years from job requirements
-            exp_requirement = job_requirements.get("experience_level", "")
-            required_years = 0
-            
-            if exp_requirement:
-                years_match = re.search(r'(\d+)', exp_requirement)
-                if years_match:
-                    required_years = int(years_match.group(1))
+            required_years = self.extract_experience_years(job_requirements.get("experience_level", "")) or 0
             
             if required_years > 0:
                 if total_experience >= required_years:
@@ -242,8 +401,8 @@ class JobAnalyzer:
         education_score = 0.0
         education_max = 20.0
         
-        if "education" in profile and isinstance(profile["education"], list):
-            profile_education = [edu.get("degree", "").lower() for edu in profile["education"]]
+        profile_education = features["education"]
+        if profile_education is not None:
             job_education = job_requirements.get("education_requirements", "").lower()
             
             if job_education:
@@ -261,16 +420,7 @@ class JobAnalyzer:
         summary_score = 0.0
         summary_max = 10.0
         
-        profile_text = ""
-        if "summary" in profile:
-            profile_text += profile["summary"].lower()
-        
-        # Add work experience descriptions
-        if "work_experience" in profile:
-            for exp in profile["work_experience"]:
-                if "description" in exp:
-                    profile_text += " " + exp["description"].lower()
-        
+        profile_text = features["text"]
         if profile_text and required_skills:
             matches = sum(1 for skill in required_skills if skill in profile_text)
             summary_score = (matches / len(required_skills)) * summary_max
@@ -279,4 +429,4 @@ class JobAnalyzer:
         max_score += summary_max
         
         # Return normalized score
-        return min(total_score / max_score, 1.0) if max_score > 0 else 0.0
\ No newline at end of file
+        return min(total_score / max_score, 1.0) if max_score > 0 else 0.0
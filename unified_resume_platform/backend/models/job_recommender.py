@@ -0,0 +1,186 @@
+"""
+Job Recommender - Scores one profile against many analyzed jobs in a single vectorized pass
+"""
+
+import time
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+from .job_analyzer import JobAnalyzer
+
+
+class JobRecommender:
+    """Ranks analyzed job postings for a profile using array-encoded requirements
+
+    Produces the same scores as ``JobAnalyzer.calculate_relevance_score`` but
+    encodes every job's requirements once, so ranking N jobs costs one matrix
+    product instead of N nested skill loops.
+    """
+
+    def __init__(self, job_analyzer: Optional[JobAnalyzer] = None):
+        """Initialize an empty index"""
+        self.job_analyzer = job_analyzer or JobAnalyzer()
+        self.jobs: List[Dict[str, Any]] = []
+        self.skill_vocabulary: List[str] = []
+        self.built_at = 0.0
+        self.version = 0  # Bumped whenever any job's encoding changes
+
+    def build_index(self, jobs: List[Dict[str, Any]]) -> None:
+        """Encode job requirements as skill-count matrices and per-job arrays"""
+        vocabulary: Dict[str, int] = {}
+        for job in jobs:
+            for skill in job.get("required_skills", []) + job.get("preferred_skills", []):
+                vocabulary.setdefault(skill.lower(), len(vocabulary))
+
+        n_jobs, n_skills = len(jobs), len(vocabulary)
+        required = np.zeros((n_jobs, n_skills), dtype=np.float64)
+        preferred = np.zeros((n_jobs, n_skills), dtype=np.float64)
+        required_years = np.zeros(n_jobs, dtype=np.float64)
+        education = []
+
+        for row, job in enumerate(jobs):
+            for skill in job.get("required_skills", []):
+                required[row, vocabulary[skill.lower()]] += 1
+            for skill in job.get("preferred_skills", []):
+                preferred[row, vocabulary[skill.lower()]] += 1
+
+            years = job.get("experience_years")
+            if years is None:
+                years = self.job_analyzer.extract_experience_years(job.get("experience_level", ""))
+            required_years[row] = years or 0
+            education.append((job.get("education_requirements") or "").lower())
+
+        # Jobs share a handful of distinct education strings; score each string once
+        education_values, education_codes = np.unique(np.array(education, dtype=object), return_inverse=True)
+
+        self.jobs = jobs
+        self.skill_vocabulary = list(vocabulary)
+        self._required = required
+        self._preferred = preferred
+        self._required_counts = required.sum(axis=1)
+        self._preferred_counts = preferred.sum(axis=1)
+        self._required_years = required_years
+        self._education_values = list(education_values)
+        self._education_codes = education_codes
+        self.built_at = time.time()
+        self.version += 1
+
+    def update_job(self, job: Dict[str, Any]) -> bool:
+        """Re-encode a single indexed job after its requirements changed
+
+        Only the job's own row is rewritten; the index is rebuilt only when the
+        job introduces skills the vocabulary has not seen. Jobs missing from the
+        index (inactive, drafts, or added since it was built) are left to the
+        next build_index, which knows their status and details; returns whether
+        the job was indexed.
+        """
+        row = next((i for i, existing in enumerate(self.jobs) if existing.get("job_id") == job.get("job_id")), None)
+        if row is None:
+            return False
+        merged = {**self.jobs[row], **job}
+        if "experience_level" in job and "experience_years" not in job:
+            # Required years follow the level; the old count would outlive an edited level
+            merged.pop("experience_years", None)
+
+        skills = [skill.lower() for skill in merged.get("required_skills", []) + merged.get("preferred_skills", [])]
+        vocabulary = {skill: column for column, skill in enumerate(self.skill_vocabulary)}
+
+        if any(skill not in vocabulary for skill in skills):
+            jobs = list(self.jobs)
+            jobs[row] = merged
+            self.build_index(jobs)
+            return True
+
+        self.version += 1
+        self.jobs[row] = merged
+
+        self._required[row] = 0
+        self._preferred[row] = 0
+        for skill in merged.get("required_skills", []):
+            self._required[row, vocabulary[skill.lower()]] += 1
+        for skill in merged.get("preferred_skills", []):
+            self._preferred[row, vocabulary[skill.lower()]] += 1
+        self._required_counts[row] = self._required[row].sum()
+        self._preferred_counts[row] = self._preferred[row].sum()
+
+        years = merged.get("experience_years")
+        if years is None:
+            years = self.job_analyzer.extract_experience_years(merged.get("experience_level", ""))
+        self._required_years[row] = years or 0
+
+        education = (merged.get("education_requirements") or "").lower()
+        if education not in self._education_values:
+            self._education_values.append(education)
+        self._education_codes[row] = self._education_values.index(education)
+        return True
+
+    def score_jobs(self, profile: Dict[str, Any], profile_features: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Return the relevance score of every indexed job for the profile"""
+        n_jobs = len(self.jobs)
+        if not profile or n_jobs == 0:
+            return np.zeros(n_jobs, dtype=np.float64)
+
+        features = profile_features or self.job_analyzer.extract_profile_features(profile)
+
+        # Which vocabulary skills the profile covers, computed once per profile
+        skills_text = features["skills_text"]
+        has_skills = bool(features["skills"])
+        skill_hits = np.array(
+            [has_skills and skill in skills_text for skill in self.skill_vocabulary], dtype=np.float64
+        )
+        text_hits = np.array(
+            [skill in features["text"] for skill in self.skill_vocabulary], dtype=np.float64
+        )
+
+        required_counts = self._required_counts
+        preferred_counts = self._preferred_counts
+        safe_required = np.maximum(required_counts, 1)
+        safe_preferred = np.maximum(preferred_counts, 1)
+
+        # Skills (40%)
+        scores = np.where(required_counts > 0, (self._required @ skill_hits) / safe_required * 30.0, 0.0)
+        scores += np.where(preferred_counts > 0, (self._preferred @ skill_hits) / safe_preferred * 10.0, 0.0)
+
+        # Experience (30%)
+        total_experience = features["experience_count"]
+        if total_experience is not None:
+            years = self._required_years
+            ratio = np.minimum(total_experience / np.maximum(years, 1), 1.0)
+            scores += np.where(years > 0, ratio * 30.0, 15.0)
+
+        # Education (20%)
+        profile_education = features["education"]
+        if profile_education is not None:
+            per_value = np.array([
+                (20.0 if any(edu in value for edu in profile_education if edu) else 6.0) if value else 10.0
+                for value in self._education_values
+            ], dtype=np.float64)
+            scores += per_value[self._education_codes]
+
+        # Summary and descriptions (10%)
+        if features["text"]:
+            scores += np.where(required_counts > 0, (self._required @ text_hits) / safe_required * 10.0, 0.0)
+
+        return np.minimum(scores / 100.0, 1.0)
+
+    def recommend(self, profile: Dict[str, Any], top_k: int = 10) -> List[Dict[str, Any]]:
+        """Return the top-k jobs for the profile, best first"""
+        scores = self.score_jobs(profile)
+        if scores.size == 0 or top_k <= 0:
+            return []
+
+        top_k = min(top_k, scores.size)
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [
+            {
+                "job_id": self.jobs[i].get("job_id"),
+                "job_title": self.jobs[i].get("job_title", ""),
+                "company_name": self.jobs[i].get("company_name", ""),
+                "location": self.jobs[i].get("location", ""),
+                "relevance_score": round(float(scores[i]), 4)
+            }
+            for i in ranked
+        ]
@@ -0,0 +1,135 @@
+"""
+Keyword Matcher - Finds which job keywords occur in a text, compiled once and reused across texts
+"""
+
+import copy
+import re
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List
+
+
+class KeywordMatcher:
+    """Substring matcher for a fixed keyword set, compiled once and reused across texts
+
+    Answers ``keyword in text`` for every keyword at once. Small keyword sets
+    are scanned literally (CPython's substring search beats any Python-level
+    automaton there); larger ones are compiled into a trie-shaped regex that
+    reads each text once regardless of the number of keywords, and each
+    text's scan is remembered so a description scored by several resume
+    sections is only read once. Subsets share the compiled trie and its scans.
+    """
+
+    # Keyword count above which the compiled trie beats per-keyword scans
+    trie_threshold = 100
+
+    def __init__(self, keywords: Iterable[str]):
+        """Compile the matcher for the given keywords (matching is case-insensitive)"""
+        unique = self._set_keywords(keywords)
+
+        self._pattern = None
+        if len(unique) > self.trie_threshold:
+            # At each position the trie takes the longest keyword starting there;
+            # shorter keywords inside it are recovered from the containment table
+            self._pattern = re.compile("(?=(" + self._trie_pattern(self._build_trie(unique)) + "))")
+            self._contained = {keyword: [other for other in unique if other in keyword] for keyword in unique}
+            self._scans: Dict[str, FrozenSet[str]] = {}
+
+    def subset(self, keywords: Iterable[str]) -> "KeywordMatcher":
+        """Matcher restricted to some of this matcher's keywords, sharing its compiled trie"""
+        view = copy.copy(self)
+        view._set_keywords(keywords)
+        return view
+
+    # Every method takes ``lowered=True`` for texts the caller already lowercased
+
+    def count(self, text: str, lowered: bool = False) -> int:
+        """Number of this matcher's keywords occurring in text, counting repeated keywords"""
+        return self.count_all((text,), lowered)
+
+    def count_all(self, texts: Iterable[str], lowered: bool = False) -> int:
+        """Sum of ``count`` over several texts, in a single call"""
+        total = 0
+        weights = self.weights
+        if self._pattern is None:
+            # Plain loops: per text this is as cheap as the inline scans it replaces
+            literals = self._literals
+            repeated = self._repeated
+            for text in texts:
+                if not lowered:
+                    text = text.lower()
+                total += self._always_weight
+                for keyword in literals:
+                    if keyword in text:
+                        total += weights[keyword] if repeated else 1
+            return total
+
+        for text in texts:
+            if not lowered:
+                text = text.lower()
+            count = self._counts.get(text)
+            if count is None:
+                count = self._always_weight + sum([weights[keyword] for keyword in self._scan(text) & self._keyword_set])
+                self._counts[text] = count
+            total += count
+        return total
+
+    def matches_any(self, text: str, lowered: bool = False) -> bool:
+        """Whether any of this matcher's keywords occurs in text"""
+        if self._always_weight:
+            return True
+        if not lowered:
+            text = text.lower()
+        if self._pattern is None:
+            for keyword in self._literals:
+                if keyword in text:
+                    return True
+            return False
+        return not self._scan(text).isdisjoint(self._keyword_set)
+
+    def within_any(self, text: str, lowered: bool = False) -> bool:
+        """Whether text occurs inside any of this matcher's keywords"""
+        if not self.weights:
+            return False
+        # NUL never occurs in a keyword, so a hit lies within a single keyword
+        return (text if lowered else text.lower()) in self._joined
+
+    def _set_keywords(self, keywords: Iterable[str]) -> List[str]:
+        """Set the keywords this matcher reports on and reset its per-text caches"""
+        self.weights: Dict[str, int] = Counter(keyword.lower() for keyword in keywords)
+        unique = [keyword for keyword in self.weights if keyword]
+        self._literals = tuple(unique)
+        self._repeated = any(weight > 1 for weight in self.weights.values())
+        self._keyword_set = frozenset(unique)
+        # The empty keyword is a substring of everything
+        self._always_weight = self.weights.get("", 0)
+        self._joined = "\0".join(self.weights)
+        self._counts: Dict[str, int] = {}
+        return unique
+
+    def _scan(self, text: str) -> FrozenSet[str]:
+        """All compiled keywords occurring in lowercased text, shared by every subset"""
+        hits = self._scans.get(text)
+        if hits is None:
+            found = set()
+            for match in set(self._pattern.findall(text)):
+                found.update(self._contained[match])
+            hits = frozenset(found)
+            self._scans[text] = hits
+        return hits
+
+    def _build_trie(self, keywords: Iterable[str]) -> Dict[str, Any]:
+        trie: Dict[str, Any] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return trie
+
+    def _trie_pattern(self, node: Dict[str, Any]) -> str:
+        """Regex for a trie node; optional tails are greedy so longer keywords win"""
+        branches = [re.escape(char) + self._trie_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{pattern})?" if "" in node else pattern
@@ -3,6 +3,8 @@ import numpy as np
 import pandas as pd
 import nltk
 import re
+import time
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from nltk.corpus import stopwords
@@ -68,22 +70,33 @@ class ResumeMatcher:
                 
         return found_skills
     
-    def calculate_match_score(self, resume_text, job_description):
-        """Calculate match score between resume and job description"""
+    def calculate_match_score(self, resume_text, job_description, timings=None):
+        """Calculate match score between resume and job description
+
+        When a timings dict is given, the seconds spent in the preprocess
+        and tfidf stages are stored in it.
+        """
         # Preprocess texts
+        started = time.perf_counter()
         processed_resume = self.preprocess_text(resume_text)
         processed_jd = self.preprocess_text(job_description)
+        if timings is not None:
+            timings['preprocess'] = time.perf_counter() - started
         
         if not processed_resume or not processed_jd:
             return 0.0, [], []
         
         # Create TF-IDF vectors
         try:
-            tfidf_matrix = self.vectorizer.fit_transform([processed_resume, processed_jd])
+            started = time.perf_counter()
+            # Fitted on a copy: the configured vectorizer is shared by every request thread
+            tfidf_matrix = clone(self.vectorizer).fit_transform([processed_resume, processed_jd])
             
             # Calculate cosine similarity
             similarity_matrix = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
             match_score = similarity_matrix[0][0] * 100
+            if timings is not None:
+                timings['tfidf'] = time.perf_counter() - started
             
             # Extract skills from both documents
             resume_skills = self.extract_skills(resume_text)
@@ -104,10 +117,23 @@ class ResumeMatcher:
             print(f"Error calculating match score: {e}")
             return 0.0, [], []
     
-    def get_match_analysis(self, resume_text, job_description):
+    def get_match_analysis(self, resume_text, job_description, timings=None):
         """Get detailed match analysis"""
-        score, resume_skills, jd_skills = self.calculate_match_score(resume_text, job_description)
+        score, resume_skills, jd_skills = self.calculate_match_score(resume_text, job_description, timings)
+        return self._analysis(score, resume_skills, jd_skills)
+    
+    def get_skills_analysis(self, resume_text, job_description):
+        """Match analysis from skills alone, skipping preprocessing and TF-IDF
         
+        Much cheaper than get_match_analysis. With no content similarity to
+        weigh in, the match score is the skill match percentage.
+        """
+        resume_skills = self.extract_skills(resume_text)
+        jd_skills = self.extract_skills(job_description)
+        score = len(set(resume_skills) & set(jd_skills)) / len(jd_skills) * 100 if jd_skills else 0
+        return self._analysis(score, resume_skills, jd_skills)
+    
+    def _analysis(self, score, resume_skills, jd_skills):
         # Find matching and missing skills
         matching_skills = set(resume_skills) & set(jd_skills)
         missing_skills = set(jd_skills) - set(resume_skills)
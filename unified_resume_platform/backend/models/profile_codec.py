@@ -0,0 +1,89 @@
+"""
+Profile Codec - Serializes stored profiles with the fastest installed library
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class ProfileCodec:
+    """Stdlib JSON, the fallback every installation can read and write
+
+    Codecs turn a profile into the bytes of a snapshot file and back. The
+    file extension names the format, so snapshots written by one codec are
+    still found, and migrated, by a manager configured with another.
+    """
+
+    name = "json"
+    extension = ".json"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        return json.loads(raw)
+
+
+class OrjsonCodec(ProfileCodec):
+    """JSON through orjson: same files as the stdlib codec, several times faster"""
+
+    name = "orjson"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data)
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        return orjson.loads(raw)
+
+
+class MsgpackCodec(ProfileCodec):
+    """MessagePack: compact binary snapshots, no longer readable as text"""
+
+    name = "msgpack"
+    extension = ".msgpack"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        return msgpack.unpackb(raw, raw=False)
+
+
+# Codec name -> (class, whether its library is installed)
+CODECS = {
+    "json": (ProfileCodec, True),
+    "orjson": (OrjsonCodec, orjson is not None),
+    "msgpack": (MsgpackCodec, msgpack is not None)
+}
+
+
+def available_codecs() -> List[str]:
+    """Names of the codecs whose libraries are installed"""
+    return [name for name, (_, installed) in CODECS.items() if installed]
+
+
+def get_codec(name: Optional[str] = None) -> ProfileCodec:
+    """Codec by name; by default the fastest installed JSON codec
+
+    Naming a codec whose library is missing falls back to stdlib JSON.
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "json"
+    if name not in CODECS:
+        raise ValueError(f"Unknown profile codec: {name}")
+
+    codec_class, installed = CODECS[name]
+    if not installed:
+        print(f"Profile codec {name} is not installed, using json")
+        return ProfileCodec()
+    return codec_class()
@@ -2,31 +2,108 @@
 Profile Manager - Handles user profile CRUD operations with JSON persistence
 """
 
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional, Any
+import re
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Tuple
 from datetime import datetime
 
+from .profile_codec import ProfileCodec, available_codecs, get_codec
+from .profile_validator import ProfileValidator
+
+# Profile used when callers do not name one; the legacy single profile.json migrates to it
+DEFAULT_PROFILE_ID = "default"
+
+# Profile IDs double as file names, so they are limited to filename-safe characters
+PROFILE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class _CachedProfile(NamedTuple):
+    signature: Tuple[Any, Any]   # (snapshot, change log) file signatures; the log's is None when absent
+    profile: Dict[str, Any]
+    base: Optional[str]          # updated_at of the snapshot that change log records apply to
+    log_records: int
+    encoded: bytes               # the profile in this manager's codec, decoded afresh for every caller
+
 
 class ProfileManager:
-    """Manages user profile data with JSON-based persistence"""
+    """Manages user profile data with JSON-based persistence
+
+    Each profile is its own snapshot file, sharded by a hash of its ID into
+    ``profiles/<ab>/<cd>/<profile_id><extension>`` so that no directory grows
+    with the number of users and finding a profile never scans anything.
+    Snapshots are encoded by a pluggable codec (profile_codec), by default
+    the fastest installed JSON library; snapshots found in another codec's
+    format are re-encoded with this one the first time they are loaded.
+    A SQLite index of IDs and metadata serves listings; it is derived from
+    the files and rebuilt from them when missing.
+    
+    Snapshots are replaced atomically (temp file, fsync, rename). Updates
+    append their field-level changes, as JSON lines whatever the snapshot
+    codec, to ``<profile_id>.log`` next to the
+    snapshot instead of rewriting it, and the log is folded back into a
+    new snapshot every compact_after records. Each record names the
+    snapshot it applies to, so records left behind by a crash during
+    compaction are ignored rather than replayed onto a newer snapshot.
+    Writes are serialized within a process; concurrent writers to the same
+    profile from several processes may lose an update, never corrupt it.
+    
+    A profile saved with an owner (the web app passes the session that
+    created it) records it under "owner", keeps it across updates, and
+    refuses saves by anyone else; saves without an owner are trusted.
     
-    def __init__(self, data_dir: str = "data"):
+    Loaded profiles are kept in a bounded in-memory cache, validated on
+    every load against the files' mtime, size and inode, so unchanged
+    profiles cost two stat() calls and writes by other processes are still
+    seen. The cache keeps its own copy of each profile and callers get
+    theirs, since updates are diffed against the cached copy: a loaded
+    profile edited in place and saved would otherwise match itself.
+    Callers' copies are decoded from the cached snapshot bytes, which
+    costs a fraction of a deep copy of the cached dict.
+    """
+    
+    def __init__(self, data_dir: str = "data", max_cached_profiles: int = 1024, compact_after: int = 50,
+                 codec: Optional[ProfileCodec] = None):
         """Initialize ProfileManager with data directory"""
         self.data_dir = data_dir
-        self.profile_file = os.path.join(data_dir, "profile.json")
+        self.codec = codec or get_codec()
+        self._log_codec = get_codec()
+        # Every installed format, by file extension, so snapshots in any of them can be migrated
+        self._readable_codecs = {get_codec(name).extension: get_codec(name) for name in available_codecs()}
+        self._readable_codecs[self.codec.extension] = self.codec
+        self.max_cached_profiles = max_cached_profiles
+        self.compact_after = compact_after
+        self._validator = ProfileValidator(self.get_profile_schema())
+        self._cache: "OrderedDict[str, _CachedProfile]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self.profiles_dir = os.path.join(data_dir, "profiles")
+        self.index_file = os.path.join(self.profiles_dir, "index.sqlite3")
+        self.legacy_profile_file = os.path.join(data_dir, "profile.json")
         self._ensure_data_directory()
+        self._init_index()
+        self._migrate_legacy_profile()
     
     def _ensure_data_directory(self) -> None:
         """Create data directory if it doesn't exist"""
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        if not os.path.exists(self.profiles_dir):
+            os.makedirs(self.profiles_dir)
     
-    def create_profile(self, profile_data: Dict[str, Any]) -> bool:
-        """Create a new profile with validation"""
+    def create_profile(self, profile_data: Dict[str, Any], profile_id: str = DEFAULT_PROFILE_ID,
+                       validate: bool = True, owner: Optional[str] = None) -> bool:
+        """Create a new profile with validation (skipped when the caller has already validated it)
+
+        With an owner, an existing profile is only replaced when it belongs to that owner.
+        """
         try:
             # Validate profile data
-            validation_errors = self.validate_profile(profile_data)
+            validation_errors = self.validate_profile(profile_data) if validate else []
             if validation_errors:
                 raise ValueError(f"Profile validation failed: {', '.join(validation_errors)}")
             
@@ -35,8 +112,11 @@ class ProfileManager:
             profile_data["updated_at"] = datetime.now().isoformat()
             
             # Save to file
-            with open(self.profile_file, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=2, ensure_ascii=False)
+            with self._write_lock:
+                if owner is not None:
+                    self._check_owner(profile_id, self._load(profile_id), owner)
+                    profile_data["owner"] = owner
+                self._write_profile(profile_id, profile_data)
             
             return True
             
@@ -44,40 +124,51 @@ class ProfileManager:
             print(f"Error creating profile: {e}")
             return False
     
-    def load_profile(self) -> Optional[Dict[str, Any]]:
+    def load_profile(self, profile_id: str = DEFAULT_PROFILE_ID) -> Optional[Dict[str, Any]]:
         """Load existing profile from file"""
         try:
-            if not os.path.exists(self.profile_file):
-                return None
-                
-            with open(self.profile_file, 'r', encoding='utf-8') as f:
-                profile_data = json.load(f)
-                
-            return profile_data
+            cached = self._load(profile_id)
+            return self.codec.decode(cached.encoded) if cached else None
             
         except Exception as e:
             print(f"Error loading profile: {e}")
             return None
     
-    def update_profile(self, profile_data: Dict[str, Any]) -> bool:
-        """Update existing profile with validation"""
+    def update_profile(self, profile_data: Dict[str, Any], profile_id: str = DEFAULT_PROFILE_ID,
+                       validate: bool = True, owner: Optional[str] = None) -> bool:
+        """Update existing profile with validation (skipped when the caller has already validated it)
+
+        With an owner, only a profile belonging to that owner (or a new one) is saved.
+        """
         try:
             # Validate profile data
-            validation_errors = self.validate_profile(profile_data)
+            validation_errors = self.validate_profile(profile_data) if validate else []
             if validation_errors:
                 raise ValueError(f"Profile validation failed: {', '.join(validation_errors)}")
             
-            # Preserve creation date if it exists
-            existing_profile = self.load_profile()
-            if existing_profile and "created_at" in existing_profile:
-                profile_data["created_at"] = existing_profile["created_at"]
-            
-            # Update timestamp
-            profile_data["updated_at"] = datetime.now().isoformat()
-            
-            # Save to file
-            with open(self.profile_file, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=2, ensure_ascii=False)
+            with self._write_lock:
+                # Preserve creation date if it exists
+                existing = self._load(profile_id)
+                if owner is not None:
+                    self._check_owner(profile_id, existing, owner)
+                if existing and "created_at" in existing.profile:
+                    profile_data["created_at"] = existing.profile["created_at"]
+                
+                # Ownership is the store's to keep, whatever the caller sent
+                profile_data.pop("owner", None)
+                if existing and "owner" in existing.profile:
+                    profile_data["owner"] = existing.profile["owner"]
+                elif owner is not None:
+                    profile_data["owner"] = owner
+                
+                # Update timestamp
+                profile_data["updated_at"] = datetime.now().isoformat()
+                
+                # Append the changes, or compact everything into a new snapshot
+                if existing is None or existing.log_records >= self.compact_after:
+                    self._write_profile(profile_id, profile_data)
+                else:
+                    self._append_changes(profile_id, existing, profile_data)
             
             return True
             
@@ -85,85 +176,361 @@ class ProfileManager:
             print(f"Error updating profile: {e}")
             return False
     
-    def delete_profile(self) -> bool:
+    def delete_profile(self, profile_id: str = DEFAULT_PROFILE_ID) -> bool:
         """Delete existing profile"""
         try:
-            if os.path.exists(self.profile_file):
-                os.remove(self.profile_file)
+            profile_file = self.profile_path(profile_id)
+            paths = [self._snapshot_path(profile_id, extension) for extension in self._readable_codecs]
+            with self._write_lock:
+                for path in paths + [self._log_path(profile_file)]:
+                    if os.path.exists(path):
+                        os.remove(path)
+                self._forget(profile_id)
+                with self._connect_index() as index:
+                    index.execute("DELETE FROM profiles WHERE profile_id = ?", (profile_id,))
             return True
             
         except Exception as e:
             print(f"Error deleting profile: {e}")
             return False
+
+    def import_profiles(self, records: List[Tuple[str, Dict[str, Any]]], replace: bool = False) -> List[List[str]]:
+        """Validate and store a batch of (profile_id, profile) records
+        
+        Snapshots are written one by one but indexed in a single transaction.
+        Existing profiles are kept unless replace is set; a replaced profile
+        keeps its creation date and owner. Returns each record's errors, in order, with
+        an empty list for every record that was stored.
+        """
+        results = []
+        stored = []
+        with self._write_lock:
+            for profile_id, profile_data in records:
+                try:
+                    if not self.is_valid_profile_id(profile_id):
+                        errors = [f"Invalid profile ID: {profile_id!r}"]
+                    else:
+                        errors = self.validate_profile(profile_data)
+                    if not errors:
+                        existing = self._load(profile_id)
+                        if existing is not None and not replace:
+                            errors = [f"Profile already exists: {profile_id}"]
+                    if errors:
+                        results.append(errors)
+                        continue
+                    
+                    now = datetime.now().isoformat()
+                    profile_data["created_at"] = existing.profile.get("created_at", now) if existing else now
+                    profile_data.pop("owner", None)
+                    if existing and "owner" in existing.profile:
+                        profile_data["owner"] = existing.profile["owner"]
+                    profile_data["updated_at"] = now
+                    self._write_profile(profile_id, profile_data, index=False)
+                    stored.append((profile_id, profile_data))
+                    results.append([])
+                except Exception as e:
+                    results.append([f"Error storing profile: {e}"])
+            
+            if stored:
+                with self._connect_index() as index:
+                    for profile_id, profile_data in stored:
+                        self._index_profile(index, profile_id, profile_data)
+        return results
     
-    def validate_profile(self, profile_data: Dict[str, Any]) -> List[str]:
-        """Validate profile data against schema"""
-        errors = []
+    def list_profiles(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """List profile IDs with their timestamps, most recently updated first
+
+        Names and emails stay in the index but are left out, so the listing
+        can be shown to operators without exposing users' contact details.
+        """
+        with self._connect_index() as index:
+            rows = index.execute(
+                "SELECT profile_id, created_at, updated_at FROM profiles "
+                "ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+        return [dict(row) for row in rows]
+    
+    def count_profiles(self) -> int:
+        """Number of indexed profiles"""
+        with self._connect_index() as index:
+            return index.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+    
+    def is_valid_profile_id(self, profile_id: str) -> bool:
+        """Whether profile_id can name a profile"""
+        return isinstance(profile_id, str) and bool(PROFILE_ID_PATTERN.match(profile_id))
+    
+    def profile_path(self, profile_id: str) -> str:
+        """Path of a profile's snapshot file, computed from its ID alone"""
+        return self._snapshot_path(profile_id, self.codec.extension)
+    
+    def _snapshot_path(self, profile_id: str, extension: str) -> str:
+        if not self.is_valid_profile_id(profile_id):
+            raise ValueError(f"Invalid profile ID: {profile_id!r}")
+        digest = hashlib.sha256(profile_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.profiles_dir, digest[:2], digest[2:4], f"{profile_id}{extension}")
+    
+    def _log_path(self, profile_file: str) -> str:
+        return os.path.splitext(profile_file)[0] + ".log"
+    
+    def _load(self, profile_id: str) -> Optional[_CachedProfile]:
+        """Cached profile, re-read (snapshot plus change log) when either file changed"""
+        profile_file = self.profile_path(profile_id)
+        log_file = self._log_path(profile_file)
+        try:
+            signature = (self._file_signature(profile_file), self._file_signature(log_file, missing_ok=True))
+        except FileNotFoundError:
+            self._forget(profile_id)
+            return self._migrate_snapshot(profile_id)
         
-        # Check required top-level fields
-        required_fields = ["personal_info", "work_experience", "education", "skills"]
-        for field in required_fields:
-            if field not in profile_data:
-                errors.append(f"Missing required field: {field}")
+        with self._cache_lock:
+            cached = self._cache.get(profile_id)
+            if cached is not None and cached.signature == signature:
+                self._cache.move_to_end(profile_id)
+                return cached
         
-        # Validate personal_info
-        if "personal_info" in profile_data:
-            personal_info = profile_data["personal_info"]
-            required_personal = ["name", "email"]
-            for field in required_personal:
-                if field not in personal_info or not personal_info[field]:
-                    errors.append(f"Missing required personal info: {field}")
+        with open(profile_file, 'rb') as f:
+            encoded = f.read()
+        profile_data = self.codec.decode(encoded)
+        base = profile_data.get("updated_at")
+        log_records = 0
+        if signature[1]:
+            log_records = self._replay_log(log_file, profile_data, base)
+            encoded = self.codec.encode(profile_data)
+        
+        # The files may have changed between stat() and open(); caching under
+        # the earlier signature just makes the next load re-read them
+        cached = _CachedProfile(signature, profile_data, base, log_records, encoded)
+        self._remember(profile_id, cached)
+        return cached
+    
+    def _check_owner(self, profile_id: str, existing: Optional[_CachedProfile], owner: str) -> None:
+        if existing is not None and existing.profile.get("owner") != owner:
+            raise PermissionError(f"Profile {profile_id} belongs to another owner")
+    
+    def _migrate_snapshot(self, profile_id: str) -> Optional[_CachedProfile]:
+        """Re-encode a snapshot found in another codec's format with this manager's codec"""
+        found = []
+        for extension, codec in self._readable_codecs.items():
+            old_file = self._snapshot_path(profile_id, extension)
+            if codec is not self.codec and os.path.exists(old_file):
+                found.append((old_file, codec))
+        if not found:
+            return None
+        
+        with self._write_lock:
+            if os.path.exists(self.profile_path(profile_id)):
+                return self._load(profile_id)
             
-            # Validate email format (basic)
-            if "email" in personal_info and personal_info["email"]:
-                email = personal_info["email"]
-                if "@" not in email or "." not in email:
-                    errors.append("Invalid email format")
+            for old_file, codec in found:
+                if not os.path.exists(old_file):
+                    continue
+                with open(old_file, 'rb') as f:
+                    profile_data = codec.decode(f.read())
+                self._replay_log(self._log_path(old_file), profile_data, profile_data.get("updated_at"))
+                self._write_profile(profile_id, profile_data)
+                os.remove(old_file)
+                return self._load(profile_id)
+        return None
+    
+    def _write_profile(self, profile_id: str, profile_data: Dict[str, Any], index: bool = True) -> None:
+        """Atomically replace a profile's snapshot, dropping its change log, and index it unless told not to"""
+        profile_file = self.profile_path(profile_id)
+        directory = os.path.dirname(profile_file)
+        os.makedirs(directory, exist_ok=True)
         
-        # Validate work_experience structure
-        if "work_experience" in profile_data:
-            work_exp = profile_data["work_experience"]
-            if not isinstance(work_exp, list):
-                errors.append("work_experience must be a list")
-            else:
-                for i, exp in enumerate(work_exp):
-                    if not isinstance(exp, dict):
-                        errors.append(f"work_experience[{i}] must be a dictionary")
-                        continue
-                    
-                    required_exp_fields = ["company", "position", "start_date"]
-                    for field in required_exp_fields:
-                        if field not in exp or not exp[field]:
-                            errors.append(f"Missing required field in work_experience[{i}]: {field}")
+        # Write aside and rename, so a crash never leaves a partial snapshot
+        encoded = self.codec.encode(profile_data)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(encoded)
+                f.flush()
+                os.fsync(f.fileno())
+                # Taken from the open file, so a concurrent writer's version is never mistaken for ours
+                signature = self._file_signature(f.fileno())
+            os.replace(temp_path, profile_file)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
         
-        # Validate education structure
-        if "education" in profile_data:
-            education = profile_data["education"]
-            if not isinstance(education, list):
-                errors.append("education must be a list")
-            else:
-                for i, edu in enumerate(education):
-                    if not isinstance(edu, dict):
-                        errors.append(f"education[{i}] must be a dictionary")
-                        continue
-                    
-                    required_edu_fields = ["institution", "degree"]
-                    for field in required_edu_fields:
-                        if field not in edu or not edu[field]:
-                            errors.append(f"Missing required field in education[{i}]: {field}")
+        # Old records name the old snapshot as their base, so crashing before this is harmless
+        log_file = self._log_path(profile_file)
+        if os.path.exists(log_file):
+            os.remove(log_file)
+        
+        # Write-through: the next load is served from memory, in a copy the caller cannot change
+        self._remember(profile_id, _CachedProfile(
+            (signature, None), self.codec.decode(encoded), profile_data.get("updated_at"), 0, encoded
+        ))
+        
+        if index:
+            with self._connect_index() as connection:
+                self._index_profile(connection, profile_id, profile_data)
+    
+    def _append_changes(self, profile_id: str, existing: _CachedProfile, profile_data: Dict[str, Any]) -> None:
+        """Append the field-level difference from the existing profile to its change log"""
+        changed, removed = self._diff(existing.profile, profile_data)
+        record = {"base": existing.base, "set": changed, "unset": removed}
+        line = self._log_codec.encode(record) + b"\n"
+        
+        with open(self._log_path(self.profile_path(profile_id)), 'a+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    # Terminate a line torn by a crash so this record starts cleanly
+                    line = b"\n" + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+            log_signature = self._file_signature(f.fileno())
         
-        # Validate skills structure
-        if "skills" in profile_data:
-            skills = profile_data["skills"]
-            if not isinstance(skills, dict):
-                errors.append("skills must be a dictionary")
-            else:
-                expected_skill_types = ["technical", "soft", "languages", "certifications"]
-                for skill_type in expected_skill_types:
-                    if skill_type in skills and not isinstance(skills[skill_type], list):
-                        errors.append(f"skills.{skill_type} must be a list")
+        encoded = self.codec.encode(profile_data)
+        self._remember(profile_id, _CachedProfile(
+            (existing.signature[0], log_signature), self.codec.decode(encoded), existing.base,
+            existing.log_records + 1, encoded
+        ))
         
-        return errors
+        with self._connect_index() as index:
+            self._index_profile(index, profile_id, profile_data)
+    
+    def _replay_log(self, log_file: str, profile_data: Dict[str, Any], base: Optional[str]) -> int:
+        """Apply the change log records made against this snapshot, returning how many records it holds"""
+        records = 0
+        try:
+            with open(log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = self._log_codec.decode(line)
+                    except ValueError:
+                        # Torn by a crash mid-append; the records around it are intact
+                        continue
+                    records += 1
+                    if record.get("base") == base:
+                        self._apply_changes(profile_data, record)
+        except FileNotFoundError:
+            pass
+        return records
+    
+    def _diff(self, old: Dict[str, Any], new: Dict[str, Any], path: Tuple[str, ...] = ()) -> Tuple[list, list]:
+        """([path, value] pairs that changed, paths that were removed); nested dicts are compared by key"""
+        changed, removed = [], []
+        for key, value in new.items():
+            if key not in old:
+                changed.append([list(path + (key,)), value])
+            elif isinstance(value, dict) and isinstance(old[key], dict):
+                nested_changed, nested_removed = self._diff(old[key], value, path + (key,))
+                changed.extend(nested_changed)
+                removed.extend(nested_removed)
+            elif old[key] != value:
+                changed.append([list(path + (key,)), value])
+        removed.extend(list(path + (key,)) for key in old if key not in new)
+        return changed, removed
+    
+    def _apply_changes(self, profile_data: Dict[str, Any], record: Dict[str, Any]) -> None:
+        for path, value in record.get("set", []):
+            node = profile_data
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = value
+        for path in record.get("unset", []):
+            node = profile_data
+            for key in path[:-1]:
+                node = node.get(key, {})
+            node.pop(path[-1], None)
+    
+    def _file_signature(self, path, missing_ok: bool = False) -> Optional[Tuple[int, int, int]]:
+        """What identifies a version of a file (path or descriptor): mtime, size and inode"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            if missing_ok:
+                return None
+            raise
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+    
+    def _remember(self, profile_id: str, cached: _CachedProfile) -> None:
+        with self._cache_lock:
+            self._cache[profile_id] = cached
+            self._cache.move_to_end(profile_id)
+            while len(self._cache) > self.max_cached_profiles:
+                self._cache.popitem(last=False)
+    
+    def _forget(self, profile_id: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(profile_id, None)
+
+    def _index_profile(self, index: sqlite3.Connection, profile_id: str, profile_data: Dict[str, Any]) -> None:
+        personal_info = profile_data.get("personal_info") or {}
+        index.execute(
+            "INSERT OR REPLACE INTO profiles (profile_id, name, email, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (profile_id, personal_info.get("name", ""), personal_info.get("email", ""),
+             profile_data.get("created_at"), profile_data.get("updated_at"))
+        )
+    
+    @contextmanager
+    def _connect_index(self) -> Iterator[sqlite3.Connection]:
+        """Open the index for one transaction, closing it afterwards"""
+        connection = sqlite3.connect(self.index_file, timeout=10)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+    
+    def _init_index(self) -> None:
+        """Create the index, rebuilding it from the profile files when it is new"""
+        is_new = not os.path.exists(self.index_file)
+        with self._connect_index() as index:
+            # WAL lets listings read while a profile is being saved
+            index.execute("PRAGMA journal_mode=WAL")
+            index.execute(
+                "CREATE TABLE IF NOT EXISTS profiles ("
+                "profile_id TEXT PRIMARY KEY, name TEXT, email TEXT, created_at TEXT, updated_at TEXT)"
+            )
+            index.execute("CREATE INDEX IF NOT EXISTS profiles_updated_at ON profiles (updated_at)")
+            if is_new:
+                self._rebuild_index(index)
+    
+    def _rebuild_index(self, index: sqlite3.Connection) -> None:
+        """Index every profile file under the shard directories"""
+        for root, _, files in os.walk(self.profiles_dir):
+            if root == self.profiles_dir:
+                continue
+            for name in files:
+                profile_id, extension = os.path.splitext(name)
+                if extension not in self._readable_codecs or not self.is_valid_profile_id(profile_id):
+                    continue
+                try:
+                    cached = self._load(profile_id)
+                except (OSError, ValueError) as e:
+                    print(f"Error indexing profile {profile_id}: {e}")
+                    continue
+                if cached is not None:
+                    self._index_profile(index, profile_id, cached.profile)
+    
+    def _migrate_legacy_profile(self) -> None:
+        """Move a single-profile deployment's profile.json into the store as the default profile"""
+        if not os.path.exists(self.legacy_profile_file):
+            return
+        try:
+            if self.load_profile(DEFAULT_PROFILE_ID) is not None:
+                print(f"Leaving {self.legacy_profile_file} in place: a default profile already exists")
+                return
+            with open(self.legacy_profile_file, 'r', encoding='utf-8') as f:
+                profile_data = json.load(f)
+            self._write_profile(DEFAULT_PROFILE_ID, profile_data)
+            os.remove(self.legacy_profile_file)
+        except Exception as e:
+            print(f"Error migrating legacy profile: {e}")
+    
+    def validate_profile(self, profile_data: Dict[str, Any]) -> List[str]:
+        """Validate profile data against schema"""
+        return self._validator.validate(profile_data)
     
     def get_profile_schema(self) -> Dict[str, Any]:
         """Get the expected profile schema structure"""
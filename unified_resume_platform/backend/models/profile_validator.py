@@ -0,0 +1,113 @@
+"""
+Profile Validator - Checks profiles in one pass over a tree resolved from the profile schema
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Sections a profile must contain
+REQUIRED_SECTIONS = ["personal_info", "work_experience", "education", "skills"]
+
+# Schema path -> (fields that must be present and non-empty, message for a missing one);
+# "[]" marks the entries of a list
+REQUIRED_FIELDS = {
+    "personal_info": (["name", "email"], "Missing required personal info: {field}"),
+    "work_experience[]": (["company", "position", "start_date"], "Missing required field in {label}: {field}"),
+    "education[]": (["institution", "degree"], "Missing required field in {label}: {field}")
+}
+
+# Schema path of a field -> (check of its non-empty value, message when the check fails)
+FIELD_CHECKS = {
+    "personal_info.email": (lambda email: isinstance(email, str) and "@" in email and "." in email,
+                            "Invalid email format")
+}
+
+# Part of the path to a value: a key, or the index of a list entry
+_LabelPart = Union[str, int]
+
+
+class _Shape(NamedTuple):
+    """What is checked of a value whose schema is a dict or a list"""
+    kind: type                    # dict or list
+    required: Tuple[str, ...]     # dict: fields that must be present and non-empty
+    message: str                  # dict: message for a missing required field
+    # dict: (key, value check, shape) of every field with a check or a dict/list schema, in schema order
+    fields: Tuple[Tuple[str, Optional[Tuple[Callable[[Any], bool], str]], Optional["_Shape"]], ...]
+    entries: Optional["_Shape"]   # list: shape of its entries when they are dicts
+
+
+class ProfileValidator:
+    """Validator resolved once from the profile schema
+
+    The schema decides the shape: sections and fields whose schema value is
+    a dict must be dictionaries and those whose value is a list must be
+    lists, with dict-shaped list entries checked recursively. Scalars are
+    not type-checked, since form input and imports disagree on them (a GPA
+    may arrive as text). Required fields and value checks come from the
+    tables above.
+
+    The schema and tables are resolved into a tree of shapes once, so
+    validating a profile is a single walk over it that looks nothing up,
+    and the text of a message is only built when there is an error to
+    report.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        self._root = self._shape("", schema)
+
+    def validate(self, profile_data: Any) -> List[str]:
+        """Every problem with the profile, in section order; empty when valid"""
+        if not isinstance(profile_data, dict):
+            return ["Profile must be a dictionary"]
+        errors = [f"Missing required field: {field}" for field in REQUIRED_SECTIONS if field not in profile_data]
+        self._check_fields(self._root, profile_data, (), errors)
+        return errors
+
+    def _shape(self, path: str, schema: Any) -> _Shape:
+        """Resolve the checks of a dict or list schema value and everything inside it"""
+        if isinstance(schema, list):
+            entries = self._shape(f"{path}[]", schema[0]) if schema and isinstance(schema[0], dict) else None
+            return _Shape(list, (), "", (), entries)
+
+        required, message = REQUIRED_FIELDS.get(path, ([], ""))
+        fields = []
+        for key, value in schema.items():
+            key_path = f"{path}.{key}" if path else key
+            check = FIELD_CHECKS.get(key_path)
+            shape = self._shape(key_path, value) if isinstance(value, (dict, list)) else None
+            if check or shape:
+                fields.append((key, check, shape))
+        return _Shape(dict, tuple(required), message, tuple(fields), None)
+
+    def _check_fields(self, shape: _Shape, value: Dict[str, Any], label: Tuple[_LabelPart, ...],
+                      errors: List[str]) -> None:
+        """Checks of the fields of a value already known to be a dict"""
+        for field in shape.required:
+            if not value.get(field):
+                errors.append(shape.message.format(label=self._label(label), field=field))
+
+        for key, check, child in shape.fields:
+            if check and value.get(key) and not check[0](value[key]):
+                errors.append(check[1])
+            if child and key in value:
+                self._check_value(child, value[key], label + (key,), errors)
+
+    def _check_value(self, shape: _Shape, value: Any, label: Tuple[_LabelPart, ...], errors: List[str]) -> None:
+        """Checks of a value whose schema is a dict or a list"""
+        if not isinstance(value, shape.kind):
+            kind = "dictionary" if shape.kind is dict else "list"
+            errors.append(f"{self._label(label)} must be a {kind}")
+        elif shape.kind is dict:
+            self._check_fields(shape, value, label, errors)
+        elif shape.entries:
+            for index, entry in enumerate(value):
+                self._check_value(shape.entries, entry, label + (index,), errors)
+
+    def _label(self, label: Tuple[_LabelPart, ...]) -> str:
+        """Path of a value as messages show it, e.g. work_experience[0]"""
+        text = ""
+        for part in label:
+            if isinstance(part, int):
+                text += f"[{part}]"
+            else:
+                text += f".{part}" if text else part
+        return text
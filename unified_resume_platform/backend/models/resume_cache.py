@@ -0,0 +1,67 @@
+"""
+Resume Cache - Remembers generated resumes so repeat generations skip recomputation
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from .resume_generator import GENERATOR_VERSION
+
+
+class ResumeCache:
+    """LRU cache of generated resumes keyed by profile, job analysis and generator version
+
+    Keys double as resume handles: clients keep the key returned by
+    generation and later ask for the resume by it. Entries are shared
+    between requests, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        """Initialize an empty cache holding at most max_entries resumes"""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, profile: Dict[str, Any], job_analysis: Dict[str, Any]) -> str:
+        """Build the cache key (resume handle) for a profile and job analysis
+
+        Profiles are hashed by content rather than updated_at, since unsaved
+        edits arrive with the old timestamp. The year is part of the key
+        because experience recency bonuses depend on it.
+        """
+        parts = [self._digest(profile), self._digest(job_analysis), GENERATOR_VERSION, str(datetime.now().year)]
+        return hashlib.sha256(":".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached resume for key, marking it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a generated resume, evicting the least recently used ones beyond max_entries"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached resume"""
+        with self._lock:
+            self._entries.clear()
+
+    def _digest(self, data: Dict[str, Any]) -> str:
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -2,9 +2,17 @@
 Resume Generator - Creates tailored resumes based on profile and job analysis
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
 import re
+from collections import ChainMap
 from datetime import datetime
+from types import MappingProxyType
+
+from .keyword_matcher import KeywordMatcher
+from .resume_renderer import MAX_ACHIEVEMENTS, MAX_PROJECTS, ResumeRenderer
+
+# Bump whenever a change alters generated resumes, so cached resumes are not reused
+GENERATOR_VERSION = "1"
 
 
 class ResumeGenerator:
@@ -13,6 +21,7 @@ class ResumeGenerator:
     def __init__(self):
         """Initialize ResumeGenerator with formatting settings"""
         self.max_lines = 50  # Approximate lines for 1-2 pages
+        self.renderer = ResumeRenderer()
         self.section_priorities = {
             "personal_info": 1,
             "summary": 2,
@@ -22,13 +31,22 @@ class ResumeGenerator:
             "projects": 6
         }
     
-    def generate_resume(self, profile: Dict[str, Any], job_analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate a tailored resume based on profile and job analysis"""
+    def generate_resume(self, profile: Dict[str, Any], job_analysis: Dict[str, Any],
+                        prepared_profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate a tailored resume based on profile and job analysis
+        
+        Pass the result of ``prepare_profile`` when tailoring one profile to many jobs.
+        """
         if not profile:
             raise ValueError("Profile data is required")
         
+        # Compile the job keywords once; every section scores against the same matcher
+        required_skills = job_analysis.get("required_skills", [])
+        job_matcher = KeywordMatcher(required_skills + job_analysis.get("preferred_skills", []))
+        required_matcher = job_matcher.subset(required_skills)
+        
         # Prioritize content based on job relevance
-        prioritized_content = self.prioritize_content(profile, job_analysis.get("required_skills", []))
+        prioritized_content = self.prioritize_content(profile, required_matcher, prepared_profile)
         
         # Generate tailored sections
         resume_data = {
@@ -43,7 +61,8 @@ class ResumeGenerator:
             ),
             "skills": self._generate_skills_section(
                 prioritized_content.get("skills", {}),
-                job_analysis
+                job_analysis,
+                job_matcher
             ),
             "education": self._generate_education_section(
                 prioritized_content.get("education", [])
@@ -54,218 +73,103 @@ class ResumeGenerator:
             )
         }
         
+        # Measure each section's rendered height without rendering it
+        layout = {section: self._measure_section(section, content) for section, content in resume_data.items()}
+        
         # Ensure resume fits within page limits
-        resume_data = self._optimize_length(resume_data)
+        resume_data = self._optimize_length(resume_data, required_matcher, layout)
         
         return resume_data
     
-    def prioritize_content(self, profile: Dict[str, Any], job_keywords: List[str]) -> Dict[str, Any]:
-        """Prioritize profile content based on job relevance"""
+    def prepare_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute the job-independent inputs of relevance scoring
+        
+        Lowercased texts and recency bonuses depend only on the profile, so a
+        profile tailored to many jobs computes them once.
+        """
+        prepared = {"work_experience": [], "skills": {}, "projects": []}
+        if not profile:
+            return prepared
+        
+        if isinstance(profile.get("work_experience"), list):
+            prepared["work_experience"] = [self._experience_features(exp) for exp in profile["work_experience"]]
+        
+        if isinstance(profile.get("skills"), dict):
+            prepared["skills"] = {
+                skill_type: [skill.lower() for skill in skill_list]
+                for skill_type, skill_list in profile["skills"].items()
+                if isinstance(skill_list, list)
+            }
+        
+        if isinstance(profile.get("projects"), list):
+            prepared["projects"] = [self._project_features(project) for project in profile["projects"]]
+        
+        return prepared
+    
+    def prioritize_content(self, profile: Dict[str, Any],
+                           job_keywords: Union[List[str], KeywordMatcher],
+                           prepared_profile: Optional[Dict[str, Any]] = None) -> Mapping[str, Any]:
+        """Prioritize profile content based on job relevance
+        
+        Returns a read-only view of the profile in which work experience,
+        skills and projects are reordered by relevance. Items are shared with
+        the profile and never modified, so one profile can be tailored to
+        several jobs concurrently.
+        """
         if not profile:
             return {}
         
-        job_keywords_lower = [keyword.lower() for keyword in job_keywords]
-        prioritized_profile = profile.copy()
+        matcher = self._keyword_matcher(job_keywords)
+        prepared = prepared_profile or self.prepare_profile(profile)
+        overrides = {}
         
         # Prioritize work experience by relevance
-        if "work_experience" in profile and isinstance(profile["work_experience"], list):
-            work_exp = profile["work_experience"].copy()
-            
-            # Score each work experience
-            for exp in work_exp:
-                exp["_relevance_score"] = self._calculate_experience_relevance(exp, job_keywords_lower)
+        work_exp = profile.get("work_experience")
+        if isinstance(work_exp, list):
+            scores = [
+                self._calculate_experience_relevance(exp, matcher, features)
+                for exp, features in zip(work_exp, prepared["work_experience"])
+            ]
             
             # Sort by relevance score (descending) and recency
-            work_exp.sort(key=lambda x: (x.get("_relevance_score", 0), x.get("start_date", "")), reverse=True)
-            
-            # Remove scoring field
-            for exp in work_exp:
-                exp.pop("_relevance_score", None)
-            
-            prioritized_profile["work_experience"] = work_exp
+            order = sorted(
+                range(len(scores)),
+                key=lambda i: (scores[i], work_exp[i].get("start_date", "")),
+                reverse=True
+            )
+            overrides["work_experience"] = tuple(work_exp[i] for i in order)
         
         # Prioritize skills by relevance
-        if "skills" in profile and isinstance(profile["skills"], dict):
-            skills = profile["skills"].copy()
+        skills = profile.get("skills")
+        if isinstance(skills, dict):
+            prioritized_skills = dict(skills)
             
-            for skill_type in skills:
-                if isinstance(skills[skill_type], list):
-                    skill_list = skills[skill_type].copy()
-                    
-                    # Score and sort skills
-                    scored_skills = []
-                    for skill in skill_list:
-                        score = self._calculate_skill_relevance(skill, job_keywords_lower)
-                        scored_skills.append((skill, score))
-                    
-                    scored_skills.sort(key=lambda x: x[1], reverse=True)
-                    skills[skill_type] = [skill for skill, score in scored_skills]
+            for skill_type, skill_list in skills.items():
+                if isinstance(skill_list, list):
+                    scores = [
+                        self._calculate_skill_relevance(skill, matcher, skill_lower)
+                        for skill, skill_lower in zip(skill_list, prepared["skills"][skill_type])
+                    ]
+                    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+                    prioritized_skills[skill_type] = tuple(skill_list[i] for i in order)
             
-            prioritized_profile["skills"] = skills
+            overrides["skills"] = MappingProxyType(prioritized_skills)
         
         # Prioritize projects by relevance
-        if "projects" in profile and isinstance(profile["projects"], list):
-            projects = profile["projects"].copy()
-            
-            for project in projects:
-                project["_relevance_score"] = self._calculate_project_relevance(project, job_keywords_lower)
-            
-            projects.sort(key=lambda x: x.get("_relevance_score", 0), reverse=True)
-            
-            # Remove scoring field
-            for project in projects:
-                project.pop("_relevance_score", None)
-            
-            prioritized_profile["projects"] = projects
-        
-        return prioritized_profile
+        projects = profile.get("projects")
+        if isinstance(projects, list):
+            scores = [
+                self._calculate_project_relevance(project, matcher, features)
+                for project, features in zip(projects, prepared["projects"])
+            ]
+            order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+            overrides["projects"] = tuple(projects[i] for i in order)
+        
+        return MappingProxyType(ChainMap(overrides, profile))
     
     def format_resume(self, resume_data: Dict[str, Any]) -> str:
         """Format resume data into a professional text format"""
-        if not resume_data:
-            return ""
-        
-        formatted_sections = []
-        
-        # Personal Information
-        personal_info = resume_data.get("personal_info", {})
-        if personal_info:
-            header = []
-            if personal_info.get("name"):
-                header.append(personal_info["name"].upper())
-            
-            contact_info = []
-            for field in ["email", "phone", "address", "linkedin"]:
-                if personal_info.get(field):
-                    contact_info.append(personal_info[field])
-            
-            if contact_info:
-                header.append(" | ".join(contact_info))
-            
-            if header:
-                formatted_sections.append("\n".join(header))
-                formatted_sections.append("=" * 60)
-        
-        # Summary
-        summary = resume_data.get("summary", "")
-        if summary:
-            formatted_sections.append("PROFESSIONAL SUMMARY")
-            formatted_sections.append("-" * 20)
-            formatted_sections.append(summary)
-        
-        # Work Experience
-        work_exp = resume_data.get("work_experience", [])
-        if work_exp:
-            formatted_sections.append("WORK EXPERIENCE")
-            formatted_sections.append("-" * 15)
-            
-            for exp in work_exp:
-                exp_lines = []
-                
-                # Position and Company
-                position_line = ""
-                if exp.get("position"):
-                    position_line = exp["position"]
-                if exp.get("company"):
-                    position_line += f" | {exp['company']}"
-                if position_line:
-                    exp_lines.append(position_line)
-                
-                # Dates
-                date_line = ""
-                if exp.get("start_date"):
-                    date_line = exp["start_date"]
-                    if exp.get("end_date"):
-                        date_line += f" - {exp['end_date']}"
-                    else:
-                        date_line += " - Present"
-                if date_line:
-                    exp_lines.append(date_line)
-                
-                # Description
-                if exp.get("description"):
-                    exp_lines.append(f"• {exp['description']}")
-                
-                # Achievements
-                achievements = exp.get("achievements", [])
-                for achievement in achievements[:3]:  # Limit to top 3
-                    exp_lines.append(f"• {achievement}")
-                
-                if exp_lines:
-                    formatted_sections.append("\n".join(exp_lines))
-        
-        # Skills
-        skills = resume_data.get("skills", {})
-        if skills:
-            formatted_sections.append("SKILLS")
-            formatted_sections.append("-" * 6)
-            
-            for skill_type, skill_list in skills.items():
-                if skill_list:
-                    skill_type_formatted = skill_type.replace("_", " ").title()
-                    skills_text = ", ".join(skill_list[:8])  # Limit to top 8 skills
-                    formatted_sections.append(f"{skill_type_formatted}: {skills_text}")
-        
-        # Education
-        education = resume_data.get("education", [])
-        if education:
-            formatted_sections.append("EDUCATION")
-            formatted_sections.append("-" * 9)
-            
-            for edu in education:
-                edu_lines = []
-                
-                # Degree and Field
-                degree_line = ""
-                if edu.get("degree"):
-                    degree_line = edu["degree"]
-                if edu.get("field"):
-                    degree_line += f" in {edu['field']}"
-                if degree_line:
-                    edu_lines.append(degree_line)
-                
-                # Institution and Date
-                inst_line = ""
-                if edu.get("institution"):
-                    inst_line = edu["institution"]
-                if edu.get("graduation_date"):
-                    inst_line += f" | {edu['graduation_date']}"
-                if inst_line:
-                    edu_lines.append(inst_line)
-                
-                # GPA (if notable)
-                if edu.get("gpa") and edu["gpa"] >= 3.5:
-                    edu_lines.append(f"GPA: {edu['gpa']}")
-                
-                if edu_lines:
-                    formatted_sections.append("\n".join(edu_lines))
-        
-        # Projects
-        projects = resume_data.get("projects", [])
-        if projects:
-            formatted_sections.append("PROJECTS")
-            formatted_sections.append("-" * 8)
-            
-            for project in projects[:3]:  # Limit to top 3 projects
-                project_lines = []
-                
-                if project.get("name"):
-                    project_lines.append(project["name"])
-                
-                if project.get("description"):
-                    project_lines.append(f"• {project['description']}")
-                
-                if project.get("technologies"):
-                    tech_list = ", ".join(project["technologies"][:5])
-                    project_lines.append(f"Technologies: {tech_list}")
-                
-                if project.get("url"):
-                    project_lines.append(f"URL: {project['url']}")
-                
-                if project_lines:
-                    formatted_sections.append("\n".join(project_lines))
-        
-        return "\n\n".join(formatted_sections)
+        return self.renderer.render_text(resume_data)
     
     def _generate_personal_info(self, personal_info: Dict[str, Any]) -> Dict[str, Any]:
         """Generate personal information section"""
@@ -320,13 +224,14 @@ class ResumeGenerator:
         
         return tailored_experience
     
-    def _generate_skills_section(self, skills: Dict[str, List[str]], job_analysis: Dict[str, Any]) -> Dict[str, List[str]]:
+    def _generate_skills_section(self, skills: Dict[str, List[str]], job_analysis: Dict[str, Any],
+                                 job_matcher: KeywordMatcher = None) -> Dict[str, List[str]]:
         """Generate tailored skills section"""
         if not skills:
             return {}
         
-        job_skills = job_analysis.get("required_skills", []) + job_analysis.get("preferred_skills", [])
-        job_skills_lower = [skill.lower() for skill in job_skills]
+        if job_matcher is None:
+            job_matcher = KeywordMatcher(job_analysis.get("required_skills", []) + job_analysis.get("preferred_skills", []))
         
         tailored_skills = {}
         
@@ -339,7 +244,7 @@ class ResumeGenerator:
             other_skills = []
             
             for skill in skill_list:
-                if any(job_skill in skill.lower() for job_skill in job_skills_lower):
+                if job_matcher.matches_any(skill):
                     prioritized_skills.append(skill)
                 else:
                     other_skills.append(skill)
@@ -352,7 +257,7 @@ class ResumeGenerator:
     
     def _generate_education_section(self, education: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate education section"""
-        return education[:3] if education else []  # Limit to top 3
+        return list(education[:3]) if education else []  # Limit to top 3
     
     def _generate_projects_section(self, projects: List[Dict[str, Any]], job_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate tailored projects section"""
@@ -360,27 +265,54 @@ class ResumeGenerator:
             return []
         
         # Return top 3 most relevant projects (already prioritized)
-        return projects[:3]
+        return list(projects[:3])
     
-    def _calculate_experience_relevance(self, experience: Dict[str, Any], job_keywords: List[str]) -> float:
+    def _calculate_experience_relevance(self, experience: Dict[str, Any],
+                                        job_keywords: Union[List[str], KeywordMatcher],
+                                        features: Optional[Tuple[str, List[str], float]] = None) -> float:
         """Calculate relevance score for work experience"""
-        score = 0.0
+        matcher = self._keyword_matcher(job_keywords)
+        description, achievements, recency_bonus = features or self._experience_features(experience)
         
         # Check description for keyword matches
-        description = experience.get("description", "").lower()
-        for keyword in job_keywords:
-            if keyword in description:
-                score += 1.0
+        score = float(matcher.count(description, lowered=True))
         
         # Check achievements for keyword matches
-        achievements = experience.get("achievements", [])
-        for achievement in achievements:
-            achievement_lower = achievement.lower()
-            for keyword in job_keywords:
-                if keyword in achievement_lower:
-                    score += 0.5
+        score += 0.5 * matcher.count_all(achievements, lowered=True)
         
         # Bonus for recent experience
+        score += recency_bonus
+        
+        return score
+    
+    def _calculate_skill_relevance(self, skill: str, job_keywords: Union[List[str], KeywordMatcher],
+                                   skill_lower: Optional[str] = None) -> float:
+        """Calculate relevance score for a skill"""
+        matcher = self._keyword_matcher(job_keywords)
+        if skill_lower is None:
+            skill_lower = skill.lower()
+        if matcher.matches_any(skill_lower, lowered=True) or matcher.within_any(skill_lower, lowered=True):
+            return 1.0
+        return 0.0
+    
+    def _calculate_project_relevance(self, project: Dict[str, Any],
+                                     job_keywords: Union[List[str], KeywordMatcher],
+                                     features: Optional[Tuple[str, List[str]]] = None) -> float:
+        """Calculate relevance score for a project"""
+        matcher = self._keyword_matcher(job_keywords)
+        description, technologies = features or self._project_features(project)
+        
+        # Check description
+        score = float(matcher.count(description, lowered=True))
+        
+        # Check technologies
+        score += 0.5 * matcher.count_all(technologies, lowered=True)
+        
+        return score
+    
+    def _experience_features(self, experience: Dict[str, Any]) -> Tuple[str, List[str], float]:
+        """Lowercased description and achievements plus the recency bonus of an experience"""
+        recency_bonus = 0.0
         start_date = experience.get("start_date", "")
         if start_date:
             try:
@@ -390,39 +322,25 @@ class ResumeGenerator:
                     year = int(year_match.group())
                     current_year = datetime.now().year
                     if current_year - year <= 3:  # Recent experience
-                        score += 1.0
+                        recency_bonus = 1.0
             except:
                 pass
         
-        return score
-    
-    def _calculate_skill_relevance(self, skill: str, job_keywords: List[str]) -> float:
-        """Calculate relevance score for a skill"""
-        skill_lower = skill.lower()
-        for keyword in job_keywords:
-            if keyword in skill_lower or skill_lower in keyword:
-                return 1.0
-        return 0.0
+        description = experience.get("description", "").lower()
+        achievements = [achievement.lower() for achievement in experience.get("achievements", [])]
+        return description, achievements, recency_bonus
     
-    def _calculate_project_relevance(self, project: Dict[str, Any], job_keywords: List[str]) -> float:
-        """Calculate relevance score for a project"""
-        score = 0.0
-        
-        # Check description
+    def _project_features(self, project: Dict[str, Any]) -> Tuple[str, List[str]]:
+        """Lowercased description and technologies of a project"""
         description = project.get("description", "").lower()
-        for keyword in job_keywords:
-            if keyword in description:
-                score += 1.0
-        
-        # Check technologies
-        technologies = project.get("technologies", [])
-        for tech in technologies:
-            tech_lower = tech.lower()
-            for keyword in job_keywords:
-                if keyword in tech_lower:
-                    score += 0.5
-        
-        return score
+        technologies = [tech.lower() for tech in project.get("technologies", [])]
+        return description, technologies
+    
+    def _keyword_matcher(self, job_keywords: Union[List[str], KeywordMatcher]) -> KeywordMatcher:
+        """Reuse a compiled matcher, or compile one for a plain keyword list"""
+        if isinstance(job_keywords, KeywordMatcher):
+            return job_keywords
+        return KeywordMatcher(job_keywords)
     
     def _enhance_description(self, description: str, job_keywords: List[str]) -> str:
         """Enhance description with relevant keywords"""
@@ -442,34 +360,169 @@ class ResumeGenerator:
         
         return enhanced
     
-    def _optimize_length(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Optimize resume length to fit within page limits"""
-        # Estimate current length
-        formatted_text = self.format_resume(resume_data)
-        current_lines = len(formatted_text.split('\n'))
-        
-        if current_lines <= self.max_lines:
+    def _measure_section(self, section: str, content: Any) -> Tuple[List[int], List[List[int]]]:
+        """Line counts of a section's blocks, measured from the renderer's own layout
+        
+        Returns (fixed_blocks, items): the height of every always-present
+        block, and for each trimmable item its block height by number of
+        achievements kept (projects have a single option). A height of 0 means
+        the item renders no block.
+        """
+        renderer = self.renderer
+        if section not in ("work_experience", "projects"):
+            return [renderer.block_height(block) for block in renderer.section_blocks(section, content)], []
+        if not content:
+            return [], []
+        
+        heading = [renderer.block_height(renderer.heading_block(section))]
+        if section == "projects":
+            return heading, [[renderer.block_height(renderer.entry_block(section, project))]
+                             for project in content[:MAX_PROJECTS]]
+        
+        items = []
+        for exp in content:
+            achievements = exp.get("achievements", [])
+            items.append([
+                renderer.block_height(renderer.entry_block(section, {**exp, "achievements": achievements[:kept]}))
+                for kept in range(min(len(achievements), MAX_ACHIEVEMENTS) + 1)
+            ])
+        return heading, items
+    
+    def _layout_lines(self, layout: Dict[str, Tuple[List[int], List[List[int]]]]) -> int:
+        """Total line count of a fully rendered layout"""
+        blocks = []
+        for fixed, items in layout.values():
+            blocks.extend(fixed)
+            blocks.extend(options[-1] for options in items if options[-1])
+        # Blocks are separated by one blank line; an empty resume is a single empty line
+        return sum(blocks) + len(blocks) - 1 if blocks else 1
+    
+    def _optimize_length(self, resume_data: Dict[str, Any], job_keywords: Union[List[str], KeywordMatcher] = None,
+                         layout: Dict[str, Tuple[List[int], List[List[int]]]] = None) -> Dict[str, Any]:
+        """Optimize resume length to fit within page limits
+        
+        Chooses which experiences, projects and achievements to keep with a
+        knapsack over their measured line costs, maximizing relevance within
+        max_lines. Nothing is rendered to measure the resume.
+        """
+        if layout is None:
+            layout = {section: self._measure_section(section, content) for section, content in resume_data.items()}
+        
+        if self._layout_lines(layout) <= self.max_lines:
             return resume_data
         
-        # Reduce content to fit
+        matcher = self._keyword_matcher(job_keywords or [])
+        trimmable = ("work_experience", "projects")
+        
+        # Every block costs its lines plus the blank separator line, except the last one
+        capacity = self.max_lines + 1
+        for section, (fixed, items) in layout.items():
+            if section not in trimmable:
+                capacity -= sum(lines + 1 for lines in fixed)
+        
+        if capacity < 0:
+            return self._truncate_length(resume_data)
+        
+        section_tables = {}
+        for section in trimmable:
+            fixed, items = layout.get(section, ([], []))
+            values = self._item_values(section, resume_data.get(section, []), items, matcher)
+            section_tables[section] = self._knapsack_section(fixed, items, values, capacity)
+        
+        # Split capacity between the two trimmable sections
+        experience_table, project_table = section_tables["work_experience"], section_tables["projects"]
+        best_split = max(
+            range(capacity + 1),
+            key=lambda c: experience_table[c][0] + project_table[capacity - c][0]
+        )
+        experience_choice = experience_table[best_split][1]
+        project_choice = project_table[capacity - best_split][1]
+        
+        optimized_data = resume_data.copy()
+        
+        if "work_experience" in resume_data:
+            work_exp = []
+            for exp, kept in zip(resume_data["work_experience"], experience_choice):
+                if kept is None:
+                    continue
+                achievements = exp.get("achievements", [])
+                if kept < len(achievements):
+                    exp = {**exp, "achievements": achievements[:kept]}
+                work_exp.append(exp)
+            optimized_data["work_experience"] = work_exp
+        
+        if "projects" in resume_data:
+            optimized_data["projects"] = [
+                project for project, kept in zip(resume_data["projects"], project_choice) if kept is not None
+            ]
+        
+        return optimized_data
+    
+    def _item_values(self, section: str, content: List[Dict[str, Any]], items: List[List[int]],
+                     matcher: KeywordMatcher) -> List[List[float]]:
+        """Relevance gained by each option of each trimmable item"""
+        values = []
+        for rank, (item, options) in enumerate(zip(content, items)):
+            # Earlier items were ranked more relevant; break ties in their favour
+            rank_bonus = 0.01 * (len(items) - rank)
+            if section == "work_experience":
+                # Achievements are left out of the base: each kept one adds its own matches below
+                description, _, recency_bonus = self._experience_features(item)
+                relevance = self._calculate_experience_relevance(item, matcher, (description, [], recency_bonus))
+                option_values = [1.0 + rank_bonus + relevance]
+                for achievement in item.get("achievements", [])[:len(options) - 1]:
+                    gain = 0.25 + 0.5 * matcher.count(achievement)
+                    option_values.append(option_values[-1] + gain)
+            else:
+                option_values = [1.0 + rank_bonus + self._calculate_project_relevance(item, matcher)]
+            values.append(option_values)
+        return values
+    
+    def _knapsack_section(self, fixed: List[int], items: List[List[int]], values: List[List[float]],
+                          capacity: int) -> List[Tuple[float, List[Any]]]:
+        """Best (value, choices) for a section at every capacity from 0 to capacity
+        
+        Each item is either dropped (None) or kept with k achievements (k is the
+        option index). The section header is only paid for when something is kept.
+        """
+        # best[c] = (value, choices) using at most c lines for the items alone
+        best = [(0.0, [])] * (capacity + 1)
+        for options, option_values in zip(items, values):
+            next_best = []
+            for c in range(capacity + 1):
+                candidate = (best[c][0], best[c][1] + [None])
+                for kept, (lines, value) in enumerate(zip(options, option_values)):
+                    cost = lines + 1 if lines else 0
+                    if cost <= c and best[c - cost][0] + value > candidate[0]:
+                        candidate = (best[c - cost][0] + value, best[c - cost][1] + [kept])
+                next_best.append(candidate)
+            best = next_best
+        
+        header_cost = sum(lines + 1 for lines in fixed)
+        empty = (0.0, [None] * len(items))
+        table = []
+        for c in range(capacity + 1):
+            if c >= header_cost and best[c - header_cost][0] > 0:
+                table.append(best[c - header_cost])
+            else:
+                table.append(empty)
+        return table
+    
+    def _truncate_length(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fixed trimming used when the untrimmable sections alone exceed max_lines"""
         optimized_data = resume_data.copy()
         
         # Reduce work experience
         if "work_experience" in optimized_data:
-            work_exp = optimized_data["work_experience"]
-            if len(work_exp) > 3:
-                optimized_data["work_experience"] = work_exp[:3]
+            work_exp = optimized_data["work_experience"][:3]
+            # Reduce achievements per job
+            optimized_data["work_experience"] = [
+                {**exp, "achievements": exp["achievements"][:2]} if len(exp.get("achievements", [])) > 2 else exp
+                for exp in work_exp
+            ]
         
         # Reduce projects
         if "projects" in optimized_data:
-            projects = optimized_data["projects"]
-            if len(projects) > 2:
-                optimized_data["projects"] = projects[:2]
-        
-        # Reduce achievements per job
-        if "work_experience" in optimized_data:
-            for exp in optimized_data["work_experience"]:
-                if "achievements" in exp and len(exp["achievements"]) > 2:
-                    exp["achievements"] = exp["achievements"][:2]
+            optimized_data["projects"] = optimized_data["projects"][:2]
         
-        return optimized_data
\ No newline at end of file
+        return optimized_data
@@ -0,0 +1,355 @@
+"""
+Resume Renderer - Lays resume data out once as blocks and renders them as text, PDF or DOCX
+"""
+
+import copy
+from io import BytesIO
+from typing import Callable, Dict, Iterable, Iterator, List, Any, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+except ImportError:
+    getSampleStyleSheet = None
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+
+class Block(NamedTuple):
+    """One layout block: a header, a section heading or an entry made of styled lines
+
+    Line styles are "name", "contact", "title", "meta", "bullet" and "text".
+    """
+    kind: str
+    lines: Tuple[Tuple[str, str], ...]
+
+
+# Bump whenever templates or document styling change, so cached exports are re-rendered
+TEMPLATE_VERSION = "1"
+
+# Per-template text settings; a plan is compiled from each the first time it is used
+TEMPLATES = {
+    "classic": {
+        "rule": "=" * 60,
+        "underline": "-",
+        "bullet": "• ",
+        "separator": "\n\n"
+    }
+}
+
+# reportlab sample stylesheet names for each line style
+PDF_STYLES = {
+    "name": "Title",
+    "contact": "Normal",
+    "heading": "Heading2",
+    "title": "Heading4",
+    "meta": "Italic",
+    "bullet": "Normal",
+    "text": "Normal"
+}
+
+# python-docx paragraph styles for the line styles that have one; looking a
+# style up by name scans the whole stylesheet, so they are resolved once
+DOCX_STYLES = {
+    "name": "Heading 1",
+    "heading": "Heading 2",
+    "bullet": "List Bullet"
+}
+
+# Sections in the order they are laid out
+SECTIONS = ("personal_info", "summary", "work_experience", "skills", "education", "projects")
+
+# Display limits: entries beyond these are left out of the layout
+MAX_ACHIEVEMENTS = 3
+MAX_SKILLS = 8
+MAX_PROJECTS = 3
+MAX_TECHNOLOGIES = 5
+
+# Section headings never change, so their blocks are built once
+_HEADINGS = {
+    section: Block("heading", (("heading", title),))
+    for section, title in (("summary", "PROFESSIONAL SUMMARY"), ("work_experience", "WORK EXPERIENCE"),
+                           ("skills", "SKILLS"), ("education", "EDUCATION"), ("projects", "PROJECTS"))
+}
+
+
+# Per-process document bases, built on first use or by warm_documents()
+_pdf_stylesheet = None
+_docx_base = None
+
+
+def pdf_stylesheet():
+    """reportlab sample stylesheet, built once per process and shared read-only by every PDF"""
+    global _pdf_stylesheet
+    if getSampleStyleSheet is None:
+        raise ImportError("reportlab is not installed")
+    if _pdf_stylesheet is None:
+        _pdf_stylesheet = getSampleStyleSheet()
+    return _pdf_stylesheet
+
+
+def new_docx():
+    """Blank DOCX document cloned from a base template parsed once per process
+
+    Rendering only reads the styles part, which is most of the template, so
+    clones share it instead of copying it.
+    """
+    template, _ = _docx_template()
+    styles = template.styles.element
+    return copy.deepcopy(template, {id(styles): styles})
+
+
+def docx_styles():
+    """DOCX_STYLES resolved against the base template; valid in every clone of it"""
+    return _docx_template()[1]
+
+
+def _docx_template():
+    global _docx_base
+    if docx is None:
+        raise ImportError("python-docx is not installed")
+    if _docx_base is None:
+        template = docx.Document()
+        _docx_base = (template, {style: template.styles[name] for style, name in DOCX_STYLES.items()})
+    return _docx_base
+
+
+def warm_documents() -> None:
+    """Build the PDF stylesheet and DOCX template ahead of the first export, where installed"""
+    for build in (pdf_stylesheet, _docx_template):
+        try:
+            build()
+        except ImportError:
+            pass
+
+
+class ResumeRenderer:
+    """Renders resume data through a block layout shared by every output format"""
+
+    _plans: Dict[str, Dict[str, Callable[[Block], str]]] = {}
+
+    def __init__(self, template: str = "classic"):
+        """Initialize the renderer for a text template"""
+        if template not in TEMPLATES:
+            raise ValueError(f"Unknown resume template: {template}")
+        self.template = template
+        self.separator = TEMPLATES[template]["separator"]
+        if template not in self._plans:
+            self._plans[template] = self._compile_plan(TEMPLATES[template])
+        self.plan = self._plans[template]
+
+    def build_blocks(self, resume_data: Dict[str, Any]) -> List[Block]:
+        """Lay resume data out as blocks, applying the per-section display limits"""
+        if not resume_data:
+            return []
+        return list(self._iter_blocks(resume_data))
+
+    def stream_text(self, blocks: Iterable[Block]) -> Iterator[str]:
+        """Yield the text rendering chunk by chunk"""
+        plan = self.plan
+        separator = ""
+        for block in blocks:
+            yield separator + plan[block.kind](block)
+            separator = self.separator
+
+    def render_text(self, resume_data: Dict[str, Any]) -> str:
+        """Render resume data as plain text"""
+        if not resume_data:
+            return ""
+        plan = self.plan
+        return self.separator.join([plan[block.kind](block) for block in self._iter_blocks(resume_data)])
+
+    def render_pdf(self, blocks: Iterable[Block]) -> bytes:
+        """Build a PDF from blocks (raises ImportError without reportlab)"""
+        styles = pdf_stylesheet()
+        story = []
+        for block in blocks:
+            if block.kind == "heading":
+                story.append(Paragraph(escape(block.lines[0][1]), styles[PDF_STYLES["heading"]]))
+                continue
+            for style, text in block.lines:
+                bullet = "•" if style == "bullet" else None
+                story.append(Paragraph(escape(text), styles[PDF_STYLES[style]], bulletText=bullet))
+            story.append(Spacer(1, 12))
+
+        buffer = BytesIO()
+        SimpleDocTemplate(buffer, pagesize=letter).build(story)
+        return buffer.getvalue()
+
+    def render_docx(self, blocks: Iterable[Block]) -> bytes:
+        """Build a DOCX document from blocks (raises ImportError without python-docx)"""
+        doc = new_docx()
+        styles = docx_styles()
+        for block in blocks:
+            if block.kind == "heading":
+                doc.add_paragraph(block.lines[0][1], styles["heading"])
+                continue
+            for style, text in block.lines:
+                if style in styles:
+                    doc.add_paragraph(text, styles[style])
+                else:
+                    run = doc.add_paragraph().add_run(text)
+                    run.bold = style == "title"
+                    run.italic = style == "meta"
+
+        buffer = BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+
+    def section_blocks(self, section: str, content: Any) -> List[Block]:
+        """Lay out one section of resume data: its heading, if it has one, then its entries"""
+        if not content:
+            return []
+        return list(self._iter_section(section, content))
+
+    def heading_block(self, section: str) -> Block:
+        """The heading block that opens a section"""
+        return _HEADINGS[section]
+
+    def entry_block(self, section: str, item: Dict[str, Any]) -> Optional[Block]:
+        """The entry block of one work experience, education or project item; None when it shows nothing"""
+        lines = self._ENTRY_LINES[section](self, item)
+        return Block("entry", tuple(lines)) if lines else None
+
+    def block_height(self, block: Optional[Block]) -> int:
+        """Number of lines a block takes in the text rendering; 0 for no block"""
+        if block is None:
+            return 0
+        return self.plan[block.kind](block).count("\n") + 1
+
+    def _compile_plan(self, template: Dict[str, str]) -> Dict[str, Callable[[Block], str]]:
+        """Turn template settings into one text formatter per block kind"""
+        separator = template["separator"]
+        prefixes = dict.fromkeys(("name", "contact", "title", "meta", "text"), "")
+        prefixes["bullet"] = template["bullet"]
+        header_rule = separator + template["rule"]
+        underline = template["underline"]
+
+        def entry(block: Block) -> str:
+            return "\n".join([prefixes[style] + text for style, text in block.lines])
+
+        def header(block: Block) -> str:
+            return entry(block) + header_rule
+
+        def heading(block: Block) -> str:
+            title = block.lines[0][1]
+            return title + separator + underline * len(title)
+
+        return {"header": header, "heading": heading, "entry": entry}
+
+    def _iter_blocks(self, resume_data: Dict[str, Any]) -> Iterator[Block]:
+        for section in SECTIONS:
+            content = resume_data.get(section)
+            if content:
+                yield from self._iter_section(section, content)
+
+    def _iter_section(self, section: str, content: Any) -> Iterator[Block]:
+        # Personal Information
+        if section == "personal_info":
+            header = []
+            if content.get("name"):
+                header.append(("name", content["name"].upper()))
+
+            contact_info = [content[field] for field in ["email", "phone", "address", "linkedin"]
+                            if content.get(field)]
+            if contact_info:
+                header.append(("contact", " | ".join(contact_info)))
+
+            if header:
+                yield Block("header", tuple(header))
+            return
+
+        yield self.heading_block(section)
+
+        # Summary
+        if section == "summary":
+            yield Block("entry", (("text", content),))
+
+        # Skills
+        elif section == "skills":
+            for skill_type, skill_list in content.items():
+                if skill_list:
+                    skill_type_formatted = skill_type.replace("_", " ").title()
+                    skills_text = ", ".join(skill_list[:MAX_SKILLS])
+                    yield Block("entry", (("text", f"{skill_type_formatted}: {skills_text}"),))
+
+        # Work Experience, Education and Projects
+        else:
+            if section == "projects":
+                content = content[:MAX_PROJECTS]
+            for item in content:
+                block = self.entry_block(section, item)
+                if block:
+                    yield block
+
+    def _experience_lines(self, exp: Dict[str, Any]) -> List[Tuple[str, str]]:
+        lines = []
+
+        # Position and Company
+        position_line = exp.get("position") or ""
+        if exp.get("company"):
+            position_line += f" | {exp['company']}"
+        if position_line:
+            lines.append(("title", position_line))
+
+        # Dates
+        if exp.get("start_date"):
+            lines.append(("meta", f"{exp['start_date']} - {exp.get('end_date') or 'Present'}"))
+
+        # Description
+        if exp.get("description"):
+            lines.append(("bullet", exp["description"]))
+
+        # Achievements
+        for achievement in exp.get("achievements", [])[:MAX_ACHIEVEMENTS]:
+            lines.append(("bullet", achievement))
+        return lines
+
+    def _education_lines(self, edu: Dict[str, Any]) -> List[Tuple[str, str]]:
+        lines = []
+
+        # Degree and Field
+        degree_line = edu.get("degree") or ""
+        if edu.get("field"):
+            degree_line += f" in {edu['field']}"
+        if degree_line:
+            lines.append(("title", degree_line))
+
+        # Institution and Date
+        inst_line = edu.get("institution") or ""
+        if edu.get("graduation_date"):
+            inst_line += f" | {edu['graduation_date']}"
+        if inst_line:
+            lines.append(("meta", inst_line))
+
+        # GPA (if notable)
+        if edu.get("gpa") and edu["gpa"] >= 3.5:
+            lines.append(("meta", f"GPA: {edu['gpa']}"))
+        return lines
+
+    def _project_lines(self, project: Dict[str, Any]) -> List[Tuple[str, str]]:
+        lines = []
+
+        if project.get("name"):
+            lines.append(("title", project["name"]))
+
+        if project.get("description"):
+            lines.append(("bullet", project["description"]))
+
+        if project.get("technologies"):
+            lines.append(("meta", "Technologies: " + ", ".join(project["technologies"][:MAX_TECHNOLOGIES])))
+
+        if project.get("url"):
+            lines.append(("meta", f"URL: {project['url']}"))
+        return lines
+
+    _ENTRY_LINES = {
+        "work_experience": _experience_lines,
+        "education": _education_lines,
+        "projects": _project_lines
+    }
@@ -0,0 +1,154 @@
+"""
+Session Store - Keeps each user's working state (profile, job analysis) apart
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterator, NamedTuple, Optional, Tuple
+
+from .profile_codec import get_codec
+
+
+class _SessionEntry(NamedTuple):
+    expires_at: float
+    version: Optional[str]   # Matches the shared row it was read from or written as; None when not shared
+    value: Any
+
+
+class SessionStore:
+    """Session-keyed state: an in-memory LRU with TTL, optionally shared through SQLite
+
+    Values are stored under (session ID, name) and expire ttl seconds after
+    they were last set. Without shared_path the state lives in this process
+    only, which suits a single-process server. With it, every set is also
+    written to a SQLite file that all worker processes open, so a user's
+    next request may be served by any worker: the memory tier then only
+    saves decoding, and a read trusts it only while the version it holds
+    still matches the shared row (one primary-key lookup). Expired rows are
+    purged every purge_interval seconds. Stored values are shared between
+    callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl: float = 3600, shared_path: Optional[str] = None,
+                 purge_interval: float = 300):
+        """Initialize an empty store, creating the shared file when one is given"""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.shared_path = shared_path
+        self.purge_interval = purge_interval
+        self.codec = get_codec()
+        self._entries: "OrderedDict[Tuple[str, str], _SessionEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_purge = time.time()
+        self._local = threading.local()
+        if shared_path:
+            self._init_shared()
+
+    def get(self, session_id: Optional[str], name: str) -> Optional[Any]:
+        """Return a session's value for name, or None when it was never set or has expired"""
+        if not session_id:
+            return None
+        key = (session_id, name)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if not self.shared_path:
+            return entry.value if entry else None
+
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT version, expires_at, value FROM session_state WHERE session_id = ? AND name = ?", key
+            ).fetchone()
+        if row is None or row[1] <= now:
+            self._forget(key)
+            return None
+        if entry is not None and entry.version == row[0]:
+            return entry.value
+
+        # Set by another worker since this one last saw it
+        entry = _SessionEntry(row[1], row[0], self.codec.decode(row[2]))
+        self._remember(key, entry)
+        return entry.value
+
+    def set(self, session_id: Optional[str], name: str, value: Any) -> None:
+        """Store a session's value for name, restarting its TTL; ignored without a session ID"""
+        if not session_id:
+            return
+        key = (session_id, name)
+        now = time.time()
+        entry = _SessionEntry(now + self.ttl, uuid.uuid4().hex if self.shared_path else None, value)
+        if self.shared_path:
+            with self._connect() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO session_state (session_id, name, value, version, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (session_id, name, self.codec.encode(value), entry.version, entry.expires_at)
+                )
+                if now - self._last_purge >= self.purge_interval:
+                    self._last_purge = now
+                    db.execute("DELETE FROM session_state WHERE expires_at <= ?", (now,))
+        self._remember(key, entry)
+
+    def clear(self, session_id: str) -> None:
+        """Drop everything stored for a session"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == session_id]:
+                del self._entries[key]
+        if self.shared_path:
+            with self._connect() as db:
+                db.execute("DELETE FROM session_state WHERE session_id = ?", (session_id,))
+
+    def _remember(self, key: Tuple[str, str], entry: _SessionEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _forget(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """The shared store, for one transaction
+
+        Sessions are read on most requests, so each thread keeps its
+        connection open. One inherited across a fork is never used: the
+        child opens its own.
+        """
+        pid, connection = getattr(self._local, "connection", (None, None))
+        if pid != os.getpid():
+            connection = sqlite3.connect(self.shared_path, timeout=10)
+            self._local.connection = (os.getpid(), connection)
+        with connection:
+            yield connection
+
+    def _init_shared(self) -> None:
+        directory = os.path.dirname(self.shared_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # A connection of its own, closed again: the store may be created before the server forks
+        connection = sqlite3.connect(self.shared_path, timeout=10)
+        try:
+            with connection as db:
+                # WAL lets workers read sessions while another one is writing
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS session_state ("
+                    "session_id TEXT, name TEXT, value BLOB, version TEXT, expires_at REAL, "
+                    "PRIMARY KEY (session_id, name))"
+                )
+                db.execute("CREATE INDEX IF NOT EXISTS session_state_expires_at ON session_state (expires_at)")
+        finally:
+            connection.close()
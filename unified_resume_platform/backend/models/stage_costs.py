@@ -0,0 +1,137 @@
+"""
+Stage Costs - Running estimates of what request stages cost, for answering within a time budget
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+def parse_time_budget(value: Any) -> Optional[float]:
+    """A request's time_budget_ms as seconds, None when absent; ValueError unless a positive number"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not value > 0:
+        raise ValueError("time_budget_ms must be a positive number of milliseconds")
+    return value / 1000.0
+
+
+class StageCost:
+    """Estimated duration of one stage as fixed + rate * units of work
+
+    Each observation updates exponentially weighted averages of the units
+    and seconds seen, from which a least-squares line is refit, so the
+    estimate follows the machine's current speed and load. alpha is the
+    weight of the newest observation. Until min_samples observations of
+    different sizes are in, only the fixed part is refit and the prior
+    rate is kept.
+    """
+
+    def __init__(self, name: str, fixed: float, rate: float, alpha: float = 0.1, min_samples: int = 5):
+        self.name = name
+        self.prior = (fixed, rate)
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.samples = 0
+        self._units = self._seconds = self._units_sq = self._units_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, units: float = 1) -> None:
+        with self._lock:
+            alpha = self.alpha if self.samples else 1.0
+            self._units += alpha * (units - self._units)
+            self._seconds += alpha * (seconds - self._seconds)
+            self._units_sq += alpha * (units * units - self._units_sq)
+            self._units_seconds += alpha * (units * seconds - self._units_seconds)
+            self.samples += 1
+
+    def estimate(self, units: float = 1) -> float:
+        """Expected seconds for a piece of work of the given size"""
+        fixed, rate = self.line()
+        return fixed + rate * units
+
+    def line(self) -> Tuple[float, float]:
+        """The current (fixed seconds, seconds per unit)"""
+        with self._lock:
+            if not self.samples:
+                return self.prior
+            variance = self._units_sq - self._units * self._units
+            if self.samples < self.min_samples or variance <= 1e-9 * max(self._units_sq, 1.0):
+                rate = self.prior[1]
+            else:
+                rate = max((self._units_seconds - self._units * self._seconds) / variance, 0.0)
+            return max(self._seconds - rate * self._units, 0.0), rate
+
+    def metrics(self) -> Dict[str, Any]:
+        fixed, rate = self.line()
+        with self._lock:
+            return {
+                "samples": self.samples,
+                "fixed_ms": round(fixed * 1000, 3),
+                "per_unit_us": round(rate * 1e6, 4),
+                "avg_ms": round(self._seconds * 1000, 3) if self.samples else None
+            }
+
+
+class StageCosts:
+    """The cost estimates of one endpoint's stages, and how its time-budgeted requests were answered
+
+    priors maps each stage to its (fixed seconds, seconds per unit)
+    before anything has been observed. Outcomes are counted per mode:
+    "full", "cached", or a degraded mode such as "skills_only".
+    """
+
+    def __init__(self, priors: Dict[str, Tuple[float, float]], alpha: float = 0.1):
+        self.stages = {name: StageCost(name, fixed, rate, alpha) for name, (fixed, rate) in priors.items()}
+        self._lock = threading.Lock()
+        self.budgeted = 0
+        self.degraded = 0
+        self.overruns = 0
+        self.modes: Dict[str, int] = {}
+
+    def __getitem__(self, name: str) -> StageCost:
+        return self.stages[name]
+
+    def estimate(self, **units: float) -> float:
+        """Expected seconds for the named stages, each given its units of work"""
+        return sum(self.stages[name].estimate(count) for name, count in units.items())
+
+    def timed(self, name: str, units: float = 1) -> "_Timer":
+        """Context manager that observes how long its block takes as one run of the stage"""
+        return _Timer(self.stages[name], units)
+
+    def record(self, mode: str, degraded: bool, elapsed: float, budget: Optional[float]) -> None:
+        """Count how a request was answered; only time-budgeted requests are counted"""
+        if budget is None:
+            return
+        with self._lock:
+            self.budgeted += 1
+            self.degraded += degraded
+            self.overruns += elapsed > budget
+            self.modes[mode] = self.modes.get(mode, 0) + 1
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            outcomes = {
+                "budgeted": self.budgeted,
+                "degraded": self.degraded,
+                "degraded_rate": round(self.degraded / self.budgeted, 4) if self.budgeted else 0.0,
+                "overruns": self.overruns,
+                "modes": dict(self.modes)
+            }
+        outcomes["stages"] = {name: stage.metrics() for name, stage in self.stages.items()}
+        return outcomes
+
+
+class _Timer:
+    def __init__(self, stage: StageCost, units: float):
+        self.stage = stage
+        self.units = units
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.stage.observe(time.perf_counter() - self.started, self.units)
@@ -0,0 +1,56 @@
+"""
+Static Assets - Content fingerprints that let browsers cache static files for good
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class StaticAssets:
+    """Fingerprints of the files in a static folder, for cache-busting URLs
+
+    A file's fingerprint is a short hash of its contents. URLs that carry
+    it can be cached as immutable, since any edit to the file changes the
+    fingerprint and therefore the URL. Hashes are remembered per file and
+    only recomputed when its size or modification time changes.
+    """
+
+    def __init__(self, folder: str, length: int = 12):
+        self.folder = folder
+        self.length = length
+        self._hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def fingerprint(self, filename: str) -> Optional[str]:
+        """The fingerprint of a file under the folder, or None when there is no such file"""
+        path = os.path.realpath(os.path.join(self.folder, filename))
+        if not path.startswith(os.path.realpath(self.folder) + os.sep):
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(64 * 1024), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        fingerprint = digest.hexdigest()[:self.length]
+        with self._lock:
+            self._hashes[path] = (version, fingerprint)
+        return fingerprint
+
+    def read(self, filename: str) -> bytes:
+        with open(os.path.join(self.folder, filename), "rb") as f:
+            return f.read()
@@ -0,0 +1,24 @@
+"""Unified Resume Platform - WSGI entry point for production servers
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+gunicorn.conf.py preloads this module in the master process, so the app,
+its models and their warmed data are built once and shared copy-on-write
+by every forked worker.
+"""
+
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from app import create_app
+
+# ASYNC_OFFLOAD=1 moves CPU-bound request stages into the per-worker process
+# pool batches and exports use, of CPU_POOL_WORKERS processes (default: the
+# cores divided among the WEB_CONCURRENCY workers)
+app = create_app(config={
+    'ASYNC_OFFLOAD': os.environ.get('ASYNC_OFFLOAD') == '1',
+    'CPU_POOL_WORKERS': int(os.environ.get('CPU_POOL_WORKERS', 0)) or None
+})